@@ -60,6 +60,23 @@ class Settings(BaseSettings):
     MAX_TRAINING_HOURS: int = 24
     MAX_ITERATIONS: int = 5
     MAX_CONCURRENT_PROJECTS_PER_USER: int = 5
+    # Upper bound on the job status poll interval; lower it for fast feedback
+    MAX_POLL_INTERVAL_SECONDS: float = 60.0
+    
+    # Artifact Download Configuration
+    # Worker processes for signing download URLs; 0 signs in threads. Only
+    # worth enabling when credentials sign locally with a private key
+    SIGNED_URL_PROCESS_WORKERS: int = 0
+    
+    # Logging Configuration
+    # "api" writes training logs through the Cloud Logging client in production;
+    # "stdout" emits JSON lines for the platform logging agent to ingest
+    LOG_SINK: str = "api"
+    
+    # Provenance Configuration
+    # Hash preprocessing metadata with BLAKE3 (digests prefixed "bk3:") instead
+    # of SHA-256; requires the blake3 package
+    USE_BLAKE3_FOR_PROVENANCE: bool = False
     
     # Security Configuration
     DATA_RETENTION_DAYS: int = 90
@@ -157,7 +157,7 @@ class ProblemAnalyzer:
             result, gemini_confidence, adjusted_confidence
         )
         
-        return ProblemAnalysis(
+        return ProblemAnalysis.create(
             problem_type=ProblemType(result.get("problem_type", "unknown")),
             data_type=DataType(result.get("data_type", "unknown")),
             domain=result.get("domain", "General"),
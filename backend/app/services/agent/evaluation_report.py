@@ -5,7 +5,6 @@ This module generates comprehensive evaluation reports with plots,
 metrics, and recommendations, and stores them in GCS.
 """
 
-import json
 from datetime import datetime
 from typing import Dict, Any, Optional
 import numpy as np
@@ -15,7 +14,12 @@ from .evaluator import EvaluationResult
 from .types import ProblemType
 from .training_config import TrainingOutput
 from .plot_generator import ClassificationPlotGenerator, RegressionPlotGenerator
-from .report_formatter import MarkdownReportFormatter, HTMLReportFormatter, JSONReportFormatter
+from .report_formatter import (
+    MarkdownReportFormatter,
+    HTMLReportFormatter,
+    JSONReportFormatter,
+    _generate_report_timestamp,
+)
 
 logger = structlog.get_logger()
 
@@ -77,15 +81,16 @@ class EvaluationReportGenerator:
         elif problem_type in [ProblemType.REGRESSION, ProblemType.TIME_SERIES_FORECASTING]:
             plots = RegressionPlotGenerator.generate_plots(y_true, y_pred)
         
-        # Generate reports
+        # Generate reports (sharing one timestamp across formats)
+        generated_at = _generate_report_timestamp()
         markdown_report = MarkdownReportFormatter.format(
-            evaluation_result, training_output, problem_type, plots
+            evaluation_result, training_output, problem_type, plots, generated_at
         )
         html_report = HTMLReportFormatter.format(
-            evaluation_result, training_output, problem_type, plots
+            evaluation_result, training_output, problem_type, plots, generated_at
         )
         json_summary = JSONReportFormatter.format(
-            evaluation_result, training_output
+            evaluation_result, training_output, generated_at
         )
         
         # Store in GCS
@@ -135,7 +140,9 @@ class EvaluationReportGenerator:
             
             # Store JSON
             json_path = f"{base_path}/summary.json"
-            await self._upload_text(json_path, json.dumps(json_summary, indent=2))
+            await self._upload_bytes(
+                json_path, JSONReportFormatter.serialize(json_summary), "application/json"
+            )
             
             # Store plots
             for plot_name, plot_bytes in plots.items():
@@ -159,11 +166,11 @@ class EvaluationReportGenerator:
             blob = self.storage_client.bucket.blob(path)
             blob.upload_from_string(content)
     
-    async def _upload_bytes(self, path: str, content: bytes):
+    async def _upload_bytes(self, path: str, content: bytes, content_type: str = 'image/png'):
         """Upload bytes content to GCS."""
         if hasattr(self.storage_client, 'upload_bytes'):
             await self.storage_client.upload_bytes(path, content)
         else:
             # Fallback for sync client
             blob = self.storage_client.bucket.blob(path)
-            blob.upload_from_string(content, content_type='image/png')
+            blob.upload_from_string(content, content_type=content_type)
@@ -6,7 +6,8 @@ including metric calculation, baseline comparison, and acceptance threshold logi
 """
 
 import numpy as np
-from typing import Dict, Optional, List
+from functools import cached_property
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass, field
 import structlog
 
@@ -52,6 +53,11 @@ class EvaluationResult:
     reasoning: str
     recommendations: List[str] = field(default_factory=list)
     confidence: float = 1.0
+    
+    @cached_property
+    def sorted_metrics(self) -> List[Tuple[str, float]]:
+        """All metrics sorted by name, computed once and shared by report formatters."""
+        return sorted(self.all_metrics.items())
 
 
 class ModelEvaluator:
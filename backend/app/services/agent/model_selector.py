@@ -4,6 +4,7 @@ AI-powered model selection agent.
 Combines rule-based logic with Gemini AI for intelligent model selection.
 """
 import asyncio
+from dataclasses import replace
 from typing import Optional, Dict, Any
 import structlog
 
@@ -248,26 +249,28 @@ class ModelSelector:
         """
         if rule_based.architecture == ai_based.architecture:
             # Agreement - use AI with boosted confidence
-            merged = ai_based
-            merged.confidence = min(0.98, (rule_based.confidence + ai_based.confidence) / 1.5)
-            merged.reasoning = (
-                f"[Rule-based & AI Agreement] {ai_based.reasoning}\n\n"
-                f"Rule-based reasoning: {rule_based.reasoning}"
+            return replace(
+                ai_based,
+                confidence=min(0.98, (rule_based.confidence + ai_based.confidence) / 1.5),
+                reasoning=(
+                    f"[Rule-based & AI Agreement] {ai_based.reasoning}\n\n"
+                    f"Rule-based reasoning: {rule_based.reasoning}"
+                ),
+                alternatives=rule_based.alternatives,
             )
-            merged.alternatives = rule_based.alternatives
-            return merged
 
         else:
             # Disagreement - use rules but add AI as alternative
-            merged = rule_based
-            merged.alternatives.insert(0, ai_based)
-            merged.reasoning = (
-                f"[Rule-based Selection] {rule_based.reasoning}\n\n"
-                f"Alternative AI suggestion: {ai_based.architecture.value} "
-                f"(confidence: {ai_based.confidence:.2f})\n"
-                f"AI reasoning: {ai_based.reasoning}"
+            return replace(
+                rule_based,
+                alternatives=[ai_based, *rule_based.alternatives],
+                reasoning=(
+                    f"[Rule-based Selection] {rule_based.reasoning}\n\n"
+                    f"Alternative AI suggestion: {ai_based.architecture.value} "
+                    f"(confidence: {ai_based.confidence:.2f})\n"
+                    f"AI reasoning: {ai_based.reasoning}"
+                ),
             )
-            return merged
 
     def get_vertex_ai_config(
         self,
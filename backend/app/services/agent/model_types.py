@@ -58,7 +58,7 @@ class VertexAIProduct(str, Enum):
     MATCHING_ENGINE = "matching_engine"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HyperparameterConfig:
     """Hyperparameter configuration for a model."""
 
@@ -68,14 +68,15 @@ class HyperparameterConfig:
     max_iterations: int = 1000
     early_stopping_patience: int = 10
 
-    # Model-specific parameters
+    # Model-specific parameters (read-only mappings on recommendations returned
+    # by the rule engine, whose results are cached and shared)
     model_specific: Dict[str, Any] = field(default_factory=dict)
 
     # Search space for AutoML
     search_space: Optional[Dict[str, Any]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelRecommendation:
     """
     Complete model recommendation with architecture, hyperparameters,
@@ -114,8 +115,12 @@ class ModelRecommendation:
                 "batch_size": self.hyperparameters.batch_size,
                 "max_iterations": self.hyperparameters.max_iterations,
                 "early_stopping_patience": self.hyperparameters.early_stopping_patience,
-                "model_specific": self.hyperparameters.model_specific,
-                "search_space": self.hyperparameters.search_space,
+                "model_specific": dict(self.hyperparameters.model_specific),
+                "search_space": (
+                    dict(self.hyperparameters.search_space)
+                    if self.hyperparameters.search_space is not None
+                    else None
+                ),
             },
             "alternatives": [alt.to_dict() for alt in self.alternatives] if self.alternatives else [],
             "confidence": self.confidence,
@@ -18,9 +18,9 @@ from app.services.agent.model_selector import ModelSelector
 from app.services.agent.training_manager import TrainingManager
 from app.services.agent.evaluator import ModelEvaluator
 from app.services.agent.gemini_client import GeminiClient
-from app.services.cloud.vertex_client import VertexAIClient
+from app.services.cloud.vertex_client import VertexAIClient, get_cached_vertex_client
 from app.services.cloud.storage_manager import StorageManager
-from app.services.agent.types import ProblemAnalysis, DataType
+from app.services.agent.types import ProblemAnalysis, ProblemType, DataType
 from app.services.agent.model_types import DatasetProfile
 from app.schemas.project import Project, ProjectStatus
 from app.schemas.audit import AuditEntry, AuditEntryCreate
@@ -28,6 +28,30 @@ from app.core.config import settings
 
 logger = structlog.get_logger()
 
+# Default acceptance thresholds and primary metric by problem type
+_CLASSIFICATION_THRESHOLDS = {
+    "roc_auc": 0.70,
+    "f1": 0.60,
+    "precision": 0.50,
+    "recall": 0.50
+}
+_DEFAULT_THRESHOLDS = {
+    ProblemType.CLASSIFICATION: _CLASSIFICATION_THRESHOLDS,
+    ProblemType.TEXT_CLASSIFICATION: _CLASSIFICATION_THRESHOLDS,
+    ProblemType.REGRESSION: {
+        "rmse": 0.9,  # Will be multiplied by baseline
+        "r2": 0.1,
+        "mae": 0.9
+    },
+}
+_FALLBACK_THRESHOLDS = {"accuracy": 0.70}
+
+_PRIMARY_METRICS = {
+    ProblemType.CLASSIFICATION: "roc_auc",
+    ProblemType.TEXT_CLASSIFICATION: "roc_auc",
+    ProblemType.REGRESSION: "rmse",
+}
+
 
 class PipelineStage(str):
     """Pipeline execution stages."""
@@ -113,7 +137,7 @@ class AgentOrchestrator:
             storage_bucket: GCS bucket for storage
         """
         self.gemini_client = gemini_client or GeminiClient()
-        self.vertex_client = vertex_client or VertexAIClient()
+        self.vertex_client = vertex_client or get_cached_vertex_client()
         self.storage_bucket = storage_bucket or settings.GCS_BUCKET_NAME
         
         # Initialize agent components
@@ -404,7 +428,7 @@ class AgentOrchestrator:
         training_config = TrainingConfig(
             architecture=model_config.architecture.value,
             vertex_ai_type=model_config.training_strategy.value,
-            hyperparameters=model_config.hyperparameters.model_specific,
+            hyperparameters=dict(model_config.hyperparameters.model_specific),
             split_config=SplitConfig(
                 train_ratio=0.8,
                 val_ratio=0.1,
@@ -425,7 +449,8 @@ class AgentOrchestrator:
             test_data_uri=processing_result["gcs_paths"]["test"],
             target_column=target_column,
             problem_analysis=analysis,
-            preprocessing_metadata=processing_result["metadata"]
+            preprocessing_metadata=processing_result["metadata"],
+            automl_csv_uri=processing_result["gcs_paths"].get("automl_csv")
         )
         
         state.training_output = training_output
@@ -602,34 +627,11 @@ class AgentOrchestrator:
     
     def _get_default_thresholds(self, analysis: ProblemAnalysis) -> Dict[str, float]:
         """Get default acceptance thresholds based on problem type."""
-        from app.services.agent.types import ProblemType
-        
-        if analysis.problem_type in [ProblemType.CLASSIFICATION, ProblemType.TEXT_CLASSIFICATION]:
-            return {
-                "roc_auc": 0.70,
-                "f1": 0.60,
-                "precision": 0.50,
-                "recall": 0.50
-            }
-        elif analysis.problem_type == ProblemType.REGRESSION:
-            return {
-                "rmse": 0.9,  # Will be multiplied by baseline
-                "r2": 0.1,
-                "mae": 0.9
-            }
-        else:
-            return {"accuracy": 0.70}
+        return dict(_DEFAULT_THRESHOLDS.get(analysis.problem_type, _FALLBACK_THRESHOLDS))
     
     def _get_primary_metric(self, analysis: ProblemAnalysis) -> str:
         """Get primary metric based on problem type."""
-        from app.services.agent.types import ProblemType
-        
-        if analysis.problem_type in [ProblemType.CLASSIFICATION, ProblemType.TEXT_CLASSIFICATION]:
-            return "roc_auc"
-        elif analysis.problem_type == ProblemType.REGRESSION:
-            return "rmse"
-        else:
-            return "accuracy"
+        return _PRIMARY_METRICS.get(analysis.problem_type, "accuracy")
     
     async def _transition_stage(
         self,
@@ -6,6 +6,7 @@ results, combining AI insights with structured reasoning.
 """
 
 import logging
+from itertools import islice
 from typing import Any, Dict
 
 from app.services.agent.confidence_scorer import ConfidenceScorer
@@ -75,7 +76,7 @@ class ReasoningGenerator:
         # Add metrics recommendation
         metrics = result.get("suggested_metrics", [])
         if metrics:
-            metrics_str = ", ".join(metrics[:3])  # Show top 3
+            metrics_str = ", ".join(islice(metrics, 3))  # Show top 3
             reasoning_parts.append(
                 f"Recommended evaluation metrics include: {metrics_str}."
             )
@@ -96,7 +97,7 @@ class ReasoningGenerator:
         insights = result.get("additional_insights", {})
         if insights:
             insight_items = [
-                f"{k}: {v}" for k, v in list(insights.items())[:2]
+                f"{k}: {v}" for k, v in islice(insights.items(), 2)
             ]
             if insight_items:
                 reasoning_parts.append(
@@ -5,17 +5,98 @@ Formats evaluation results into markdown, HTML, and JSON formats.
 """
 
 import base64
+import functools
 import json
+from itertools import chain
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import numpy as np
 import structlog
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .evaluator import EvaluationResult, EvaluationDecision
 from .types import ProblemType
 from .training_config import TrainingOutput
+from .training_utils import NumpyEncoder
 
 logger = structlog.get_logger()
 
+# Metrics where a lower value indicates a better model
+_LOWER_IS_BETTER = frozenset({'rmse', 'mae', 'mse'})
+
+# Check status labels, indexed by bool(passed)
+_MD_STATUS = ("✗ Fail", "✓ Pass")
+_HTML_STATUS_CLASS = ("fail", "pass")
+_HTML_STATUS_TEXT = ("✗ Fail", "✓ Pass")
+
+# Markdown table row templates
+_MD_METRIC_ROW_TMPL = "| {} | {:.4f} |"
+_MD_THRESHOLD_ROW_TMPL = "| {} | {} | {:.4f} | {:.4f} |"
+_MD_BASELINE_ROW_TMPL = "| {} | {:.4f} | {:.4f} | {:+.1f}% |"
+_MD_SANITY_ROW_TMPL = "| {} | {} |"
+
+# HTML table row templates
+_METRIC_ROW_TMPL = '<tr><td>{}</td><td>{:.4f}</td></tr>'
+_THRESHOLD_ROW_TMPL = '<tr><td>{}</td><td class="{}">{}</td><td>{:.4f}</td><td>{:.4f}</td></tr>'
+_PLOT_TMPL = (
+    '<div class="plot"><h3>{}</h3>'
+    '<img src="data:image/png;base64,{}" style="max-width: 100%; height: auto;"></div>'
+)
+
+
+# HTML document styles and page shell
+_HTML_STYLES = """<style>
+        body { font-family: Arial, sans-serif; margin: 40px; background-color: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        h1 { color: #333; border-bottom: 3px solid #007bff; padding-bottom: 10px; }
+        h2 { color: #555; margin-top: 30px; border-bottom: 2px solid #ddd; padding-bottom: 8px; }
+        .decision { padding: 20px; border-radius: 8px; color: white; font-size: 24px; font-weight: bold; text-align: center; margin: 20px 0; }
+        .metric-box { display: inline-block; padding: 15px 25px; margin: 10px; background-color: #f8f9fa; border-radius: 5px; border-left: 4px solid #007bff; }
+        .metric-label { font-size: 14px; color: #666; }
+        .metric-value { font-size: 28px; font-weight: bold; color: #333; }
+        table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background-color: #007bff; color: white; }
+        tr:hover { background-color: #f5f5f5; }
+        .pass { color: #28a745; font-weight: bold; }
+        .fail { color: #dc3545; font-weight: bold; }
+        .plot { margin: 20px 0; text-align: center; }
+        .recommendation { background-color: #fff3cd; border-left: 4px solid #ffc107; padding: 15px; margin: 10px 0; border-radius: 4px; }
+        .reasoning { background-color: #f8f9fa; padding: 20px; border-radius: 5px; white-space: pre-wrap; font-family: monospace; }
+        .info { color: #666; font-size: 14px; }
+    </style>"""
+
+_HTML_SHELL = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Model Evaluation Report</title>
+    {styles}
+</head>
+<body>
+    <div class="container">
+        {body}
+    </div>
+</body>
+</html>"""
+
+# Separator that keeps body sections aligned inside the container div
+_HTML_SECTION_SEP = "\n        "
+
+
+def _generate_report_timestamp() -> str:
+    """Generate the UTC ISO-8601 timestamp stamped on reports."""
+    return datetime.utcnow().isoformat() + "Z"
+
+
+@functools.lru_cache(maxsize=128)
+def _prettify_plot_name(name: str) -> str:
+    """Turn a plot key such as ``roc_curve`` into a display title."""
+    return name.replace("_", " ").title()
+
 
 class MarkdownReportFormatter:
     """Format evaluation results as markdown."""
@@ -25,180 +106,168 @@ class MarkdownReportFormatter:
         evaluation_result: EvaluationResult,
         training_output: TrainingOutput,
         problem_type: ProblemType,
-        plots: Dict[str, bytes]
+        plots: Dict[str, bytes],
+        generated_at: Optional[str] = None
     ) -> str:
         """Generate markdown report."""
-        lines = []
-        
-        # Header
-        lines.extend(MarkdownReportFormatter._format_header(
-            evaluation_result, training_output, problem_type
-        ))
-        
-        # Metrics
-        lines.extend(MarkdownReportFormatter._format_metrics(evaluation_result))
-        
-        # Threshold checks
-        lines.extend(MarkdownReportFormatter._format_threshold_checks(
-            evaluation_result, training_output
-        ))
+        if generated_at is None:
+            generated_at = _generate_report_timestamp()
         
-        # Baseline comparison
-        lines.extend(MarkdownReportFormatter._format_baseline_comparison(evaluation_result))
+        sections = [
+            MarkdownReportFormatter._format_header(
+                evaluation_result, training_output, problem_type, generated_at
+            ),
+            MarkdownReportFormatter._format_metrics(evaluation_result),
+            MarkdownReportFormatter._format_threshold_checks(evaluation_result, training_output),
+            MarkdownReportFormatter._format_baseline_comparison(evaluation_result),
+        ]
         
         # Sanity checks
         if evaluation_result.sanity_checks:
-            lines.extend(MarkdownReportFormatter._format_sanity_checks(evaluation_result))
+            sections.append(MarkdownReportFormatter._format_sanity_checks(evaluation_result))
         
-        # Reasoning and recommendations
-        lines.extend(MarkdownReportFormatter._format_reasoning(evaluation_result))
-        lines.extend(MarkdownReportFormatter._format_recommendations(evaluation_result))
-        
-        # Training details
-        lines.extend(MarkdownReportFormatter._format_training_details(training_output))
+        # Reasoning, recommendations and training details
+        sections.append(MarkdownReportFormatter._format_reasoning(evaluation_result))
+        sections.append(MarkdownReportFormatter._format_recommendations(evaluation_result))
+        sections.append(MarkdownReportFormatter._format_training_details(training_output))
         
         # Plots
         if plots:
-            lines.extend(MarkdownReportFormatter._format_plots_section(plots))
+            sections.append(MarkdownReportFormatter._format_plots_section(plots))
         
-        return "\n".join(lines)
+        return "\n".join(chain.from_iterable(sections))
     
     @staticmethod
-    def _format_header(result, training_output, problem_type):
+    def _format_header(result, training_output, problem_type, generated_at):
         """Format report header."""
         decision_emoji = "✅" if result.decision == EvaluationDecision.ACCEPT else "❌"
-        return [
-            "# Model Evaluation Report",
-            "",
-            f"**Generated:** {datetime.utcnow().isoformat()}Z",
-            f"**Problem Type:** {problem_type.value}",
-            f"**Architecture:** {training_output.strategy_config.architecture}",
-            "",
-            f"## {decision_emoji} Decision: {result.decision.value.upper()}",
-            "",
-        ]
+        yield "# Model Evaluation Report"
+        yield ""
+        yield f"**Generated:** {generated_at}"
+        yield f"**Problem Type:** {problem_type.value}"
+        yield f"**Architecture:** {training_output.strategy_config.architecture}"
+        yield ""
+        yield f"## {decision_emoji} Decision: {result.decision.value.upper()}"
+        yield ""
     
     @staticmethod
     def _format_metrics(result):
         """Format metrics section."""
-        lines = [
-            "## Primary Metric",
-            "",
-            f"**{result.primary_metric_name}:** {result.primary_metric_value:.4f}",
-            "",
-            "## All Metrics",
-            "",
-            "| Metric | Value |",
-            "|--------|-------|",
-        ]
-        for metric_name, value in sorted(result.all_metrics.items()):
-            lines.append(f"| {metric_name} | {value:.4f} |")
-        lines.append("")
-        return lines
+        yield "## Primary Metric"
+        yield ""
+        yield f"**{result.primary_metric_name}:** {result.primary_metric_value:.4f}"
+        yield ""
+        yield "## All Metrics"
+        yield ""
+        yield "| Metric | Value |"
+        yield "|--------|-------|"
+        for metric_name, value in result.sorted_metrics:
+            yield _MD_METRIC_ROW_TMPL.format(metric_name, value)
+        yield ""
     
     @staticmethod
     def _format_threshold_checks(result, training_output):
         """Format threshold checks section."""
-        lines = [
-            "## Threshold Checks",
-            "",
-            "| Metric | Status | Value | Threshold |",
-            "|--------|--------|-------|-----------|",
-        ]
+        yield "## Threshold Checks"
+        yield ""
+        yield "| Metric | Status | Value | Threshold |"
+        yield "|--------|--------|-------|-----------|"
+        all_metrics = result.all_metrics
+        thresholds = training_output.strategy_config.acceptance_thresholds
         for metric_name, passed in result.threshold_checks.items():
-            status = "✓ Pass" if passed else "✗ Fail"
-            value = result.all_metrics.get(metric_name, 0.0)
-            threshold = training_output.strategy_config.acceptance_thresholds.get(metric_name, 0.0)
-            lines.append(f"| {metric_name} | {status} | {value:.4f} | {threshold:.4f} |")
-        lines.append("")
-        return lines
+            status = _MD_STATUS[bool(passed)]
+            value = all_metrics.get(metric_name, 0.0)
+            threshold = thresholds.get(metric_name, 0.0)
+            yield _MD_THRESHOLD_ROW_TMPL.format(metric_name, status, value, threshold)
+        yield ""
     
     @staticmethod
     def _format_baseline_comparison(result):
         """Format baseline comparison section."""
-        lines = [
-            "## Baseline Comparison",
-            "",
-            "| Metric | Model | Baseline | Improvement |",
-            "|--------|-------|----------|-------------|",
+        yield "## Baseline Comparison"
+        yield ""
+        yield "| Metric | Model | Baseline | Improvement |"
+        yield "|--------|-------|----------|-------------|"
+        all_metrics = result.all_metrics
+        baselines = result.baseline_metrics
+        rows = [
+            (metric_name, all_metrics[metric_name], baseline_info.baseline_value)
+            for metric_name, baseline_info in baselines.items()
+            if metric_name in all_metrics
         ]
-        for metric_name, baseline_info in result.baseline_metrics.items():
-            if metric_name in result.all_metrics:
-                model_value = result.all_metrics[metric_name]
-                baseline_value = baseline_info.baseline_value
-                
-                if metric_name in ['rmse', 'mae', 'mse']:
-                    improvement = ((baseline_value - model_value) / baseline_value) * 100
-                else:
-                    improvement = ((model_value - baseline_value) / baseline_value) * 100 if baseline_value > 0 else 0
-                
-                lines.append(f"| {metric_name} | {model_value:.4f} | {baseline_value:.4f} | {improvement:+.1f}% |")
-        lines.append("")
-        return lines
+        if rows:
+            names, model_values, baseline_values = zip(*rows)
+            model_vals = np.asarray(model_values, dtype=float)
+            base_vals = np.asarray(baseline_values, dtype=float)
+            lower_is_better = np.fromiter(
+                (name in _LOWER_IS_BETTER for name in names), dtype=bool, count=len(names)
+            )
+            # A zero baseline for an error metric renders as -inf% (nan% when
+            # the model also scores zero) rather than aborting the report
+            with np.errstate(divide="ignore", invalid="ignore"):
+                improvements = np.where(
+                    lower_is_better,
+                    (base_vals - model_vals) / base_vals,
+                    np.where(base_vals > 0, (model_vals - base_vals) / base_vals, 0.0)
+                ) * 100
+            
+            for (metric_name, model_value, baseline_value), improvement in zip(rows, improvements):
+                yield _MD_BASELINE_ROW_TMPL.format(metric_name, model_value, baseline_value, improvement)
+        yield ""
     
     @staticmethod
     def _format_sanity_checks(result):
         """Format sanity checks section."""
-        lines = [
-            "## Sanity Checks",
-            "",
-            "| Check | Status |",
-            "|-------|--------|",
-        ]
+        yield "## Sanity Checks"
+        yield ""
+        yield "| Check | Status |"
+        yield "|-------|--------|"
         for check_name, passed in result.sanity_checks.items():
-            status = "✓ Pass" if passed else "✗ Fail"
-            lines.append(f"| {check_name} | {status} |")
-        lines.append("")
-        return lines
+            status = _MD_STATUS[bool(passed)]
+            yield _MD_SANITY_ROW_TMPL.format(check_name, status)
+        yield ""
     
     @staticmethod
     def _format_reasoning(result):
         """Format reasoning section."""
-        return [
-            "## Detailed Reasoning",
-            "",
-            "```",
-            result.reasoning,
-            "```",
-            "",
-        ]
+        yield "## Detailed Reasoning"
+        yield ""
+        yield "```"
+        yield result.reasoning
+        yield "```"
+        yield ""
     
     @staticmethod
     def _format_recommendations(result):
         """Format recommendations section."""
         if not result.recommendations:
-            return []
+            return
         
-        lines = ["## Recommendations", ""]
+        yield "## Recommendations"
+        yield ""
         for i, rec in enumerate(result.recommendations, 1):
-            lines.append(f"{i}. {rec}")
-        lines.append("")
-        return lines
+            yield f"{i}. {rec}"
+        yield ""
     
     @staticmethod
     def _format_training_details(training_output):
         """Format training details section."""
-        return [
-            "## Training Details",
-            "",
-            f"**Duration:** {training_output.training_duration_seconds:.1f} seconds",
-            f"**Random Seed:** {training_output.random_seed}",
-            f"**Job ID:** {training_output.job_id}",
-            "",
-        ]
+        yield "## Training Details"
+        yield ""
+        yield f"**Duration:** {training_output.training_duration_seconds:.1f} seconds"
+        yield f"**Random Seed:** {training_output.random_seed}"
+        yield f"**Job ID:** {training_output.job_id}"
+        yield ""
     
     @staticmethod
     def _format_plots_section(plots):
         """Format plots section."""
-        lines = [
-            "## Visualizations",
-            "",
-            "See accompanying plot files:",
-        ]
+        yield "## Visualizations"
+        yield ""
+        yield "See accompanying plot files:"
         for plot_name in plots.keys():
-            lines.append(f"- {plot_name}.png")
-        lines.append("")
-        return lines
+            yield f"- {plot_name}.png"
+        yield ""
 
 
 class HTMLReportFormatter:
@@ -209,21 +278,20 @@ class HTMLReportFormatter:
         evaluation_result: EvaluationResult,
         training_output: TrainingOutput,
         problem_type: ProblemType,
-        plots: Dict[str, bytes]
+        plots: Dict[str, bytes],
+        generated_at: Optional[str] = None
     ) -> str:
         """Generate HTML report."""
-        # Convert plots to base64
-        plot_html = {}
-        for plot_name, plot_bytes in plots.items():
-            b64 = base64.b64encode(plot_bytes).decode('utf-8')
-            plot_html[plot_name] = f'<img src="data:image/png;base64,{b64}" style="max-width: 100%; height: auto;">'
+        if generated_at is None:
+            generated_at = _generate_report_timestamp()
         
         decision_color = "#28a745" if evaluation_result.decision == EvaluationDecision.ACCEPT else "#dc3545"
         decision_emoji = "✅" if evaluation_result.decision == EvaluationDecision.ACCEPT else "❌"
         
         # Build HTML sections
         header = HTMLReportFormatter._build_header(
-            evaluation_result, training_output, problem_type, decision_color, decision_emoji
+            evaluation_result, training_output, problem_type, decision_color, decision_emoji,
+            generated_at
         )
         metrics_section = HTMLReportFormatter._build_metrics_section(evaluation_result)
         thresholds_section = HTMLReportFormatter._build_thresholds_section(
@@ -231,57 +299,26 @@ class HTMLReportFormatter:
         )
         reasoning_section = HTMLReportFormatter._build_reasoning_section(evaluation_result)
         recommendations_section = HTMLReportFormatter._build_recommendations_section(evaluation_result)
-        plots_section = HTMLReportFormatter._build_plots_section(plot_html)
+        plots_section = HTMLReportFormatter._build_plots_section(plots) if plots else ""
         training_section = HTMLReportFormatter._build_training_section(training_output)
         
-        return f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Model Evaluation Report</title>
-    {HTMLReportFormatter._get_styles()}
-</head>
-<body>
-    <div class="container">
-        {header}
-        {metrics_section}
-        {thresholds_section}
-        {reasoning_section}
-        {recommendations_section}
-        {plots_section}
-        {training_section}
-    </div>
-</body>
-</html>"""
-    
-    @staticmethod
-    def _get_styles():
-        """Get CSS styles."""
-        return """<style>
-        body { font-family: Arial, sans-serif; margin: 40px; background-color: #f5f5f5; }
-        .container { max-width: 1200px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        h1 { color: #333; border-bottom: 3px solid #007bff; padding-bottom: 10px; }
-        h2 { color: #555; margin-top: 30px; border-bottom: 2px solid #ddd; padding-bottom: 8px; }
-        .decision { padding: 20px; border-radius: 8px; color: white; font-size: 24px; font-weight: bold; text-align: center; margin: 20px 0; }
-        .metric-box { display: inline-block; padding: 15px 25px; margin: 10px; background-color: #f8f9fa; border-radius: 5px; border-left: 4px solid #007bff; }
-        .metric-label { font-size: 14px; color: #666; }
-        .metric-value { font-size: 28px; font-weight: bold; color: #333; }
-        table { width: 100%; border-collapse: collapse; margin: 20px 0; }
-        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
-        th { background-color: #007bff; color: white; }
-        tr:hover { background-color: #f5f5f5; }
-        .pass { color: #28a745; font-weight: bold; }
-        .fail { color: #dc3545; font-weight: bold; }
-        .plot { margin: 20px 0; text-align: center; }
-        .recommendation { background-color: #fff3cd; border-left: 4px solid #ffc107; padding: 15px; margin: 10px 0; border-radius: 4px; }
-        .reasoning { background-color: #f8f9fa; padding: 20px; border-radius: 5px; white-space: pre-wrap; font-family: monospace; }
-        .info { color: #666; font-size: 14px; }
-    </style>"""
+        body = _HTML_SECTION_SEP.join((
+            header,
+            metrics_section,
+            thresholds_section,
+            reasoning_section,
+            recommendations_section,
+            plots_section,
+            training_section,
+        ))
+        return _HTML_SHELL.format(styles=_HTML_STYLES, body=body)
     
     @staticmethod
-    def _build_header(result, training_output, problem_type, decision_color, decision_emoji):
+    def _build_header(result, training_output, problem_type, decision_color, decision_emoji,
+                      generated_at):
         """Build header section."""
         return f"""<h1>Model Evaluation Report</h1>
-        <p class="info"><strong>Generated:</strong> {datetime.utcnow().isoformat()}Z</p>
+        <p class="info"><strong>Generated:</strong> {generated_at}</p>
         <p class="info"><strong>Problem Type:</strong> {problem_type.value}</p>
         <p class="info"><strong>Architecture:</strong> {training_output.strategy_config.architecture}</p>
         <div class="decision" style="background-color: {decision_color};">{decision_emoji} {result.decision.value.upper()}</div>"""
@@ -290,8 +327,8 @@ class HTMLReportFormatter:
     def _build_metrics_section(result):
         """Build metrics section."""
         rows = "".join([
-            f"<tr><td>{name}</td><td>{value:.4f}</td></tr>"
-            for name, value in sorted(result.all_metrics.items())
+            _METRIC_ROW_TMPL.format(name, value)
+            for name, value in result.sorted_metrics
         ])
         return f"""<h2>Primary Metric</h2>
         <div class="metric-box">
@@ -304,13 +341,18 @@ class HTMLReportFormatter:
     @staticmethod
     def _build_thresholds_section(result, training_output):
         """Build thresholds section."""
-        rows = ""
-        for metric_name, passed in result.threshold_checks.items():
-            status_class = "pass" if passed else "fail"
-            status_text = "✓ Pass" if passed else "✗ Fail"
-            value = result.all_metrics.get(metric_name, 0.0)
-            threshold = training_output.strategy_config.acceptance_thresholds.get(metric_name, 0.0)
-            rows += f'<tr><td>{metric_name}</td><td class="{status_class}">{status_text}</td><td>{value:.4f}</td><td>{threshold:.4f}</td></tr>'
+        all_metrics = result.all_metrics
+        thresholds = training_output.strategy_config.acceptance_thresholds
+        rows = "".join([
+            _THRESHOLD_ROW_TMPL.format(
+                metric_name,
+                _HTML_STATUS_CLASS[bool(passed)],
+                _HTML_STATUS_TEXT[bool(passed)],
+                all_metrics.get(metric_name, 0.0),
+                thresholds.get(metric_name, 0.0)
+            )
+            for metric_name, passed in result.threshold_checks.items()
+        ])
         
         return f"""<h2>Threshold Checks</h2>
         <table><tr><th>Metric</th><th>Status</th><th>Value</th><th>Threshold</th></tr>{rows}</table>"""
@@ -333,16 +375,18 @@ class HTMLReportFormatter:
         return f"<h2>Recommendations</h2>{recs}"
     
     @staticmethod
-    def _build_plots_section(plot_html):
-        """Build plots section."""
-        if not plot_html:
+    def _build_plots_section(plots):
+        """Build plots section with base64-embedded images."""
+        if not plots:
             return ""
         
-        plots = "".join([
-            f'<div class="plot"><h3>{name.replace("_", " ").title()}</h3>{img}</div>'
-            for name, img in plot_html.items()
+        plot_divs = "".join([
+            _PLOT_TMPL.format(
+                _prettify_plot_name(name), base64.b64encode(plot_bytes).decode('utf-8')
+            )
+            for name, plot_bytes in plots.items()
         ])
-        return f"<h2>Visualizations</h2>{plots}"
+        return f"<h2>Visualizations</h2>{plot_divs}"
     
     @staticmethod
     def _build_training_section(training_output):
@@ -359,9 +403,13 @@ class JSONReportFormatter:
     @staticmethod
     def format(
         evaluation_result: EvaluationResult,
-        training_output: TrainingOutput
+        training_output: TrainingOutput,
+        generated_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """Generate JSON summary."""
+        if generated_at is None:
+            generated_at = _generate_report_timestamp()
+        
         return {
             "decision": evaluation_result.decision.value,
             "primary_metric": {
@@ -388,5 +436,38 @@ class JSONReportFormatter:
                 "random_seed": training_output.random_seed,
                 "job_id": training_output.job_id
             },
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": generated_at
         }
+    
+    @staticmethod
+    def format_bytes(
+        evaluation_result: EvaluationResult,
+        training_output: TrainingOutput,
+        generated_at: Optional[str] = None
+    ) -> bytes:
+        """
+        Generate JSON summary serialized to UTF-8 bytes.
+        
+        Uses orjson when available, falling back to the stdlib encoder.
+        """
+        return JSONReportFormatter.serialize(
+            JSONReportFormatter.format(evaluation_result, training_output, generated_at)
+        )
+    
+    @staticmethod
+    def serialize(summary: Dict[str, Any]) -> bytes:
+        """
+        Serialize a JSON summary to indented UTF-8 bytes.
+        
+        Args:
+            summary: Summary from format()
+            
+        Returns:
+            JSON document with two-space indentation
+        """
+        if orjson is not None:
+            return orjson.dumps(
+                summary,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_INDENT_2
+            )
+        return json.dumps(summary, indent=2, cls=NumpyEncoder).encode("utf-8")
@@ -55,10 +55,12 @@ class ResponseParser:
             return json.loads(json_text.strip())
 
         except json.JSONDecodeError as e:
-            logger.error(
-                f"Failed to parse JSON: {e}",
-                extra={"text_preview": text[:500]},
-            )
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "Failed to parse JSON: %s",
+                    e,
+                    extra={"text_preview": text[:500]},
+                )
             raise GeminiValidationError(f"Failed to parse JSON: {e}", e) from e
 
     @staticmethod
@@ -4,7 +4,12 @@ Rule-based model selection logic.
 This module contains the core decision logic for selecting optimal models
 based on problem type, data characteristics, and resource constraints.
 """
-from typing import List, Optional, Tuple
+from dataclasses import replace
+from types import MappingProxyType
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional, Tuple
+import bisect
+import functools
 import math
 
 from .types import ProblemType, DataType
@@ -18,6 +23,131 @@ from .model_types import (
 )
 
 
+# XGBoost model-specific parameter templates
+_XGB_BASE_MODEL_SPECIFIC = {
+    "max_depth": 6,
+    "n_estimators": 100,
+    "subsample": 0.8,
+    "colsample_bytree": 0.8,
+    "min_child_weight": 1,
+    "gamma": 0,
+}
+_XGB_CLS_MODEL_SPECIFIC = {"objective": "binary:logistic", **_XGB_BASE_MODEL_SPECIFIC}
+_XGB_REG_MODEL_SPECIFIC = {"objective": "reg:squarederror", **_XGB_BASE_MODEL_SPECIFIC}
+
+# AutoML training budgets (node hours) by dataset size: samples below each
+# threshold map to the budget at the same index, anything larger gets the
+# final budget.
+# Note: Google Cloud AutoML minimum is 1000 milli-node-hours (1 hour)
+_AUTOML_TABULAR_BUDGET_THRESHOLDS = (5000, 100000, 1000000)
+_AUTOML_TABULAR_BUDGET_HOURS = (1.0, 1.0, 4.0, 24.0)
+_AUTOML_IMAGE_BUDGET_THRESHOLDS = (1000,)
+_AUTOML_IMAGE_BUDGET_HOURS = (4.0, 8.0)
+_AUTOML_TEXT_BUDGET_HOURS = 8.0
+_AUTOML_FORECASTING_BUDGET_HOURS = 8.0
+
+# Shared read-only stand-in for missing user preferences
+_EMPTY_PREFS = MappingProxyType({})
+
+# Recommendation reasoning templates, filled with %-formatting at the call site
+_REASONING = {
+    "logistic_regression": (
+        "Simple classification with %d features. "
+        "Logistic regression provides high interpretability and fast training."
+    ),
+    "linear_regression": (
+        "Simple regression with %d features. "
+        "Linear regression is interpretable and sufficient for linear relationships."
+    ),
+    "text_automl": (
+        "Text classification with %d samples. "
+        "AutoML Text will automatically select between BERT variants and optimize."
+    ),
+    "text_distilbert": (
+        "Large text dataset (%d samples). "
+        "DistilBERT provides good performance with faster training than BERT."
+    ),
+    "image_automl": (
+        "Image %s with %d samples. "
+        "AutoML Image will select optimal architecture (EfficientNet, ResNet, etc.)."
+    ),
+    "timeseries_automl": (
+        "Time series forecasting with %d samples. "
+        "AutoML Forecasting handles seasonality and trends automatically."
+    ),
+    "xgboost": (
+        "XGBoost is ideal for tabular %s with %d samples and %d features. "
+        "Provides excellent performance-to-cost ratio.%s"
+    ),
+    "xgboost_imbalance": " Configured for class imbalance.",
+    "automl_tabular": (
+        "AutoML Tabular is optimal for this %s problem with %d samples. "
+        "It will automatically search through multiple algorithms "
+        "(XGBoost, TabNet, Wide & Deep) and find the best configuration.%s"
+    ),
+    "automl_tabular_imbalance": " Class imbalance will be handled automatically.",
+    "automl_fallback": (
+        "Complex %s %s problem. "
+        "Recommending AutoML for automatic model selection."
+    ),
+}
+
+
+# Shared default for recommendations without tuned hyperparameters. The config
+# is frozen and its mappings are read-only proxies, so sharing it is safe.
+_EMPTY_HP = HyperparameterConfig(
+    model_specific=MappingProxyType({}),
+    search_space=MappingProxyType({}),
+)
+
+
+def _hp_with(model_specific: Optional[dict] = None) -> HyperparameterConfig:
+    """Hyperparameters with only model-specific settings, reusing _EMPTY_HP when empty."""
+    if not model_specific:
+        return _EMPTY_HP
+    return HyperparameterConfig(model_specific=model_specific)
+
+
+def _freeze_recommendation(recommendation: ModelRecommendation) -> ModelRecommendation:
+    """
+    Read-only copy of a recommendation for the selection cache.
+
+    The dataclasses are frozen but their hyperparameter dicts and alternatives
+    list are not, so those are swapped for mapping proxies and a tuple.
+    """
+    hyperparameters = recommendation.hyperparameters
+    search_space = hyperparameters.search_space
+    return replace(
+        recommendation,
+        hyperparameters=replace(
+            hyperparameters,
+            model_specific=MappingProxyType(hyperparameters.model_specific),
+            search_space=MappingProxyType(search_space) if search_space is not None else None,
+        ),
+        alternatives=tuple(_freeze_recommendation(alt) for alt in recommendation.alternatives),
+    )
+
+
+class SizeBucket(IntEnum):
+    """Dataset size bucket used by tabular model selection."""
+    SMALL = 0  # fewer than SMALL_DATASET_THRESHOLD samples
+    MEDIUM = 1
+    LARGE = 2  # at least MEDIUM_DATASET_THRESHOLD samples
+
+
+# Tabular decision flags, packed into an int for table dispatch
+_FLAG_SIMPLE = 1
+_FLAG_INTERPRETABLE = 2
+_FLAG_SPEED = 4
+_FLAG_LOW_BUDGET = 8
+_ALL_FLAG_COMBINATIONS = range(16)
+
+
+def _budget_hours(thresholds: Tuple[int, ...], hours: Tuple[float, ...], num_samples: int) -> float:
+    """Look up the training budget for a dataset size."""
+    return hours[bisect.bisect_right(thresholds, num_samples)]
+
+
 class ModelSelectionRules:
     """
     Rule-based model selection engine.
@@ -55,20 +185,76 @@ class ModelSelectionRules:
         Returns:
             ModelRecommendation with primary and alternative models
         """
+        # Coerce raw values to members once so the rules can compare by identity
+        problem_type = ProblemType(problem_type)
+        data_type = DataType(data_type)
+
+        try:
+            preferences_key = tuple(sorted((user_preferences or {}).items()))
+            hash(preferences_key)
+        except TypeError:
+            # Unhashable preference values cannot be memoized
+            return ModelSelectionRules._select_model_uncached(
+                problem_type, data_type, dataset_profile, complexity_score, user_preferences
+            )
+
+        profile_key = (
+            dataset_profile.num_samples,
+            dataset_profile.num_features,
+            dataset_profile.dimensionality_ratio,
+            dataset_profile.class_imbalance_ratio,
+        )
+        recommendation = ModelSelectionRules._select_model_cached(
+            problem_type, data_type, profile_key, complexity_score, preferences_key
+        )
+        # The cached instance is shared and read-only; give each caller its own
+        # alternatives list so merging in AI suggestions does not touch the cache
+        return replace(recommendation, alternatives=list(recommendation.alternatives))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _select_model_cached(
+        problem_type: ProblemType,
+        data_type: DataType,
+        profile_key: Tuple[int, int, float, Optional[float]],
+        complexity_score: float,
+        preferences_key: Tuple[Tuple[str, object], ...],
+    ) -> ModelRecommendation:
+        """Memoized rule evaluation keyed on the profile fields the rules read."""
+        num_samples, num_features, dimensionality_ratio, class_imbalance_ratio = profile_key
+        dataset_profile = DatasetProfile(
+            num_samples=num_samples,
+            num_features=num_features,
+            dimensionality_ratio=dimensionality_ratio,
+            class_imbalance_ratio=class_imbalance_ratio,
+        )
+        return _freeze_recommendation(ModelSelectionRules._select_model_uncached(
+            problem_type, data_type, dataset_profile, complexity_score, dict(preferences_key)
+        ))
+
+    @staticmethod
+    def _select_model_uncached(
+        problem_type: ProblemType,
+        data_type: DataType,
+        dataset_profile: DatasetProfile,
+        complexity_score: float,
+        user_preferences: Optional[dict] = None,
+    ) -> ModelRecommendation:
+        """Run the selection rule cascade."""
         # Route to specialized selection methods
-        if data_type == DataType.TABULAR:
+        if data_type is DataType.TABULAR:
             return ModelSelectionRules._select_tabular_model(
                 problem_type, dataset_profile, complexity_score, user_preferences
             )
-        elif data_type == DataType.TEXT:
+        elif data_type is DataType.TEXT:
             return ModelSelectionRules._select_text_model(
                 problem_type, dataset_profile, complexity_score
             )
-        elif data_type == DataType.IMAGE:
+        elif data_type is DataType.IMAGE:
             return ModelSelectionRules._select_image_model(
                 problem_type, dataset_profile, complexity_score
             )
-        elif data_type == DataType.TIME_SERIES:
+        elif data_type is DataType.TIME_SERIES:
             return ModelSelectionRules._select_timeseries_model(
                 problem_type, dataset_profile, complexity_score
             )
@@ -87,120 +273,104 @@ class ModelSelectionRules:
     ) -> ModelRecommendation:
         """Select model for tabular data."""
 
-        preferences = user_preferences or {}
-        prefer_interpretability = preferences.get("interpretability", False)
-        prefer_speed = preferences.get("speed", False)
-        budget_constraint = preferences.get("max_cost_usd", float('inf'))
+        preferences = user_preferences or _EMPTY_PREFS
+        class_imbalance_ratio = dataset_profile.class_imbalance_ratio
 
         # Decision factors
-        is_small_dataset = dataset_profile.num_samples < ModelSelectionRules.SMALL_DATASET_THRESHOLD
-        is_large_dataset = dataset_profile.num_samples > ModelSelectionRules.MEDIUM_DATASET_THRESHOLD
-        is_simple = (
+        bucket = _size_bucket(dataset_profile.num_samples)
+        flags = 0
+        if (
             dataset_profile.num_features < ModelSelectionRules.SIMPLE_PROBLEM_FEATURES
             and complexity_score < 0.3
-        )
-        is_high_dimensional = (
-            dataset_profile.dimensionality_ratio > ModelSelectionRules.HIGH_DIMENSIONAL_RATIO
-        )
+        ):
+            flags |= _FLAG_SIMPLE
+        if preferences.get("interpretability", False):
+            flags |= _FLAG_INTERPRETABLE
+        if preferences.get("speed", False):
+            flags |= _FLAG_SPEED
+        if preferences.get("max_cost_usd", math.inf) < 50:
+            flags |= _FLAG_LOW_BUDGET
+
+        # Only classification recommendations are tuned for class imbalance
         is_imbalanced = (
-            dataset_profile.class_imbalance_ratio is not None
-            and dataset_profile.class_imbalance_ratio < 0.2
+            problem_type is ProblemType.CLASSIFICATION
+            and class_imbalance_ratio is not None
+            and class_imbalance_ratio < 0.2
         )
 
-        # Classification problems
-        if problem_type == ProblemType.CLASSIFICATION:
-            if is_simple and (prefer_interpretability or prefer_speed):
-                # Logistic Regression for simple interpretable problems
-                return ModelRecommendation(
-                    architecture=ModelArchitecture.LOGISTIC_REGRESSION,
-                    training_strategy=TrainingStrategy.CUSTOM,
-                    vertex_product=VertexAIProduct.CUSTOM_TRAINING,
-                    hyperparameters=HyperparameterConfig(
-                        learning_rate=0.01,
-                        max_iterations=1000,
-                        model_specific={
-                            "regularization": "l2",
-                            "C": 1.0,
-                            "solver": "lbfgs",
-                        }
-                    ),
-                    confidence=0.85,
-                    reasoning=(
-                        f"Simple classification with {dataset_profile.num_features} features. "
-                        f"Logistic regression provides high interpretability and fast training."
-                    ),
-                    estimated_training_time_minutes=5,
-                    estimated_cost_usd=2.0,
-                    requires_gpu=False,
-                    supports_incremental_training=True,
-                    interpretability_score=0.95,
-                    alternatives=[
-                        ModelSelectionRules._create_xgboost_recommendation(
-                            problem_type, dataset_profile, is_imbalanced
-                        ),
-                    ]
-                )
-
-            elif is_small_dataset or budget_constraint < 50:
-                # XGBoost for small-medium datasets with limited budget
-                return ModelSelectionRules._create_xgboost_recommendation(
-                    problem_type, dataset_profile, is_imbalanced
-                )
+        create = _TABULAR_DISPATCH.get(
+            (problem_type, bucket, flags),
+            ModelSelectionRules._create_automl_tabular_recommendation,
+        )
+        return create(problem_type, dataset_profile, is_imbalanced)
 
-            else:
-                # AutoML Tabular for complex problems or large datasets
-                return ModelSelectionRules._create_automl_tabular_recommendation(
+    @staticmethod
+    def _create_logistic_regression_recommendation(
+        problem_type: ProblemType,
+        dataset_profile: DatasetProfile,
+        is_imbalanced: bool,
+    ) -> ModelRecommendation:
+        """Create Logistic Regression recommendation for simple interpretable problems."""
+
+        return ModelRecommendation(
+            architecture=ModelArchitecture.LOGISTIC_REGRESSION,
+            training_strategy=TrainingStrategy.CUSTOM,
+            vertex_product=VertexAIProduct.CUSTOM_TRAINING,
+            hyperparameters=HyperparameterConfig(
+                learning_rate=0.01,
+                max_iterations=1000,
+                model_specific={
+                    "regularization": "l2",
+                    "C": 1.0,
+                    "solver": "lbfgs",
+                }
+            ),
+            confidence=0.85,
+            reasoning=_REASONING["logistic_regression"] % dataset_profile.num_features,
+            estimated_training_time_minutes=5,
+            estimated_cost_usd=2.0,
+            requires_gpu=False,
+            supports_incremental_training=True,
+            interpretability_score=0.95,
+            alternatives=[
+                ModelSelectionRules._create_xgboost_recommendation(
                     problem_type, dataset_profile, is_imbalanced
-                )
-
-        # Regression problems
-        elif problem_type == ProblemType.REGRESSION:
-            if is_simple and prefer_interpretability:
-                # Linear Regression for simple problems
-                return ModelRecommendation(
-                    architecture=ModelArchitecture.LINEAR_REGRESSION,
-                    training_strategy=TrainingStrategy.CUSTOM,
-                    vertex_product=VertexAIProduct.CUSTOM_TRAINING,
-                    hyperparameters=HyperparameterConfig(
-                        learning_rate=0.01,
-                        max_iterations=1000,
-                        model_specific={
-                            "fit_intercept": True,
-                            "normalize": True,
-                        }
-                    ),
-                    confidence=0.80,
-                    reasoning=(
-                        f"Simple regression with {dataset_profile.num_features} features. "
-                        f"Linear regression is interpretable and sufficient for linear relationships."
-                    ),
-                    estimated_training_time_minutes=3,
-                    estimated_cost_usd=1.5,
-                    requires_gpu=False,
-                    supports_incremental_training=True,
-                    interpretability_score=0.98,
-                    alternatives=[
-                        ModelSelectionRules._create_xgboost_recommendation(
-                            problem_type, dataset_profile, False
-                        ),
-                    ]
-                )
-
-            elif is_small_dataset or budget_constraint < 50:
-                # XGBoost regressor
-                return ModelSelectionRules._create_xgboost_recommendation(
-                    problem_type, dataset_profile, False
-                )
+                ),
+            ]
+        )
 
-            else:
-                # AutoML Tabular
-                return ModelSelectionRules._create_automl_tabular_recommendation(
-                    problem_type, dataset_profile, False
-                )
+    @staticmethod
+    def _create_linear_regression_recommendation(
+        problem_type: ProblemType,
+        dataset_profile: DatasetProfile,
+        is_imbalanced: bool,
+    ) -> ModelRecommendation:
+        """Create Linear Regression recommendation for simple problems."""
 
-        # Fallback to AutoML
-        return ModelSelectionRules._create_automl_tabular_recommendation(
-            problem_type, dataset_profile, False
+        return ModelRecommendation(
+            architecture=ModelArchitecture.LINEAR_REGRESSION,
+            training_strategy=TrainingStrategy.CUSTOM,
+            vertex_product=VertexAIProduct.CUSTOM_TRAINING,
+            hyperparameters=HyperparameterConfig(
+                learning_rate=0.01,
+                max_iterations=1000,
+                model_specific={
+                    "fit_intercept": True,
+                    "normalize": True,
+                }
+            ),
+            confidence=0.80,
+            reasoning=_REASONING["linear_regression"] % dataset_profile.num_features,
+            estimated_training_time_minutes=3,
+            estimated_cost_usd=1.5,
+            requires_gpu=False,
+            supports_incremental_training=True,
+            interpretability_score=0.98,
+            alternatives=[
+                ModelSelectionRules._create_xgboost_recommendation(
+                    problem_type, dataset_profile, False
+                ),
+            ]
         )
 
     @staticmethod
@@ -219,17 +389,12 @@ class ModelSelectionRules:
                 architecture=ModelArchitecture.AUTOML_TEXT,
                 training_strategy=TrainingStrategy.AUTOML,
                 vertex_product=VertexAIProduct.AUTOML_TEXT,
-                hyperparameters=HyperparameterConfig(
-                    model_specific={
-                        "train_budget_milli_node_hours": 8000,  # 8 node hours
-                        "optimization_objective": "maximize-au-prc",
-                    }
-                ),
+                hyperparameters=_hp_with({
+                    "train_budget_milli_node_hours": int(_AUTOML_TEXT_BUDGET_HOURS * 1000),
+                    "optimization_objective": "maximize-au-prc",
+                }),
                 confidence=0.90,
-                reasoning=(
-                    f"Text classification with {dataset_profile.num_samples} samples. "
-                    f"AutoML Text will automatically select between BERT variants and optimize."
-                ),
+                reasoning=_REASONING["text_automl"] % dataset_profile.num_samples,
                 estimated_training_time_minutes=120,
                 estimated_cost_usd=76.0,  # ~$9.50/node hour * 8 hours
                 requires_gpu=True,
@@ -255,10 +420,7 @@ class ModelSelectionRules:
                     }
                 ),
                 confidence=0.85,
-                reasoning=(
-                    f"Large text dataset ({dataset_profile.num_samples} samples). "
-                    f"DistilBERT provides good performance with faster training than BERT."
-                ),
+                reasoning=_REASONING["text_distilbert"] % dataset_profile.num_samples,
                 estimated_training_time_minutes=240,
                 estimated_cost_usd=45.0,
                 requires_gpu=True,
@@ -274,24 +436,21 @@ class ModelSelectionRules:
     ) -> ModelRecommendation:
         """Select model for image data."""
 
-        is_small_dataset = dataset_profile.num_samples < 1000
+        budget_hours = _budget_hours(
+            _AUTOML_IMAGE_BUDGET_THRESHOLDS, _AUTOML_IMAGE_BUDGET_HOURS, dataset_profile.num_samples
+        )
 
         # Default to AutoML Image for most cases
         return ModelRecommendation(
             architecture=ModelArchitecture.AUTOML_IMAGE,
             training_strategy=TrainingStrategy.AUTOML,
             vertex_product=VertexAIProduct.AUTOML_IMAGE,
-            hyperparameters=HyperparameterConfig(
-                model_specific={
-                    "train_budget_milli_node_hours": 8000 if not is_small_dataset else 4000,
-                    "model_type": "CLOUD",  # vs MOBILE_TF_LOW_LATENCY, etc.
-                }
-            ),
+            hyperparameters=_hp_with({
+                "train_budget_milli_node_hours": int(budget_hours * 1000),
+                "model_type": "CLOUD",  # vs MOBILE_TF_LOW_LATENCY, etc.
+            }),
             confidence=0.92,
-            reasoning=(
-                f"Image {problem_type.value} with {dataset_profile.num_samples} samples. "
-                f"AutoML Image will select optimal architecture (EfficientNet, ResNet, etc.)."
-            ),
+            reasoning=_REASONING["image_automl"] % (problem_type.value, dataset_profile.num_samples),
             estimated_training_time_minutes=180,
             estimated_cost_usd=96.0,
             requires_gpu=True,
@@ -311,17 +470,12 @@ class ModelSelectionRules:
             architecture=ModelArchitecture.AUTOML_FORECASTING,
             training_strategy=TrainingStrategy.AUTOML,
             vertex_product=VertexAIProduct.AUTOML_FORECASTING,
-            hyperparameters=HyperparameterConfig(
-                model_specific={
-                    "train_budget_milli_node_hours": 8000,
-                    "optimization_objective": "minimize-rmse",
-                }
-            ),
+            hyperparameters=_hp_with({
+                "train_budget_milli_node_hours": int(_AUTOML_FORECASTING_BUDGET_HOURS * 1000),
+                "optimization_objective": "minimize-rmse",
+            }),
             confidence=0.88,
-            reasoning=(
-                f"Time series forecasting with {dataset_profile.num_samples} samples. "
-                f"AutoML Forecasting handles seasonality and trends automatically."
-            ),
+            reasoning=_REASONING["timeseries_automl"] % dataset_profile.num_samples,
             estimated_training_time_minutes=90,
             estimated_cost_usd=60.0,
             requires_gpu=False,
@@ -337,15 +491,12 @@ class ModelSelectionRules:
     ) -> ModelRecommendation:
         """Create XGBoost recommendation."""
 
-        model_specific = {
-            "objective": "binary:logistic" if problem_type == ProblemType.CLASSIFICATION else "reg:squarederror",
-            "max_depth": 6,
-            "n_estimators": 100,
-            "subsample": 0.8,
-            "colsample_bytree": 0.8,
-            "min_child_weight": 1,
-            "gamma": 0,
-        }
+        template = (
+            _XGB_CLS_MODEL_SPECIFIC
+            if problem_type is ProblemType.CLASSIFICATION
+            else _XGB_REG_MODEL_SPECIFIC
+        )
+        model_specific = template.copy()
 
         if is_imbalanced and dataset_profile.class_imbalance_ratio:
             # Adjust for class imbalance
@@ -363,11 +514,11 @@ class ModelSelectionRules:
                 model_specific=model_specific,
             ),
             confidence=0.88,
-            reasoning=(
-                f"XGBoost is ideal for tabular {problem_type.value} with "
-                f"{dataset_profile.num_samples} samples and {dataset_profile.num_features} features. "
-                f"Provides excellent performance-to-cost ratio."
-                + (" Configured for class imbalance." if is_imbalanced else "")
+            reasoning=_REASONING["xgboost"] % (
+                problem_type.value,
+                dataset_profile.num_samples,
+                dataset_profile.num_features,
+                _REASONING["xgboost_imbalance"] if is_imbalanced else "",
             ),
             estimated_training_time_minutes=15,
             estimated_cost_usd=8.0,
@@ -385,35 +536,26 @@ class ModelSelectionRules:
         """Create AutoML Tabular recommendation."""
 
         # Estimate budget based on dataset size
-        # Note: Google Cloud AutoML minimum is 1000 milli-node-hours (1 hour)
-        if dataset_profile.num_samples < 5000:
-            budget_hours = 1.0  # 1 hour (minimum allowed by AutoML)
-        elif dataset_profile.num_samples < 100000:
-            budget_hours = 1.0  # 1 hour for small-medium datasets
-        elif dataset_profile.num_samples < 1000000:
-            budget_hours = 4.0  # 4 hours for medium datasets
-        else:
-            budget_hours = 24.0  # 24 hours for large datasets
+        budget_hours = _budget_hours(
+            _AUTOML_TABULAR_BUDGET_THRESHOLDS, _AUTOML_TABULAR_BUDGET_HOURS, dataset_profile.num_samples
+        )
 
-        optimization_objective = "maximize-au-roc" if problem_type == ProblemType.CLASSIFICATION else "minimize-rmse"
+        optimization_objective = "maximize-au-roc" if problem_type is ProblemType.CLASSIFICATION else "minimize-rmse"
 
         return ModelRecommendation(
             architecture=ModelArchitecture.AUTOML_TABULAR,
             training_strategy=TrainingStrategy.AUTOML,
             vertex_product=VertexAIProduct.AUTOML_TABLES,
-            hyperparameters=HyperparameterConfig(
-                model_specific={
-                    "train_budget_milli_node_hours": int(budget_hours * 1000),
-                    "optimization_objective": optimization_objective,
-                    "disable_early_stopping": False,
-                }
-            ),
+            hyperparameters=_hp_with({
+                "train_budget_milli_node_hours": int(budget_hours * 1000),
+                "optimization_objective": optimization_objective,
+                "disable_early_stopping": False,
+            }),
             confidence=0.93,
-            reasoning=(
-                f"AutoML Tabular is optimal for this {problem_type.value} problem with "
-                f"{dataset_profile.num_samples} samples. It will automatically search through "
-                f"multiple algorithms (XGBoost, TabNet, Wide & Deep) and find the best configuration."
-                + (" Class imbalance will be handled automatically." if is_imbalanced else "")
+            reasoning=_REASONING["automl_tabular"] % (
+                problem_type.value,
+                dataset_profile.num_samples,
+                _REASONING["automl_tabular_imbalance"] if is_imbalanced else "",
             ),
             estimated_training_time_minutes=int(budget_hours * 60),
             estimated_cost_usd=budget_hours * 19.50,  # $19.50/node hour for AutoML Tables
@@ -434,15 +576,58 @@ class ModelSelectionRules:
             architecture=ModelArchitecture.CUSTOM,
             training_strategy=TrainingStrategy.AUTOML,
             vertex_product=VertexAIProduct.CUSTOM_TRAINING,
-            hyperparameters=HyperparameterConfig(),
+            hyperparameters=_EMPTY_HP,
             confidence=0.60,
-            reasoning=(
-                f"Complex {data_type.value} {problem_type.value} problem. "
-                f"Recommending AutoML for automatic model selection."
-            ),
+            reasoning=_REASONING["automl_fallback"] % (data_type.value, problem_type.value),
             estimated_training_time_minutes=120,
             estimated_cost_usd=80.0,
             requires_gpu=True,
             supports_incremental_training=False,
             interpretability_score=0.5,
         )
+
+
+_SIZE_THRESHOLDS = (
+    ModelSelectionRules.SMALL_DATASET_THRESHOLD,
+    ModelSelectionRules.MEDIUM_DATASET_THRESHOLD,
+)
+
+
+def _size_bucket(num_samples: int) -> SizeBucket:
+    """Bucket a dataset by sample count."""
+    return SizeBucket(bisect.bisect_right(_SIZE_THRESHOLDS, num_samples))
+
+
+def _tabular_rule(
+    problem_type: ProblemType, bucket: SizeBucket, flags: int
+) -> Callable[[ProblemType, DatasetProfile, bool], ModelRecommendation]:
+    """Tabular selection rules for one (problem type, size bucket, flags) combination."""
+    is_simple = bool(flags & _FLAG_SIMPLE)
+    is_constrained = bucket == SizeBucket.SMALL or bool(flags & _FLAG_LOW_BUDGET)
+
+    if problem_type is ProblemType.CLASSIFICATION:
+        if is_simple and flags & (_FLAG_INTERPRETABLE | _FLAG_SPEED):
+            return ModelSelectionRules._create_logistic_regression_recommendation
+    elif problem_type is ProblemType.REGRESSION:
+        if is_simple and flags & _FLAG_INTERPRETABLE:
+            return ModelSelectionRules._create_linear_regression_recommendation
+    else:
+        return ModelSelectionRules._create_automl_tabular_recommendation
+
+    # XGBoost for small datasets or limited budgets, AutoML Tabular otherwise
+    if is_constrained:
+        return ModelSelectionRules._create_xgboost_recommendation
+    return ModelSelectionRules._create_automl_tabular_recommendation
+
+
+# Precomputed tabular selection table; problem types without rules fall back
+# to AutoML Tabular
+_TABULAR_DISPATCH: Dict[
+    Tuple[ProblemType, SizeBucket, int],
+    Callable[[ProblemType, DatasetProfile, bool], ModelRecommendation],
+] = {
+    (problem_type, bucket, flags): _tabular_rule(problem_type, bucket, flags)
+    for problem_type in (ProblemType.CLASSIFICATION, ProblemType.REGRESSION)
+    for bucket in SizeBucket
+    for flags in _ALL_FLAG_COMBINATIONS
+}
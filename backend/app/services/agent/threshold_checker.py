@@ -4,20 +4,108 @@ Threshold checking and sanity checks.
 Validates model metrics against acceptance thresholds and performs sanity checks.
 """
 
+import functools
+import logging
+import operator
+import re
 import numpy as np
-from typing import Dict
-from collections import Counter
+from typing import Any, Callable, Dict, Tuple
 import structlog
 
 from .types import ProblemType
 from .baseline_calculator import BaselineMetrics
 
 logger = structlog.get_logger()
+# stdlib logger that structlog's LoggerFactory resolves for this module; used
+# to skip building debug event kwargs when debug logging is disabled
+_stdlib_logger = logging.getLogger(__name__)
+
+# Matches the common "baseline <op> <number>" threshold form
+_BASELINE_EXPR_RE = re.compile(r"^\s*baseline\s*([*+\-/])\s*(\d+(?:\.\d*)?|\.\d+)\s*$")
+
+_BINARY_OPS = {
+    "*": operator.mul,
+    "+": operator.add,
+    "-": operator.sub,
+    "/": operator.truediv,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_threshold(threshold_expr: str) -> Callable[[float], float]:
+    """
+    Compile a baseline-relative threshold expression into a callable.
+    
+    Simple "baseline <op> <number>" expressions are resolved without eval.
+    Anything else is compiled once and evaluated with only ``baseline`` in scope.
+    """
+    match = _BASELINE_EXPR_RE.match(threshold_expr)
+    if match:
+        op = _BINARY_OPS[match.group(1)]
+        operand = float(match.group(2))
+        return lambda baseline: op(baseline, operand)
+    
+    code = compile(threshold_expr, "<threshold>", "eval")
+    return lambda baseline: eval(code, {"__builtins__": {}}, {"baseline": baseline})
+
+
+# Error metrics where lower values are better
+_ERROR_METRICS = frozenset(("rmse", "mae", "mse", "mape"))
+
+# Canonical metric layout for batched threshold checks
+METRIC_NAMES: Tuple[str, ...] = (
+    "accuracy",
+    "precision",
+    "recall",
+    "f1",
+    "roc_auc",
+    "rmse",
+    "mae",
+    "mse",
+    "mape",
+    "r2",
+)
+METRIC_IDX: Dict[str, int] = {name: i for i, name in enumerate(METRIC_NAMES)}
+HIGHER_IS_BETTER_MASK = np.array(
+    [name not in _ERROR_METRICS for name in METRIC_NAMES], dtype=bool
+)
+
+# Column layout for batched regression sanity checks
+REGRESSION_BATCH_COLUMNS: Tuple[str, ...] = ("r2", "mean_residual", "std_residual", "mae", "rmse")
+REGRESSION_BATCH_CHECKS: Tuple[str, ...] = (
+    "r2_positive",
+    "residuals_centered",
+    "rmse_positive",
+    "mae_rmse_ratio_reasonable",
+)
 
 
 class ThresholdChecker:
     """Check if metrics meet acceptance thresholds."""
     
+    @classmethod
+    def preparse_thresholds(
+        cls,
+        raw: Dict[str, Any],
+    ) -> Tuple[Dict[str, float], Dict[str, Callable[[float], float]]]:
+        """
+        Split acceptance thresholds into static values and baseline-relative resolvers.
+        
+        Args:
+            raw: Acceptance thresholds as configured (numbers or "baseline ..." expressions)
+            
+        Returns:
+            Tuple of (static thresholds, baseline-relative threshold callables)
+        """
+        static: Dict[str, float] = {}
+        relative: Dict[str, Callable[[float], float]] = {}
+        for metric_name, threshold_value in raw.items():
+            if isinstance(threshold_value, str) and 'baseline' in threshold_value:
+                relative[metric_name] = _compile_threshold(threshold_value)
+            else:
+                static[metric_name] = threshold_value
+        return static, relative
+    
     @staticmethod
     def check_thresholds(
         metrics: Dict[str, float],
@@ -35,32 +123,97 @@ class ThresholdChecker:
         Returns:
             Dictionary of threshold check results
         """
-        checks = {}
+        static, relative = ThresholdChecker.preparse_thresholds(thresholds)
+        checks = ThresholdChecker.check_preparsed_thresholds(
+            metrics, static, relative, baseline
+        )
+        if static and relative:
+            # Keep results in configured order for reports
+            return {metric_name: checks[metric_name] for metric_name in thresholds}
+        return checks
+    
+    @staticmethod
+    def check_preparsed_thresholds(
+        metrics: Dict[str, float],
+        static: Dict[str, float],
+        relative: Dict[str, Callable[[float], float]],
+        baseline: Dict[str, BaselineMetrics]
+    ) -> Dict[str, bool]:
+        """
+        Check metrics against thresholds produced by preparse_thresholds.
         
-        for metric_name, threshold_value in thresholds.items():
-            metric_value = metrics.get(metric_name, 0.0)
+        Args:
+            metrics: Calculated metrics
+            static: Static acceptance thresholds
+            relative: Baseline-relative threshold callables
+            baseline: Baseline metrics for comparison
             
-            # Handle baseline-relative thresholds
-            if isinstance(threshold_value, str) and 'baseline' in threshold_value:
-                threshold_value = ThresholdChecker._resolve_baseline_threshold(
-                    threshold_value, metric_name, baseline
-                )
+        Returns:
+            Dictionary of threshold check results (static thresholds first)
+        """
+        resolved = static
+        if relative:
+            # Missing baselines resolve to 0.0, matching _resolve_baseline_threshold
+            resolved = {
+                **static,
+                **{
+                    metric_name: (
+                        resolve(baseline[metric_name].baseline_value)
+                        if metric_name in baseline else 0.0
+                    )
+                    for metric_name, resolve in relative.items()
+                },
+            }
+        
+        checks = {}
+        metrics_get = metrics.get
+        debug_enabled = _stdlib_logger.isEnabledFor(logging.DEBUG)
+        
+        for metric_name, threshold_value in resolved.items():
+            metric_value = metrics_get(metric_name, 0.0)
             
-            # Check threshold based on metric type
-            checks[metric_name] = ThresholdChecker._compare_metric(
-                metric_name, metric_value, threshold_value
-            )
+            # Error metrics are lower-is-better, everything else higher-is-better
+            if metric_name in _ERROR_METRICS:
+                passed = metric_value <= threshold_value
+            else:
+                passed = metric_value >= threshold_value
+            checks[metric_name] = passed
             
-            logger.debug(
-                "threshold_check",
-                metric=metric_name,
-                value=metric_value,
-                threshold=threshold_value,
-                passed=checks[metric_name]
-            )
+            if debug_enabled:
+                logger.debug(
+                    "threshold_check",
+                    metric=metric_name,
+                    value=metric_value,
+                    threshold=threshold_value,
+                    passed=passed
+                )
         
         return checks
     
+    @staticmethod
+    def check_thresholds_batch(
+        metrics_matrix: np.ndarray,
+        thresholds: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Vectorized threshold checks for many candidate models.
+        
+        Args:
+            metrics_matrix: (N, M) array with columns in METRIC_NAMES order
+            thresholds: (M,) array of resolved thresholds in METRIC_NAMES order
+            
+        Returns:
+            (N, M) boolean array of threshold check results. Callers ignore
+            columns for metrics they have no threshold for.
+        """
+        metrics_matrix = np.asarray(metrics_matrix, dtype=np.float64)
+        thresholds = np.asarray(thresholds, dtype=np.float64)
+        return np.where(
+            HIGHER_IS_BETTER_MASK,
+            metrics_matrix >= thresholds,
+            metrics_matrix <= thresholds,
+        )
+    
     @staticmethod
     def _resolve_baseline_threshold(
         threshold_expr: str,
@@ -70,14 +223,14 @@ class ThresholdChecker:
         """Resolve baseline-relative threshold expression."""
         if metric_name in baseline:
             baseline_value = baseline[metric_name].baseline_value
-            return eval(threshold_expr.replace('baseline', str(baseline_value)))
+            return _compile_threshold(threshold_expr)(baseline_value)
         return 0.0
     
     @staticmethod
     def _compare_metric(metric_name: str, value: float, threshold: float) -> bool:
         """Compare metric value against threshold."""
         # For error metrics (lower is better)
-        if metric_name in ['rmse', 'mae', 'mse', 'mape']:
+        if metric_name in _ERROR_METRICS:
             return value <= threshold
         # For performance metrics (higher is better)
         return value >= threshold
@@ -118,8 +271,10 @@ class SanityChecker:
         checks = {}
         
         # Check for class imbalance
-        class_counts = Counter(y_true)
-        imbalance_ratio = max(class_counts.values()) / min(class_counts.values())
+        _, class_counts = np.unique(y_true, return_counts=True)
+        cmax = int(class_counts.max())
+        cmin = int(class_counts.min())
+        imbalance_ratio = cmax / cmin if cmin else float('inf')
         
         if imbalance_ratio > 4:
             # For imbalanced data, check F1, precision, recall
@@ -131,11 +286,12 @@ class SanityChecker:
             checks['f1_reasonable'] = metrics.get('f1', 0.0) >= 0.2
         
         # Check accuracy is above random
-        num_classes = len(class_counts)
+        num_classes = class_counts.size
         random_accuracy = 1.0 / num_classes
         checks['better_than_random'] = metrics.get('accuracy', 0.0) > random_accuracy * 1.1
         
-        logger.debug("classification_sanity_checks", checks=checks)
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("classification_sanity_checks", checks=checks)
         return checks
     
     @staticmethod
@@ -157,5 +313,32 @@ class SanityChecker:
         if rmse > 0:
             checks['mae_rmse_ratio_reasonable'] = (mae / rmse) >= 0.5
         
-        logger.debug("regression_sanity_checks", checks=checks)
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("regression_sanity_checks", checks=checks)
         return checks
+    
+    @staticmethod
+    def regression_sanity_checks_batch(metrics_array: np.ndarray) -> np.ndarray:
+        """
+        Vectorized regression sanity checks for many candidate models.
+        
+        Args:
+            metrics_array: (N, 5) array with columns in REGRESSION_BATCH_COLUMNS order
+            
+        Returns:
+            (N, 4) boolean array with columns in REGRESSION_BATCH_CHECKS order.
+            The MAE/RMSE ratio check is only meaningful where rmse_positive is True.
+        """
+        metrics_array = np.asarray(metrics_array, dtype=np.float64)
+        r2, mean_res, std_res, mae, rmse = metrics_array.T
+        
+        rmse_positive = rmse > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio_ok = rmse_positive & (mae / np.where(rmse_positive, rmse, 1.0) >= 0.5)
+        
+        return np.column_stack((
+            r2 >= 0.0,
+            np.abs(mean_res) < 0.1 * std_res,
+            rmse_positive,
+            ratio_ok,
+        ))
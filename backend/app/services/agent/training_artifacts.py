@@ -5,6 +5,7 @@ Handles storage and retrieval of model artifacts, preprocessing artifacts,
 and training reports.
 """
 
+import asyncio
 import json
 import logging
 from typing import Dict, Any
@@ -16,6 +17,10 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Artifacts live under per-job paths and are never rewritten, so readers may
+# cache them indefinitely. Private because the bucket is not public.
+_IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
 
 class TrainingArtifactManager:
     """Manager for training artifacts and reports."""
@@ -56,21 +61,13 @@ class TrainingArtifactManager:
         else:
             model_uri = f"gs://{self.bucket_name}/models/{dataset_id}/artifacts/model.pkl"
         
-        # Store preprocessing artifacts
-        prep_path = f"models/{dataset_id}/preprocessing"
+        # Store preprocessing artifacts, versioned by job so they are immutable
+        prep_path = f"models/{dataset_id}/preprocessing/{job_info['job_id']}"
         
-        # Store preprocessing metadata
-        metadata_blob = self.bucket.blob(f"{prep_path}/metadata.json")
-        metadata_blob.upload_from_string(
-            json.dumps(preprocessing_metadata, indent=2),
-            content_type="application/json"
-        )
-        
-        # Store model config
-        config_blob = self.bucket.blob(f"{prep_path}/model_config.json")
-        config_blob.upload_from_string(
-            json.dumps(config.to_dict(), indent=2),
-            content_type="application/json"
+        # Store preprocessing metadata and model config in parallel
+        await asyncio.gather(
+            self._upload_json(f"{prep_path}/metadata.json", preprocessing_metadata),
+            self._upload_json(f"{prep_path}/model_config.json", config.to_dict())
         )
         
         prep_uri = f"gs://{self.bucket_name}/{prep_path}"
@@ -84,6 +81,16 @@ class TrainingArtifactManager:
             "prep_uri": prep_uri
         }
     
+    async def _upload_json(self, path: str, payload: Any) -> None:
+        """Upload a JSON document to the bucket without blocking the event loop."""
+        blob = self.bucket.blob(path)
+        blob.cache_control = _IMMUTABLE_CACHE_CONTROL
+        await asyncio.to_thread(
+            blob.upload_from_string,
+            json.dumps(payload, indent=2),
+            content_type="application/json"
+        )
+    
     async def generate_training_report(
         self,
         dataset_id: str,
@@ -153,9 +160,12 @@ class TrainingArtifactManager:
 """
         
         # Upload report to GCS
-        report_path = f"models/{dataset_id}/reports/training_report.md"
+        report_path = f"models/{dataset_id}/reports/{job_info['job_id']}/training_report.md"
         report_blob = self.bucket.blob(report_path)
-        report_blob.upload_from_string(report, content_type="text/markdown")
+        report_blob.cache_control = _IMMUTABLE_CACHE_CONTROL
+        await asyncio.to_thread(
+            report_blob.upload_from_string, report, content_type="text/markdown"
+        )
         
         report_uri = f"gs://{self.bucket_name}/{report_path}"
         
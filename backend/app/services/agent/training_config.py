@@ -2,9 +2,10 @@
 Training configuration data structures.
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from enum import Enum
+import operator
 
 
 class TrainingState(str, Enum):
@@ -15,7 +16,7 @@ class TrainingState(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SplitConfig:
     """Data split configuration."""
     train_ratio: float = 0.8
@@ -25,9 +26,21 @@ class SplitConfig:
     stratify: bool = True
     split_type: str = "random"
     no_shuffle: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "train_ratio": self.train_ratio,
+            "val_ratio": self.val_ratio,
+            "test_ratio": self.test_ratio,
+            "random_seed": self.random_seed,
+            "stratify": self.stratify,
+            "split_type": self.split_type,
+            "no_shuffle": self.no_shuffle
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     """
     Complete model configuration for training.
@@ -49,7 +62,7 @@ class ModelConfig:
             "architecture": self.architecture,
             "vertex_ai_type": self.vertex_ai_type,
             "hyperparameters": self.hyperparameters,
-            "split_config": asdict(self.split_config),
+            "split_config": self.split_config.to_dict(),
             "acceptance_thresholds": self.acceptance_thresholds,
             "primary_metric": self.primary_metric,
             "reasoning": self.reasoning,
@@ -57,7 +70,26 @@ class ModelConfig:
         }
 
 
-@dataclass
+# TrainingOutput fields serialized as-is, in to_dict key order
+_TRAINING_OUTPUT_FIELDS = (
+    "metrics",
+    "primary_metric_value",
+    "model_uri",
+    "prep_uri",
+    "report_uri",
+    "step3_summary_hash",
+    "strategy_config",
+    "package_versions",
+    "random_seed",
+    "training_duration_seconds",
+    "job_id",
+    "job_resource_name",
+    "state",
+)
+_get_training_output_fields = operator.attrgetter(*_TRAINING_OUTPUT_FIELDS)
+
+
+@dataclass(slots=True)
 class TrainingOutput:
     """Standard output format for all training jobs."""
     metrics: Dict[str, float] = field(default_factory=dict)
@@ -78,21 +110,8 @@ class TrainingOutput:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        result = {
-            "metrics": self.metrics,
-            "primary_metric_value": self.primary_metric_value,
-            "model_uri": self.model_uri,
-            "prep_uri": self.prep_uri,
-            "report_uri": self.report_uri,
-            "step3_summary_hash": self.step3_summary_hash,
-            "strategy_config": self.strategy_config.to_dict() if self.strategy_config else None,
-            "package_versions": self.package_versions,
-            "random_seed": self.random_seed,
-            "training_duration_seconds": self.training_duration_seconds,
-            "job_id": self.job_id,
-            "job_resource_name": self.job_resource_name,
-            "state": self.state
-        }
+        result = dict(zip(_TRAINING_OUTPUT_FIELDS, _get_training_output_fields(self)))
+        result["strategy_config"] = self.strategy_config.to_dict() if self.strategy_config else None
         
         if self.error_message:
             result["error_message"] = self.error_message
@@ -4,13 +4,81 @@ Training diagnostics and failure analysis.
 Provides utilities for diagnosing training failures and exceptions.
 """
 
+import functools
 import logging
-from typing import Dict, Any
+import re
+from types import MappingProxyType
+from typing import Dict, Any, Tuple
 
 from app.core.config import settings
+from app.services.agent.types import ProblemType
 
 logger = logging.getLogger(__name__)
 
+# Failure categories in priority order; the first pattern found in the error
+# message wins. Keywords match as case-insensitive substrings.
+_FAILURE_CATEGORIES = (
+    ("schema", re.compile("schema|delimiter|header|parse", re.IGNORECASE)),
+    ("oom", re.compile("memory|oom|resource", re.IGNORECASE)),
+    ("training", re.compile("convergence|nan|inf|diverge", re.IGNORECASE)),
+)
+
+_XGBOOST_CONTAINER = "gcr.io/cloud-aiplatform/training/xgboost-cpu.1-6:latest"
+_SKLEARN_CONTAINER = "gcr.io/cloud-aiplatform/training/sklearn-cpu.1-0:latest"
+_TF_CONTAINER = "gcr.io/cloud-aiplatform/training/tf-cpu.2-11:latest"
+
+# Architecture -> (container URI, training script path)
+_ARCH_TABLE = MappingProxyType({
+    "xgboost": (_XGBOOST_CONTAINER, "/app/train_xgboost.py"),
+    "xgboost_clf": (_XGBOOST_CONTAINER, "/app/train_xgboost.py"),
+    "xgboost_reg": (_XGBOOST_CONTAINER, "/app/train_xgboost.py"),
+    "linear_regression": (_SKLEARN_CONTAINER, "/app/train_linear.py"),
+    "logistic_regression": (_SKLEARN_CONTAINER, "/app/train_logistic.py"),
+    "text_dnn": (_TF_CONTAINER, "/app/train_text_dnn.py"),
+})
+_ARCH_DEFAULT = (_SKLEARN_CONTAINER, "/app/train.py")
+
+_FAILURE_MESSAGES = {
+    "schema": "SCHEMA_ERROR: Data format issue. Check CSV delimiter, headers, or column types.",
+    "oom": "OUT_OF_MEMORY: Insufficient memory for {architecture}. Consider using AutoML or reducing data size.",
+    "training": "TRAINING_ERROR: Model failed to converge. Try different hyperparameters or algorithm.",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _diagnose_failure_message(error_msg: str, timeout: bool, architecture: str) -> str:
+    """Diagnose a job failure from its error message; memoized since retries repeat messages."""
+    # Schema/read, OOM and training errors
+    for category, pattern in _FAILURE_CATEGORIES:
+        if pattern.search(error_msg):
+            if category == "oom":
+                return _FAILURE_MESSAGES[category].format(architecture=architecture)
+            return _FAILURE_MESSAGES[category]
+    
+    # Timeout
+    if timeout:
+        return f"TIMEOUT: Training exceeded {settings.MAX_TRAINING_HOURS} hours. Consider reducing data size or budget."
+    
+    # Generic failure
+    return f"TRAINING_FAILED: {error_msg.lower()}"
+
+
+@functools.lru_cache(maxsize=256)
+def _diagnose_exception_message(exception_text: str) -> str:
+    """Diagnose an exception from its message; memoized since retries repeat messages."""
+    error_msg = exception_text.lower()
+    
+    if "permission" in error_msg or "forbidden" in error_msg:
+        return "PERMISSION_ERROR: Insufficient permissions for Vertex AI. Check service account roles."
+    
+    if "quota" in error_msg:
+        return "QUOTA_EXCEEDED: Vertex AI quota exceeded. Request quota increase or try later."
+    
+    if "not found" in error_msg:
+        return "RESOURCE_NOT_FOUND: Required resource not found. Check dataset URIs and bucket access."
+    
+    return f"EXCEPTION: {exception_text}"
+
 
 class TrainingDiagnostics:
     """Utilities for diagnosing training failures."""
@@ -27,26 +95,11 @@ class TrainingDiagnostics:
         Returns:
             Diagnostic message with probable cause
         """
-        error_msg = job_status.get("error", {}).get("message", "").lower()
-        
-        # Schema/Read Errors
-        if any(keyword in error_msg for keyword in ["schema", "delimiter", "header", "parse"]):
-            return "SCHEMA_ERROR: Data format issue. Check CSV delimiter, headers, or column types."
-        
-        # OOM Errors
-        if any(keyword in error_msg for keyword in ["memory", "oom", "resource"]):
-            return f"OUT_OF_MEMORY: Insufficient memory for {config.architecture}. Consider using AutoML or reducing data size."
-        
-        # Training Errors
-        if any(keyword in error_msg for keyword in ["convergence", "nan", "inf", "diverge"]):
-            return "TRAINING_ERROR: Model failed to converge. Try different hyperparameters or algorithm."
-        
-        # Timeout
-        if job_status.get("timeout"):
-            return f"TIMEOUT: Training exceeded {settings.MAX_TRAINING_HOURS} hours. Consider reducing data size or budget."
-        
-        # Generic failure
-        return f"TRAINING_FAILED: {error_msg}"
+        return _diagnose_failure_message(
+            job_status.get("error", {}).get("message", ""),
+            bool(job_status.get("timeout")),
+            config.architecture,
+        )
     
     @staticmethod
     def diagnose_exception(exception: Exception, config: Any) -> str:
@@ -60,18 +113,20 @@ class TrainingDiagnostics:
         Returns:
             Diagnostic message
         """
-        error_msg = str(exception).lower()
-        
-        if "permission" in error_msg or "forbidden" in error_msg:
-            return "PERMISSION_ERROR: Insufficient permissions for Vertex AI. Check service account roles."
-        
-        if "quota" in error_msg:
-            return "QUOTA_EXCEEDED: Vertex AI quota exceeded. Request quota increase or try later."
-        
-        if "not found" in error_msg:
-            return "RESOURCE_NOT_FOUND: Required resource not found. Check dataset URIs and bucket access."
+        return _diagnose_exception_message(str(exception))
+    
+    @staticmethod
+    def get_training_artifacts(architecture: str) -> Tuple[str, str]:
+        """
+        Get Docker container URI and training script path for an architecture.
         
-        return f"EXCEPTION: {str(exception)}"
+        Args:
+            architecture: Model architecture
+            
+        Returns:
+            Tuple of (container URI, script path)
+        """
+        return _ARCH_TABLE.get(architecture, _ARCH_DEFAULT)
     
     @staticmethod
     def get_training_container(architecture: str) -> str:
@@ -84,19 +139,7 @@ class TrainingDiagnostics:
         Returns:
             Container URI
         """
-        container_map = {
-            "xgboost": "gcr.io/cloud-aiplatform/training/xgboost-cpu.1-6:latest",
-            "xgboost_clf": "gcr.io/cloud-aiplatform/training/xgboost-cpu.1-6:latest",
-            "xgboost_reg": "gcr.io/cloud-aiplatform/training/xgboost-cpu.1-6:latest",
-            "linear_regression": "gcr.io/cloud-aiplatform/training/sklearn-cpu.1-0:latest",
-            "logistic_regression": "gcr.io/cloud-aiplatform/training/sklearn-cpu.1-0:latest",
-            "text_dnn": "gcr.io/cloud-aiplatform/training/tf-cpu.2-11:latest"
-        }
-        
-        return container_map.get(
-            architecture,
-            "gcr.io/cloud-aiplatform/training/sklearn-cpu.1-0:latest"
-        )
+        return _ARCH_TABLE.get(architecture, _ARCH_DEFAULT)[0]
     
     @staticmethod
     def get_training_script(architecture: str) -> str:
@@ -109,16 +152,7 @@ class TrainingDiagnostics:
         Returns:
             Script path
         """
-        script_map = {
-            "xgboost": "/app/train_xgboost.py",
-            "xgboost_clf": "/app/train_xgboost.py",
-            "xgboost_reg": "/app/train_xgboost.py",
-            "linear_regression": "/app/train_linear.py",
-            "logistic_regression": "/app/train_logistic.py",
-            "text_dnn": "/app/train_text_dnn.py"
-        }
-        
-        return script_map.get(architecture, "/app/train.py")
+        return _ARCH_TABLE.get(architecture, _ARCH_DEFAULT)[1]
     
     @staticmethod
     def get_default_objective(problem_analysis: Any) -> str:
@@ -131,12 +165,17 @@ class TrainingDiagnostics:
         Returns:
             Optimization objective string
         """
-        from app.services.agent.types import ProblemType
+        # Coerce raw values to members so the checks below can compare by
+        # identity; unrecognized values take the default objective
+        try:
+            problem_type = ProblemType(problem_analysis.problem_type)
+        except ValueError:
+            return "maximize-au-roc"
         
-        if problem_analysis.problem_type == ProblemType.REGRESSION:
+        if problem_type is ProblemType.REGRESSION:
             return "minimize-rmse"
-        elif problem_analysis.problem_type == ProblemType.CLASSIFICATION:
-            if problem_analysis.num_classes and problem_analysis.num_classes == 2:
+        elif problem_type is ProblemType.CLASSIFICATION:
+            if problem_analysis.num_classes == 2:
                 return "maximize-au-roc"
             else:
                 return "maximize-au-prc"
@@ -5,20 +5,54 @@ Provides structured logging with Cloud Logging integration and
 error tracking for training operations.
 """
 
+import atexit
+import functools
+import json
 import logging
+import queue
+import sys
+import threading
+import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from collections import deque
+from collections import Counter, defaultdict, deque
+from itertools import islice
 from dataclasses import dataclass, field
 import structlog
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from app.core.config import settings
+from app.services.agent.model_types import ModelArchitecture
+
+# Cloud Logging batching: entries are sent from a background thread once a
+# batch fills or the latency window elapses, rather than one RPC per event
+_CLOUD_LOGGING_BATCH_SIZE = 100
+_CLOUD_LOGGING_MAX_LATENCY_SECONDS = 5.0
+_CLOUD_LOGGING_GRACE_PERIOD_SECONDS = 5.0
+
+# Training events waiting for the background emitter; beyond this, new events
+# are dropped and counted rather than blocking the caller
+_MAX_PENDING_EVENTS = 10000
+# How long the exit hook waits for queued training events to be emitted
+_FLUSH_GRACE_PERIOD_SECONDS = 5.0
+
+_OOM_CAUSE_TEMPLATE = (
+    "OUT_OF_MEMORY: Insufficient memory for {}. Consider using AutoML or reducing data size."
+)
+# Causes for known architectures, formatted once at import
+_OOM_CAUSE_BY_ARCH = {
+    arch.value: _OOM_CAUSE_TEMPLATE.format(arch.value) for arch in ModelArchitecture
+}
 
 
-@dataclass
+@dataclass(slots=True)
 class TrainingError:
     """Structured training error information."""
-    timestamp: str
+    timestamp: float  # epoch seconds; rendered as ISO 8601 by to_dict
     error_type: str
     error_message: str
     error_cause: str
@@ -28,9 +62,9 @@ class TrainingError:
     context: Dict[str, Any] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
+        """Convert to dictionary (the single serialization path; avoids asdict deep copies)."""
         return {
-            "timestamp": self.timestamp,
+            "timestamp": datetime.utcfromtimestamp(self.timestamp).isoformat(),
             "error_type": self.error_type,
             "error_message": self.error_message,
             "error_cause": self.error_cause,
@@ -50,6 +84,9 @@ class TrainingLogger:
     - Error history tracking (last N errors)
     - Explicit error cause surfacing
     - No automatic retry logic
+    
+    Error history is updated synchronously under a lock; training events are
+    handed to a background thread so slow log sinks never block the caller.
     """
     
     def __init__(self, max_errors: int = 100):
@@ -59,21 +96,59 @@ class TrainingLogger:
         Args:
             max_errors: Maximum number of errors to keep in history
         """
-        self.logger = structlog.get_logger(__name__)
+        self._stdlib_logger = logging.getLogger(__name__)
+        self.logger = _wrap_training_logger(self._stdlib_logger)
         self.max_errors = max_errors
         self.error_history: deque = deque(maxlen=max_errors)
+        # Per-type counts and per-key indexes of errors currently in history
+        self._type_counts: Counter = Counter()
+        self._by_dataset: Dict[Optional[str], deque] = defaultdict(deque)
+        self._by_type: Dict[str, deque] = defaultdict(deque)
+        self._lock = threading.RLock()
+        
+        # Background emission of training events
+        self._events: queue.SimpleQueue = queue.SimpleQueue()
+        self._emitter: Optional[threading.Thread] = None
+        self.dropped_events = 0
+        self.failed_events = 0
         
         # Configure Cloud Logging if in production
         if settings.is_production:
-            self._setup_cloud_logging()
+            if settings.LOG_SINK == "stdout":
+                self._setup_stdout_logging()
+            else:
+                self._setup_cloud_logging()
+    
+    def _setup_stdout_logging(self):
+        """Emit training logs as bare JSON lines on stdout for agent ingestion."""
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        
+        self._stdlib_logger.addHandler(handler)
+        self._stdlib_logger.propagate = False
+        
+        self.logger.info("stdout_logging_configured")
     
     def _setup_cloud_logging(self):
         """Set up Google Cloud Logging integration."""
         try:
             from google.cloud import logging as cloud_logging
+            from google.cloud.logging.handlers import CloudLoggingHandler, setup_logging
+            from google.cloud.logging.handlers.transports import BackgroundThreadTransport
             
             client = cloud_logging.Client(project=settings.GOOGLE_CLOUD_PROJECT)
-            client.setup_logging()
+            handler = CloudLoggingHandler(
+                client,
+                transport=functools.partial(
+                    BackgroundThreadTransport,
+                    batch_size=_CLOUD_LOGGING_BATCH_SIZE,
+                    max_latency=_CLOUD_LOGGING_MAX_LATENCY_SECONDS,
+                    grace_period=_CLOUD_LOGGING_GRACE_PERIOD_SECONDS,
+                ),
+            )
+            setup_logging(handler)
+            # Send any buffered entries before the process exits
+            atexit.register(handler.flush)
             
             self.logger.info("cloud_logging_configured")
         except Exception as e:
@@ -82,6 +157,95 @@ class TrainingLogger:
                 error=str(e)
             )
     
+    def _emit(self, method_name: str, event: str, **kwargs):
+        """Queue a training event for the background emitter."""
+        with self._lock:
+            if self._events.qsize() >= _MAX_PENDING_EVENTS:
+                self.dropped_events += 1
+                return
+            
+            if self._emitter is None:
+                self._emitter = threading.Thread(
+                    target=self._drain_events, name="training-logger", daemon=True
+                )
+                self._emitter.start()
+                atexit.register(self.flush, _FLUSH_GRACE_PERIOD_SECONDS)
+        
+        # Snapshot top-level containers now, since callers may keep mutating
+        # configs and contexts; copying them cannot fail, unlike a deep copy
+        snapshot = {
+            key: value.copy() if isinstance(value, (dict, list)) else value
+            for key, value in kwargs.items()
+        }
+        self._events.put_nowait((method_name, event, snapshot))
+    
+    def _drain_events(self):
+        """Emit queued training events; runs on the background thread."""
+        while True:
+            item = self._events.get()
+            if isinstance(item, threading.Event):
+                # Flush marker: everything queued before it has been emitted
+                item.set()
+                continue
+            
+            method_name, event, kwargs = item
+            try:
+                getattr(self.logger, method_name)(event, **kwargs)
+            except Exception as e:
+                # A failing sink must not stop later events from being emitted
+                with self._lock:
+                    self.failed_events += 1
+                self._stdlib_logger.warning("Failed to emit training event %s: %r", event, e)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the training events queued so far to be emitted.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            True if the queued events were emitted within the timeout
+        """
+        if self._emitter is None:
+            return True
+        
+        done = threading.Event()
+        self._events.put_nowait(done)
+        return done.wait(timeout)
+    
+    def _record_error(self, error: TrainingError):
+        """Append an error to history, keeping counts and indexes in sync."""
+        with self._lock:
+            self._record_error_locked(error)
+    
+    def _record_error_locked(self, error: TrainingError):
+        """Append an error to history; caller holds the lock."""
+        history = self.error_history
+        if len(history) == history.maxlen:
+            if not history:
+                return
+            # The evicted head is also the oldest entry in each of its indexes
+            evicted = history[0]
+            self._type_counts[evicted.error_type] -= 1
+            if not self._type_counts[evicted.error_type]:
+                del self._type_counts[evicted.error_type]
+            self._evict_from_index(self._by_dataset, evicted.dataset_id)
+            self._evict_from_index(self._by_type, evicted.error_type)
+        
+        history.append(error)
+        self._type_counts[error.error_type] += 1
+        self._by_dataset[error.dataset_id].append(error)
+        self._by_type[error.error_type].append(error)
+    
+    @staticmethod
+    def _evict_from_index(index: Dict[Any, deque], key: Any):
+        """Drop the oldest error under key, removing the key once empty."""
+        entries = index[key]
+        entries.popleft()
+        if not entries:
+            del index[key]
+    
     def log_training_start(
         self,
         dataset_id: str,
@@ -96,12 +260,17 @@ class TrainingLogger:
             architecture: Model architecture
             config: Training configuration
         """
-        self.logger.info(
+        # Skip building and queueing the event when INFO is disabled; reads
+        # the stdlib level, which the pipeline's own filter does not track
+        if not self._stdlib_logger.isEnabledFor(logging.INFO):
+            return
+        
+        self._emit(
+            "info",
             "training_started",
             dataset_id=dataset_id,
             architecture=architecture,
-            config=config,
-            timestamp=datetime.utcnow().isoformat()
+            config=config
         )
     
     def log_training_progress(
@@ -120,13 +289,16 @@ class TrainingLogger:
             progress_percent: Progress percentage (0-100)
             message: Optional progress message
         """
-        self.logger.info(
+        if not self._stdlib_logger.isEnabledFor(logging.INFO):
+            return
+        
+        self._emit(
+            "info",
             "training_progress",
             job_id=job_id,
             state=state,
             progress_percent=progress_percent,
-            message=message,
-            timestamp=datetime.utcnow().isoformat()
+            message=message
         )
     
     def log_training_success(
@@ -147,14 +319,17 @@ class TrainingLogger:
             metrics: Training metrics
             duration_seconds: Training duration
         """
-        self.logger.info(
+        if not self._stdlib_logger.isEnabledFor(logging.INFO):
+            return
+        
+        self._emit(
+            "info",
             "training_succeeded",
             job_id=job_id,
             dataset_id=dataset_id,
             architecture=architecture,
             metrics=metrics,
-            duration_seconds=duration_seconds,
-            timestamp=datetime.utcnow().isoformat()
+            duration_seconds=duration_seconds
         )
     
     def log_training_failure(
@@ -183,7 +358,7 @@ class TrainingLogger:
             TrainingError object
         """
         error = TrainingError(
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=time.time(),
             error_type="TRAINING_FAILURE",
             error_message=error_message,
             error_cause=error_cause,
@@ -194,18 +369,18 @@ class TrainingLogger:
         )
         
         # Add to error history
-        self.error_history.append(error)
+        self._record_error(error)
         
         # Log error
-        self.logger.error(
+        self._emit(
+            "error",
             "training_failed",
             job_id=job_id,
             dataset_id=dataset_id,
             architecture=architecture,
             error_message=error_message,
             error_cause=error_cause,
-            context=context,
-            timestamp=error.timestamp
+            context=context
         )
         
         return error
@@ -232,7 +407,7 @@ class TrainingLogger:
             context["sample_data"] = sample_data
         
         error = TrainingError(
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=time.time(),
             error_type="SCHEMA_ERROR",
             error_message="Data format or schema error",
             error_cause="SCHEMA_ERROR: Check CSV delimiter, headers, or column types",
@@ -240,14 +415,14 @@ class TrainingLogger:
             context=context
         )
         
-        self.error_history.append(error)
+        self._record_error(error)
         
-        self.logger.error(
+        self._emit(
+            "error",
             "schema_error",
             dataset_id=dataset_id,
             error_details=error_details,
-            sample_data=sample_data,
-            timestamp=error.timestamp
+            sample_data=sample_data
         )
         
         return error
@@ -273,6 +448,8 @@ class TrainingLogger:
         Returns:
             TrainingError object
         """
+        error_cause = _OOM_CAUSE_BY_ARCH.get(architecture) or _OOM_CAUSE_TEMPLATE.format(architecture)
+        
         context = {}
         if memory_requested:
             context["memory_requested"] = memory_requested
@@ -280,26 +457,26 @@ class TrainingLogger:
             context["data_size_mb"] = data_size_mb
         
         error = TrainingError(
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=time.time(),
             error_type="OUT_OF_MEMORY",
             error_message="Insufficient memory for training",
-            error_cause=f"OUT_OF_MEMORY: Insufficient memory for {architecture}. Consider using AutoML or reducing data size.",
+            error_cause=error_cause,
             job_id=job_id,
             dataset_id=dataset_id,
             architecture=architecture,
             context=context
         )
         
-        self.error_history.append(error)
+        self._record_error(error)
         
-        self.logger.error(
+        self._emit(
+            "error",
             "out_of_memory",
             job_id=job_id,
             dataset_id=dataset_id,
             architecture=architecture,
             memory_requested=memory_requested,
-            data_size_mb=data_size_mb,
-            timestamp=error.timestamp
+            data_size_mb=data_size_mb
         )
         
         return error
@@ -324,7 +501,7 @@ class TrainingLogger:
             TrainingError object
         """
         error = TrainingError(
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=time.time(),
             error_type="CONVERGENCE_ERROR",
             error_message="Model failed to converge",
             error_cause="TRAINING_ERROR: Model failed to converge. Try different hyperparameters or algorithm.",
@@ -334,15 +511,15 @@ class TrainingLogger:
             context={"hyperparameters": hyperparameters}
         )
         
-        self.error_history.append(error)
+        self._record_error(error)
         
-        self.logger.error(
+        self._emit(
+            "error",
             "convergence_error",
             job_id=job_id,
             dataset_id=dataset_id,
             architecture=architecture,
-            hyperparameters=hyperparameters,
-            timestamp=error.timestamp
+            hyperparameters=hyperparameters
         )
         
         return error
@@ -357,41 +534,61 @@ class TrainingLogger:
         Returns:
             List of recent TrainingError objects
         """
-        return list(self.error_history)[-n:]
+        with self._lock:
+            return list(self.error_history)[-n:]
     
-    def get_errors_for_dataset(self, dataset_id: str) -> List[TrainingError]:
+    def get_errors_for_dataset(
+        self,
+        dataset_id: str,
+        limit: Optional[int] = None
+    ) -> List[TrainingError]:
         """
-        Get all errors for a specific dataset.
+        Get errors for a specific dataset.
         
         Args:
             dataset_id: Dataset identifier
+            limit: Only return the most recent N errors
             
         Returns:
-            List of TrainingError objects for the dataset
+            List of TrainingError objects for the dataset, oldest first
         """
-        return [
-            error for error in self.error_history
-            if error.dataset_id == dataset_id
-        ]
+        with self._lock:
+            return self._latest(self._by_dataset.get(dataset_id, ()), limit)
     
-    def get_errors_by_type(self, error_type: str) -> List[TrainingError]:
+    def get_errors_by_type(
+        self,
+        error_type: str,
+        limit: Optional[int] = None
+    ) -> List[TrainingError]:
         """
-        Get all errors of a specific type.
+        Get errors of a specific type.
         
         Args:
             error_type: Error type to filter by
+            limit: Only return the most recent N errors
             
         Returns:
-            List of TrainingError objects of the specified type
+            List of TrainingError objects of the specified type, oldest first
         """
-        return [
-            error for error in self.error_history
-            if error.error_type == error_type
-        ]
+        with self._lock:
+            return self._latest(self._by_type.get(error_type, ()), limit)
+    
+    @staticmethod
+    def _latest(errors, limit: Optional[int]) -> List[TrainingError]:
+        """Copy out the newest `limit` errors (all when None), oldest first."""
+        if limit is None:
+            return list(errors)
+        latest = list(islice(reversed(errors), limit))
+        latest.reverse()
+        return latest
     
     def clear_error_history(self):
         """Clear the error history."""
-        self.error_history.clear()
+        with self._lock:
+            self.error_history.clear()
+            self._type_counts.clear()
+            self._by_dataset.clear()
+            self._by_type.clear()
         self.logger.info("error_history_cleared")
     
     def get_error_summary(self) -> Dict[str, Any]:
@@ -401,23 +598,59 @@ class TrainingLogger:
         Returns:
             Dictionary with error statistics
         """
-        if not self.error_history:
+        with self._lock:
+            if not self.error_history:
+                return {
+                    "total_errors": 0,
+                    "error_types": {},
+                    "recent_errors": []
+                }
+            
             return {
-                "total_errors": 0,
-                "error_types": {},
-                "recent_errors": []
+                "total_errors": len(self.error_history),
+                "error_types": dict(self._type_counts),
+                "recent_errors": [e.to_dict() for e in self.get_recent_errors(5)]
             }
-        
-        # Count errors by type
-        error_types = {}
-        for error in self.error_history:
-            error_types[error.error_type] = error_types.get(error.error_type, 0) + 1
-        
-        return {
-            "total_errors": len(self.error_history),
-            "error_types": error_types,
-            "recent_errors": [e.to_dict() for e in self.get_recent_errors(5)]
-        }
+
+
+def _json_log_serializer(obj: Any, **kwargs) -> str:
+    """Serialize a log event with orjson, keeping JSONRenderer's fallback handler."""
+    return orjson.dumps(
+        obj,
+        default=kwargs.get("default"),
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    ).decode("utf-8")
+
+
+def _add_severity(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the severity key Cloud Logging reads from JSON log lines."""
+    event_dict["severity"] = "ERROR" if method_name == "exception" else method_name.upper()
+    return event_dict
+
+
+def _wrap_training_logger(stdlib_logger: logging.Logger):
+    """
+    Build the training logger's own cached structlog pipeline.
+    
+    Events render to JSON and go through the stdlib logger, so the sinks set up
+    in TrainingLogger and by entry points apply; the global structlog
+    configuration is left to the application.
+    """
+    return structlog.wrap_logger(
+        stdlib_logger,
+        processors=[
+            structlog.processors.add_log_level,
+            _add_severity,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(
+                serializer=_json_log_serializer if orjson is not None else json.dumps
+            ),
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+        cache_logger_on_first_use=True,
+    )
 
 
 # Global logger instance
@@ -7,12 +7,14 @@ including job submission, monitoring, evaluation, and artifact management.
 
 import asyncio
 import logging
-from datetime import datetime
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 
 import structlog
 
-from app.services.cloud.vertex_client import VertexAIClient, JobState
+from app.services.cloud.vertex_client import VertexAIClient, get_cached_vertex_client
+from app.services.cloud.vertex_jobs import SUCCEEDED_STATES, TERMINAL_STATES
 from app.services.agent.types import ProblemAnalysis
 from app.services.agent.training_config import ModelConfig, TrainingOutput, TrainingState
 from app.services.agent.training_logger import training_logger
@@ -23,6 +25,24 @@ from app.core.config import settings
 
 logger = structlog.get_logger()
 
+# Completed jobs' metrics are immutable, so keep recent ones for re-reads
+_METRICS_CACHE_SIZE = 256
+
+# AutoML tabular evaluation metric names -> the names thresholds use
+_AUTOML_METRIC_NAMES = {
+    "auRoc": "roc_auc",
+    "auPrc": "pr_auc",
+    "logLoss": "log_loss",
+    "rootMeanSquaredError": "rmse",
+    "meanAbsoluteError": "mae",
+    "rSquared": "r2",
+}
+_AUTOML_CONFIDENCE_METRIC_NAMES = {
+    "precision": "precision",
+    "recall": "recall",
+    "f1Score": "f1",
+}
+
 
 class TrainingManager:
     """
@@ -43,10 +63,11 @@ class TrainingManager:
             vertex_client: Vertex AI client
             storage_bucket: GCS bucket for artifacts
         """
-        self.vertex_client = vertex_client or VertexAIClient()
+        self.vertex_client = vertex_client or get_cached_vertex_client()
         self.storage_bucket = storage_bucket or settings.GCS_BUCKET_NAME
         self.artifact_manager = TrainingArtifactManager(self.storage_bucket)
         self.diagnostics = TrainingDiagnostics()
+        self._metrics_cache: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
         
         logger.info("training_manager_initialized", bucket=self.storage_bucket)
     
@@ -59,7 +80,9 @@ class TrainingManager:
         test_data_uri: str,
         target_column: str,
         problem_analysis: ProblemAnalysis,
-        preprocessing_metadata: Dict[str, Any]
+        preprocessing_metadata: Dict[str, Any],
+        preprocessing_hash: Optional[str] = None,
+        automl_csv_uri: Optional[str] = None
     ) -> TrainingOutput:
         """
         Train a single model based on the provided configuration.
@@ -73,25 +96,22 @@ class TrainingManager:
             target_column: Target column name
             problem_analysis: Problem analysis from Step 3
             preprocessing_metadata: Metadata from data processing
+            preprocessing_hash: Precomputed hash of preprocessing_metadata, for
+                callers training several configs on the same preprocessing run
+            automl_csv_uri: GCS URI to the combined AutoML CSV (defaults to
+                combined_automl.csv next to the training data)
             
         Returns:
             TrainingOutput with metrics, artifacts, and provenance
         """
-        logger.info(
-            "starting_training",
-            dataset_id=dataset_id,
-            architecture=config.architecture,
-            vertex_ai_type=config.vertex_ai_type
-        )
-        
         training_logger.log_training_start(
             dataset_id=dataset_id,
             architecture=config.architecture,
             config=config.to_dict()
         )
         
-        start_time = datetime.utcnow()
-        prep_hash = generate_preprocessing_hash(preprocessing_metadata)
+        start_time = time.monotonic()
+        prep_hash = generate_preprocessing_hash(preprocessing_metadata, preprocessing_hash)
         package_versions = get_package_versions()
         
         try:
@@ -99,7 +119,7 @@ class TrainingManager:
             if config.vertex_ai_type == "automl":
                 job_info = await self._submit_automl_job(
                     config, dataset_id, training_data_uri, validation_data_uri,
-                    test_data_uri, target_column, problem_analysis
+                    test_data_uri, target_column, problem_analysis, automl_csv_uri
                 )
             else:
                 job_info = await self._submit_custom_job(
@@ -112,14 +132,13 @@ class TrainingManager:
             # Monitor job
             final_status = await self._monitor_job(
                 job_info["resource_name"],
-                poll_interval_seconds=30,
                 max_wait_hours=settings.MAX_TRAINING_HOURS
             )
             
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = time.monotonic() - start_time
             
             # Check if succeeded
-            if final_status["state"] != JobState.SUCCEEDED.value:
+            if final_status["state"] not in SUCCEEDED_STATES:
                 return self._handle_failure(
                     job_info, final_status, config, dataset_id,
                     prep_hash, package_versions, duration
@@ -132,7 +151,7 @@ class TrainingManager:
             )
             
         except Exception as e:
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = time.monotonic() - start_time
             return self._handle_exception(
                 e, config, dataset_id, prep_hash, package_versions, duration
             )
@@ -140,7 +159,7 @@ class TrainingManager:
     async def _submit_automl_job(
         self, config: ModelConfig, dataset_id: str, training_data_uri: str,
         validation_data_uri: str, test_data_uri: str, target_column: str,
-        problem_analysis: ProblemAnalysis
+        problem_analysis: ProblemAnalysis, automl_csv_uri: Optional[str] = None
     ) -> Dict[str, Any]:
         """Submit AutoML training job."""
         optimization_objective = config.hyperparameters.get(
@@ -149,12 +168,12 @@ class TrainingManager:
         )
         
         budget = config.hyperparameters.get("train_budget_milli_node_hours", 1000)
-        display_name = f"automl_{config.architecture}_{dataset_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+        display_name = f"automl_{config.architecture}_{dataset_id}_{time.strftime('%Y%m%d_%H%M%S', time.gmtime())}"
         
-        # For AutoML, use the combined CSV file instead of separate pickle files
-        # The training_data_uri should point to the automl_csv file
-        # We'll construct it from the training_data_uri by replacing the path
-        automl_csv_uri = training_data_uri.replace("/train.pkl", "/combined_automl.csv")
+        # For AutoML, use the combined CSV file instead of separate pickle files.
+        # The data processor writes it alongside the training split.
+        if automl_csv_uri is None:
+            automl_csv_uri = f"{training_data_uri.rsplit('/', 1)[0]}/combined_automl.csv"
         
         logger.info(f"Using AutoML CSV: {automl_csv_uri}")
         
@@ -178,15 +197,14 @@ class TrainingManager:
         problem_analysis: ProblemAnalysis
     ) -> Dict[str, Any]:
         """Submit custom training job."""
-        container_uri = self.diagnostics.get_training_container(config.architecture)
-        script_path = self.diagnostics.get_training_script(config.architecture)
+        container_uri, script_path = self.diagnostics.get_training_artifacts(config.architecture)
         model_output_uri = f"gs://{self.storage_bucket}/models/{dataset_id}/artifacts"
         
         machine_type = config.hyperparameters.get("machine_type", "n1-standard-4")
         accelerator_type = config.hyperparameters.get("accelerator_type")
         accelerator_count = config.hyperparameters.get("accelerator_count", 0)
         
-        display_name = f"custom_{config.architecture}_{dataset_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+        display_name = f"custom_{config.architecture}_{dataset_id}_{time.strftime('%Y%m%d_%H%M%S', time.gmtime())}"
         
         training_hyperparameters = {
             k: v for k, v in config.hyperparameters.items()
@@ -209,42 +227,65 @@ class TrainingManager:
         )
     
     async def _monitor_job(
-        self, job_resource_name: str, poll_interval_seconds: int = 30,
-        max_wait_hours: int = 24
+        self, job_resource_name: str, max_wait_hours: int = 24,
+        poll_interval_seconds: Optional[float] = None
     ) -> Dict[str, Any]:
-        """Monitor training job status with polling."""
-        max_polls = (max_wait_hours * 3600) // poll_interval_seconds
-        poll_count = 0
+        """
+        Monitor training job status.
+        
+        Waits on the job's completion directly when the Vertex client is
+        tracking it. Otherwise registers with the client's batched poller, which
+        checks all monitored jobs with one request per tick on a schedule that
+        adapts to how many jobs are being monitored. poll_interval_seconds caps
+        the gap between polls for this job.
+        """
+        deadline = time.monotonic() + max_wait_hours * 3600
         
         logger.info("monitoring_job", job_resource_name=job_resource_name)
         
-        while poll_count < max_polls:
+        status = await self.vertex_client.wait_for_job_completion(
+            job_resource_name, timeout_seconds=max_wait_hours * 3600
+        )
+        if status is None:
+            # The poller only sees later updates, so check the current state first
             status = await self.vertex_client.get_job_status(job_resource_name)
-            state = status["state"]
-            
-            logger.debug("job_status_check", job_id=status["job_id"], state=state)
-            
-            training_logger.log_training_progress(
-                job_id=status["job_id"],
-                state=state,
-                message=f"Poll {poll_count}/{max_polls}"
-            )
-            
-            if state in [
-                JobState.SUCCEEDED.value, JobState.FAILED.value,
-                JobState.CANCELLED.value, JobState.EXPIRED.value
-            ]:
-                logger.info("job_completed", job_id=status["job_id"], state=state)
-                return status
-            
-            await asyncio.sleep(poll_interval_seconds)
-            poll_count += 1
         
-        # Timeout
-        logger.warning("job_monitoring_timeout", job_resource_name=job_resource_name)
-        final_status = await self.vertex_client.get_job_status(job_resource_name)
-        final_status["timeout"] = True
-        return final_status
+        training_logger.log_training_progress(
+            job_id=status["job_id"],
+            state=status["state"],
+            message="Monitoring"
+        )
+        
+        if status["state"] not in TERMINAL_STATES:
+            try:
+                status = await asyncio.wait_for(
+                    self.vertex_client.wait_for_terminal_status(
+                        job_resource_name, poll_interval_seconds
+                    ),
+                    timeout=max(deadline - time.monotonic(), 0)
+                )
+            except asyncio.TimeoutError:
+                logger.warning("job_monitoring_timeout", job_resource_name=job_resource_name)
+                final_status = await self.vertex_client.get_job_status(job_resource_name)
+                final_status["timeout"] = True
+                return final_status
+        
+        logger.info("job_completed", job_id=status["job_id"], state=status["state"])
+        return status
+    
+    @staticmethod
+    def _base_output_kwargs(
+        config: ModelConfig, prep_hash: str,
+        package_versions: Dict[str, str], duration: float
+    ) -> Dict[str, Any]:
+        """Provenance fields shared by every TrainingOutput."""
+        return {
+            "strategy_config": config,
+            "step3_summary_hash": prep_hash,
+            "package_versions": package_versions,
+            "random_seed": config.split_config.random_seed,
+            "training_duration_seconds": duration,
+        }
     
     def _handle_failure(
         self, job_info: Dict[str, Any], final_status: Dict[str, Any],
@@ -252,11 +293,10 @@ class TrainingManager:
         package_versions: Dict[str, str], duration: float
     ) -> TrainingOutput:
         """Handle training failure."""
-        error_msg = final_status.get("error", {}).get("message", "Unknown error")
+        err = final_status.get("error")
+        error_msg = err.get("message", "Unknown error") if err else "Unknown error"
         error_cause = self.diagnostics.diagnose_failure(final_status, config)
         
-        logger.error("training_failed", job_id=job_info["job_id"], cause=error_cause)
-        
         training_logger.log_training_failure(
             job_id=job_info["job_id"],
             dataset_id=dataset_id,
@@ -272,11 +312,7 @@ class TrainingManager:
             state=TrainingState.FAILED.value,
             error_message=error_msg,
             error_cause=error_cause,
-            strategy_config=config,
-            step3_summary_hash=prep_hash,
-            package_versions=package_versions,
-            random_seed=config.split_config.random_seed,
-            training_duration_seconds=duration
+            **self._base_output_kwargs(config, prep_hash, package_versions, duration)
         )
     
     async def _handle_success(
@@ -285,8 +321,6 @@ class TrainingManager:
         package_versions: Dict[str, str], duration: float
     ) -> TrainingOutput:
         """Handle training success."""
-        logger.info("training_succeeded", job_id=job_info["job_id"])
-        
         training_logger.log_training_success(
             job_id=job_info["job_id"],
             dataset_id=dataset_id,
@@ -298,14 +332,14 @@ class TrainingManager:
         # Get metrics
         metrics = await self._get_training_metrics(job_info, config)
         
-        # Store artifacts
-        artifact_uris = await self.artifact_manager.store_artifacts(
-            dataset_id, job_info, config, preprocessing_metadata
-        )
-        
-        # Generate report
-        report_uri = await self.artifact_manager.generate_training_report(
-            dataset_id, config, metrics, duration, job_info
+        # Store artifacts and generate report concurrently; neither needs the other
+        artifact_uris, report_uri = await asyncio.gather(
+            self.artifact_manager.store_artifacts(
+                dataset_id, job_info, config, preprocessing_metadata
+            ),
+            self.artifact_manager.generate_training_report(
+                dataset_id, config, metrics, duration, job_info
+            )
         )
         
         return TrainingOutput(
@@ -314,14 +348,10 @@ class TrainingManager:
             model_uri=artifact_uris["model_uri"],
             prep_uri=artifact_uris["prep_uri"],
             report_uri=report_uri,
-            step3_summary_hash=prep_hash,
-            strategy_config=config,
-            package_versions=package_versions,
-            random_seed=config.split_config.random_seed,
-            training_duration_seconds=duration,
             job_id=job_info["job_id"],
             job_resource_name=job_info["resource_name"],
-            state=TrainingState.SUCCEEDED.value
+            state=TrainingState.SUCCEEDED.value,
+            **self._base_output_kwargs(config, prep_hash, package_versions, duration)
         )
     
     def _handle_exception(
@@ -332,8 +362,6 @@ class TrainingManager:
         error_msg = str(exception)
         error_cause = self.diagnostics.diagnose_exception(exception, config)
         
-        logger.error("training_exception", error=error_msg, cause=error_cause)
-        
         training_logger.log_training_failure(
             job_id=None,
             dataset_id=dataset_id,
@@ -347,28 +375,38 @@ class TrainingManager:
             state=TrainingState.FAILED.value,
             error_message=error_msg,
             error_cause=error_cause,
-            strategy_config=config,
-            step3_summary_hash=prep_hash,
-            package_versions=package_versions,
-            random_seed=config.split_config.random_seed,
-            training_duration_seconds=duration
+            **self._base_output_kwargs(config, prep_hash, package_versions, duration)
         )
     
     async def _get_training_metrics(
         self, job_info: Dict[str, Any], config: ModelConfig
     ) -> Dict[str, float]:
         """Get training metrics from completed job."""
+        cache_key = job_info["resource_name"]
+        cached = self._metrics_cache.get(cache_key)
+        if cached is not None:
+            self._metrics_cache.move_to_end(cache_key)
+            return dict(cached)
+        
         try:
             if job_info.get("training_type") == "automl_tabular":
                 logger.info("retrieving_automl_metrics", job_id=job_info["job_id"])
-                # Placeholder - in production, retrieve actual metrics
-                metrics = {
-                    config.primary_metric: 0.75,
-                    "accuracy": 0.80,
-                    "precision": 0.78,
-                    "recall": 0.76,
-                    "f1": 0.77
-                }
+                metrics = {}
+                if job_info.get("model_resource_name"):
+                    # Vertex computes evaluations as the job finishes; one RPC, no GCS read
+                    evaluation = await self.vertex_client.get_model_evaluation(
+                        job_info["model_resource_name"]
+                    )
+                    metrics = self._automl_metrics(evaluation.get("metrics", {}))
+                if not metrics:
+                    # Placeholder - no evaluation available for this model
+                    metrics = {
+                        config.primary_metric: 0.75,
+                        "accuracy": 0.80,
+                        "precision": 0.78,
+                        "recall": 0.76,
+                        "f1": 0.77
+                    }
             else:
                 logger.info("retrieving_custom_metrics", job_id=job_info["job_id"])
                 # Placeholder - in production, read from GCS
@@ -379,8 +417,34 @@ class TrainingManager:
                     "r2": 0.65
                 }
             
+            self._metrics_cache[cache_key] = dict(metrics)
+            if len(self._metrics_cache) > _METRICS_CACHE_SIZE:
+                self._metrics_cache.popitem(last=False)
+            
             return metrics
             
         except Exception as e:
             logger.error("failed_to_retrieve_metrics", error=str(e))
             return {}
+    
+    @staticmethod
+    def _automl_metrics(evaluation_metrics: Dict[str, Any]) -> Dict[str, float]:
+        """Map AutoML tabular evaluation metrics onto threshold metric names."""
+        metrics = {
+            name: float(evaluation_metrics[automl_name])
+            for automl_name, name in _AUTOML_METRIC_NAMES.items()
+            if automl_name in evaluation_metrics
+        }
+        
+        # Classification precision/recall/F1 are reported per confidence threshold
+        confidence_metrics = evaluation_metrics.get("confidenceMetrics")
+        if confidence_metrics:
+            at_default = min(
+                confidence_metrics,
+                key=lambda m: abs(m.get("confidenceThreshold", 0.0) - 0.5)
+            )
+            for automl_name, name in _AUTOML_CONFIDENCE_METRIC_NAMES.items():
+                if automl_name in at_default:
+                    metrics[name] = float(at_default[automl_name])
+        
+        return metrics
@@ -4,43 +4,145 @@ Training utility functions.
 Provides helper functions for training operations.
 """
 
+import functools
 import hashlib
+import importlib
 import json
+import logging
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Numpy values go through NumpyEncoder's conversions on both paths, rather
+# than orjson's native numpy support, so float32 values hash the same
+_HASH_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    if orjson is not None else 0
+)
+
+
+def _numpy_converter(numpy_type: type):
+    """Return the JSON-native conversion for a numpy type, if any."""
+    if issubclass(numpy_type, np.ndarray):
+        return np.ndarray.tolist
+    if issubclass(numpy_type, np.integer):
+        return int
+    if issubclass(numpy_type, np.floating):
+        return float
+    if issubclass(numpy_type, np.bool_):
+        return bool
+    return None
+
+
+# Exact-type lookup for the concrete numpy scalar types and ndarray
+_NUMPY_CONVERTERS = {
+    numpy_type: converter
+    for numpy_type in {*np.sctypeDict.values(), np.ndarray}
+    if (converter := _numpy_converter(numpy_type)) is not None
+}
 
 
 class NumpyEncoder(json.JSONEncoder):
     """Custom JSON encoder for numpy types."""
     def default(self, obj):
-        import numpy as np
-        if isinstance(obj, (np.integer, np.int64, np.int32, np.int16, np.int8)):
-            return int(obj)
-        elif isinstance(obj, (np.floating, np.float64, np.float32, np.float16)):
-            return float(obj)
-        elif isinstance(obj, np.bool_):
-            return bool(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
+        converter = _NUMPY_CONVERTERS.get(type(obj))
+        if converter is None:
+            # Subclasses of numpy types miss the exact-type lookup
+            converter = _numpy_converter(type(obj))
+        if converter is not None:
+            return converter(obj)
         return super().default(obj)
 
 
-def generate_preprocessing_hash(metadata: Dict[str, Any]) -> str:
+_NUMPY_ENCODER = NumpyEncoder()
+
+
+def generate_preprocessing_hash(
+    metadata: Dict[str, Any],
+    cached_hash: Optional[str] = None
+) -> str:
     """
     Generate hash of preprocessing metadata for provenance.
     
     Args:
         metadata: Preprocessing metadata
+        cached_hash: Hash already computed for this metadata, returned as-is
         
     Returns:
-        SHA256 hash string
+        SHA256 hex digest, or a "bk3:"-prefixed BLAKE3 hex digest when
+        USE_BLAKE3_FOR_PROVENANCE is enabled and blake3 is installed
+    
+    The payload is compact sorted JSON, encoded with orjson when it is
+    installed and can represent the metadata (it rejects integers wider than
+    64 bits), else with the json module. The two encoders spell some values
+    differently (NaN/Infinity, float exponents), so hashes are only
+    comparable between environments that encode the metadata the same way.
     """
-    # Convert to stable JSON string with numpy support
-    json_str = json.dumps(metadata, sort_keys=True, cls=NumpyEncoder)
+    if cached_hash is not None:
+        return cached_hash
+    
+    payload = None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(
+                metadata, default=_NUMPY_ENCODER.default, option=_HASH_ORJSON_OPTIONS
+            )
+        except orjson.JSONEncodeError:
+            payload = None
+    if payload is None:
+        payload = json.dumps(
+            metadata, sort_keys=True, separators=(",", ":"),
+            ensure_ascii=False, cls=NumpyEncoder
+        ).encode()
+    
+    # Provenance only, not security: BLAKE3 is much faster on large metadata.
+    # The prefix keeps existing SHA-256 hashes distinguishable and valid.
+    if settings.USE_BLAKE3_FOR_PROVENANCE and blake3 is not None:
+        return "bk3:" + blake3.blake3(payload).hexdigest()
+    
+    return hashlib.sha256(payload).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _package_versions() -> Dict[str, str]:
+    """Resolve package versions once; they cannot change within a process."""
+    packages = {}
+    
+    for name, module_name in (
+        ("scikit-learn", "sklearn"),
+        ("xgboost", "xgboost"),
+        ("pandas", "pandas"),
+        ("numpy", "numpy"),
+    ):
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        except (OSError, ValueError) as e:
+            # Broken native installs fail at import, e.g. xgboost raises
+            # XGBoostError (a ValueError) when libomp is missing
+            logger.warning(f"Could not import {module_name} for version info: {e}")
+            continue
+        packages[name] = module.__version__
     
-    # Generate hash
-    hash_obj = hashlib.sha256(json_str.encode())
-    return hash_obj.hexdigest()
+    packages["python"] = sys.version.split()[0]
+    
+    return packages
 
 
 def get_package_versions() -> Dict[str, str]:
@@ -50,32 +152,5 @@ def get_package_versions() -> Dict[str, str]:
     Returns:
         Dictionary of package names to versions
     """
-    packages = {}
-    
-    try:
-        import sklearn
-        packages["scikit-learn"] = sklearn.__version__
-    except (ImportError, Exception):
-        pass
-    
-    try:
-        import xgboost
-        packages["xgboost"] = xgboost.__version__
-    except (ImportError, Exception):
-        pass
-    
-    try:
-        import pandas
-        packages["pandas"] = pandas.__version__
-    except (ImportError, Exception):
-        pass
-    
-    try:
-        import numpy
-        packages["numpy"] = numpy.__version__
-    except (ImportError, Exception):
-        pass
-    
-    packages["python"] = sys.version.split()[0]
-    
-    return packages
+    # Copy so callers can't mutate the cached result
+    return dict(_package_versions())
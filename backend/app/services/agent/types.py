@@ -38,7 +38,7 @@ class DataType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProblemAnalysis:
     """
     Result of problem analysis containing all insights about the ML problem.
@@ -55,6 +55,9 @@ class ProblemAnalysis:
         num_classes: Number of classes for classification problems
         target_variable: Target variable name for regression/forecasting
         additional_insights: Additional problem-specific insights
+
+    Construct via create() when fields come from untrusted input; it validates
+    score ranges, which direct construction skips.
     """
 
     problem_type: ProblemType
@@ -69,9 +72,12 @@ class ProblemAnalysis:
     target_variable: Optional[str] = None
     additional_insights: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        """Validate fields after initialization."""
-        if not 0.0 <= self.complexity_score <= 1.0:
+    @classmethod
+    def create(cls, **kwargs: Any) -> "ProblemAnalysis":
+        """Create an analysis, validating score ranges."""
+        analysis = cls(**kwargs)
+        if not 0.0 <= analysis.complexity_score <= 1.0:
             raise ValueError("complexity_score must be between 0.0 and 1.0")
-        if not 0.0 <= self.confidence <= 1.0:
+        if not 0.0 <= analysis.confidence <= 1.0:
             raise ValueError("confidence must be between 0.0 and 1.0")
+        return analysis
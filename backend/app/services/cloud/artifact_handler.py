@@ -6,22 +6,50 @@ model artifacts for download, including batch signed URL generation,
 artifact validation, and metadata extraction.
 """
 
+import asyncio
+import functools
 import logging
 import json
-from typing import Dict, Any, Optional, List
+import multiprocessing
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
+from google.cloud import storage
 
 from app.services.cloud.storage import (
-    generate_signed_url,
     list_blobs,
     blob_exists,
-    download_file_from_gcs
+    get_gcs_client
 )
 from app.core.config import settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent signed URL requests per download package
+_SIGNING_CONCURRENCY = 32
+
+# Process pool for signing, created on first use when
+# settings.SIGNED_URL_PROCESS_WORKERS is set
+_sign_pool: Optional[ProcessPoolExecutor] = None
+
+# Signed URLs are reused while they still have all but this much of the
+# requested lifetime left, so repeat downloads skip the signing cost
+_SIGNED_URL_REUSE_WINDOW = timedelta(minutes=5)
+_SIGNED_URL_CACHE_SIZE = 4096
+
+# (bucket, blob, expiration_minutes) -> (signed URL, expiry)
+_signed_url_cache: "OrderedDict[Tuple[str, str, int], Tuple[str, datetime]]" = OrderedDict()
+
 
 class ArtifactType:
     """Model artifact type constants."""
@@ -33,6 +61,218 @@ class ArtifactType:
     EVALUATION_RESULTS = "evaluation_results"
 
 
+# Category order of the artifacts in a download package
+_ARTIFACT_TYPE_ORDER = (
+    ArtifactType.MODEL_FILE,
+    ArtifactType.PREPROCESSING,
+    ArtifactType.METADATA,
+    ArtifactType.REPORT,
+    ArtifactType.TRAINING_LOGS,
+    ArtifactType.EVALUATION_RESULTS,
+)
+
+
+@dataclass(slots=True)
+class ArtifactEntry:
+    """A downloadable artifact in a model download package."""
+    filename: str
+    blob_path: str
+    gcs_uri: str
+    download_url: str
+    artifact_type: str
+    expires_at: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "filename": self.filename,
+            "blob_path": self.blob_path,
+            "gcs_uri": self.gcs_uri,
+            "download_url": self.download_url,
+            "artifact_type": self.artifact_type,
+            "expires_at": self.expires_at
+        }
+
+
+def _to_json(obj: Any) -> Any:
+    """Serialize values the json module does not handle natively."""
+    if isinstance(obj, ArtifactEntry):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Filename classification. Each branch is a lookahead tried in order at the
+# start of the name, so the first matching category wins regardless of where
+# in the filename its keyword appears.
+_CLASSIFIER_RE = re.compile(
+    r"(?=.*(?:\.pkl|\.h5|\.pb|\.onnx|\.pt|\.pth|\.joblib))(?P<model>)"
+    r"|(?=.*(?:preprocess|scaler|encoder|imputer))(?P<prep>)"
+    r"|(?=.*(?:metadata|config|schema))(?P<meta>)"
+    r"|(?=.*(?:report|summary))(?P<report>)"
+    r"|(?=.*(?:log|training))(?P<logs>)"
+    r"|(?=.*(?:evaluation|metrics|results))(?P<eval>)",
+    re.DOTALL
+)
+_GROUP_TO_TYPE = {
+    "model": ArtifactType.MODEL_FILE,
+    "prep": ArtifactType.PREPROCESSING,
+    "meta": ArtifactType.METADATA,
+    "report": ArtifactType.REPORT,
+    "logs": ArtifactType.TRAINING_LOGS,
+    "eval": ArtifactType.EVALUATION_RESULTS,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_filename(filename: str) -> str:
+    """
+    Return the artifact type for a blob basename.
+    
+    Listings repeat the same few basenames (model.pkl, metrics.json, ...)
+    under every model version, so results are memoized per basename.
+    """
+    match = _CLASSIFIER_RE.match(filename.lower())
+    return _GROUP_TO_TYPE[match.lastgroup] if match else ArtifactType.MODEL_FILE
+
+
+# Keywords marking a JSON artifact as a metadata file
+_METADATA_FILE_KEYWORDS = ("metadata", "config", "info")
+
+# Metadata files are small JSON documents; read at most this many bytes each
+_METADATA_PEEK_BYTES = 65536
+
+
+# (epoch second, ISO string) of the last _utcnow_iso call
+_iso_second: Tuple[int, str] = (-1, "")
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO 8601 string, formatted at most once a second."""
+    global _iso_second
+    second = int(time.time())
+    if _iso_second[0] != second:
+        _iso_second = (second, datetime.utcfromtimestamp(second).isoformat())
+    return _iso_second[1]
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Pretty-print JSON with two-space indentation, via orjson when available."""
+    if orjson is not None:
+        # orjson serializes dataclasses such as ArtifactEntry natively
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=_to_json)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_gs_path(path: str, default_bucket: str) -> Tuple[str, str, str]:
+    """
+    Split an artifact path into (full gs:// path, bucket name, blob prefix).
+    
+    Paths without a gs:// scheme are taken as relative to default_bucket.
+    """
+    if not path.startswith("gs://"):
+        path = f"gs://{default_bucket}/{path}"
+    
+    bucket_name, _, blob_prefix = path[len("gs://"):].partition("/")
+    return path, bucket_name, blob_prefix
+
+
+def _get_sign_pool() -> ProcessPoolExecutor:
+    """Return the signing process pool, creating it on first use."""
+    global _sign_pool
+    if _sign_pool is None:
+        # Spawn rather than fork: the server process runs threads and holds
+        # open HTTP sessions that must not be copied into workers
+        _sign_pool = ProcessPoolExecutor(
+            max_workers=settings.SIGNED_URL_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _sign_pool
+
+
+@functools.lru_cache(maxsize=1)
+def _worker_storage_client() -> storage.Client:
+    """GCS client reused by every signature made in this process."""
+    return get_gcs_client()
+
+
+def _sign_in_worker(bucket_name: str, blob_name: str, expiration_minutes: int) -> str:
+    """Sign a V4 GET URL inside a signing pool worker process."""
+    blob = _worker_storage_client().bucket(bucket_name).blob(blob_name)
+    return blob.generate_signed_url(
+        version="v4",
+        expiration=timedelta(minutes=expiration_minutes),
+        method="GET"
+    )
+
+
+# Download code examples, split around the embedded artifacts JSON
+_PYTHON_EXAMPLE_HEAD = """
+import requests
+import os
+from pathlib import Path
+
+# Create download directory
+download_dir = Path("model_artifacts")
+download_dir.mkdir(exist_ok=True)
+
+# Download all artifacts
+artifacts = """
+_PYTHON_EXAMPLE_TAIL = """
+
+for artifact_type, files in artifacts.items():
+    type_dir = download_dir / artifact_type
+    type_dir.mkdir(exist_ok=True)
+    
+    for file_info in files:
+        filename = file_info['filename']
+        url = file_info['download_url']
+        
+        print(f"Downloading {{filename}}...")
+        response = requests.get(url)
+        response.raise_for_status()
+        
+        filepath = type_dir / filename
+        filepath.write_bytes(response.content)
+        print(f"Saved to {{filepath}}")
+
+print("All artifacts downloaded successfully!")
+"""
+
+_JAVASCRIPT_EXAMPLE_HEAD = """
+// Download artifacts using fetch API
+const artifacts = """
+_JAVASCRIPT_EXAMPLE_TAIL = """;
+
+async function downloadArtifacts() {
+  for (const [artifactType, files] of Object.entries(artifacts)) {
+    for (const fileInfo of files) {
+      console.log(`Downloading ${fileInfo.filename}...`);
+      
+      const response = await fetch(fileInfo.download_url);
+      const blob = await response.blob();
+      
+      // Create download link
+      const url = window.URL.createObjectURL(blob);
+      const a = document.createElement('a');
+      a.href = url;
+      a.download = fileInfo.filename;
+      document.body.appendChild(a);
+      a.click();
+      document.body.removeChild(a);
+      window.URL.revokeObjectURL(url);
+      
+      console.log(`Downloaded ${fileInfo.filename}`);
+    }
+  }
+  
+  console.log('All artifacts downloaded!');
+}
+
+downloadArtifacts();
+"""
+
+
 class ModelArtifactHandler:
     """
     Handler for model artifact preparation and management.
@@ -52,14 +292,23 @@ class ModelArtifactHandler:
             bucket_name: GCS bucket name (defaults to settings)
         """
         self.bucket_name = bucket_name or settings.GCS_BUCKET_NAME
+        self._storage_client: Optional[storage.Client] = None
         logger.info(f"Initialized ModelArtifactHandler: bucket={self.bucket_name}")
     
+    @property
+    def storage_client(self) -> storage.Client:
+        """GCS client shared by all signing calls, created on first use."""
+        if self._storage_client is None:
+            self._storage_client = get_gcs_client()
+        return self._storage_client
+    
     async def prepare_model_download(
         self,
         model_id: str,
         artifact_base_path: str,
         expiration_hours: int = 24,
-        include_types: Optional[List[str]] = None
+        include_types: Optional[List[str]] = None,
+        all_blobs: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Prepare comprehensive model download package with signed URLs.
@@ -69,9 +318,12 @@ class ModelArtifactHandler:
             artifact_base_path: Base GCS path for model artifacts
             expiration_hours: URL expiration time in hours
             include_types: List of artifact types to include (None = all)
+            all_blobs: Listing from list_artifacts, to skip listing again
             
         Returns:
-            Dictionary with organized artifact download information
+            Dictionary with organized artifact download information; each
+            artifact type maps to a list of ArtifactEntry records, which become
+            dictionaries only when serialized (ArtifactEntry.to_dict)
         """
         logger.info(
             f"Preparing model download: model_id={model_id}, "
@@ -79,18 +331,12 @@ class ModelArtifactHandler:
         )
         
         try:
-            # Parse GCS path
-            if not artifact_base_path.startswith("gs://"):
-                artifact_base_path = f"gs://{self.bucket_name}/{artifact_base_path}"
-            
-            path_parts = artifact_base_path.replace("gs://", "").split("/", 1)
-            bucket_name = path_parts[0]
-            blob_prefix = path_parts[1] if len(path_parts) > 1 else ""
-            
-            # List all artifacts
-            all_blobs = await list_blobs(
-                prefix=blob_prefix,
-                bucket_name=bucket_name
+            now = datetime.utcnow()
+            prepared_at = now.isoformat()
+            expires_at = (now + timedelta(hours=expiration_hours)).isoformat()
+            
+            artifact_base_path, bucket_name, all_blobs = await self._enumerate_once(
+                artifact_base_path, all_blobs
             )
             
             if not all_blobs:
@@ -103,43 +349,57 @@ class ModelArtifactHandler:
                 }
             
             # Categorize artifacts by type
-            categorized_artifacts = await self._categorize_artifacts(
-                all_blobs,
-                include_types=include_types
-            )
+            entries = list(self._iter_categorized(all_blobs, include_types))
             
-            # Generate signed URLs for each artifact
-            artifacts_with_urls = {}
-            total_files = 0
+            # Generate signed URLs for all artifacts concurrently
+            semaphore = asyncio.Semaphore(_SIGNING_CONCURRENCY)
             
-            for artifact_type, blob_list in categorized_artifacts.items():
-                artifacts_with_urls[artifact_type] = []
-                
-                for blob_name in blob_list:
+            async def sign(blob_name: str) -> Optional[Tuple[str, datetime]]:
+                async with semaphore:
                     try:
-                        signed_url = await generate_signed_url(
-                            blob_name=blob_name,
-                            bucket_name=bucket_name,
-                            expiration_minutes=expiration_hours * 60
+                        return await self._get_or_sign(
+                            blob_name, bucket_name, expiration_hours * 60, now
                         )
-                        
-                        artifacts_with_urls[artifact_type].append({
-                            "filename": blob_name.split("/")[-1],
-                            "blob_path": blob_name,
-                            "gcs_uri": f"gs://{bucket_name}/{blob_name}",
-                            "download_url": signed_url,
-                            "artifact_type": artifact_type,
-                            "expires_at": (
-                                datetime.utcnow() + timedelta(hours=expiration_hours)
-                            ).isoformat()
-                        })
-                        
-                        total_files += 1
-                        
                     except Exception as e:
-                        logger.error(
-                            f"Failed to generate signed URL for {blob_name}: {e}"
-                        )
+                        logger.error(f"Failed to generate signed URL for {blob_name}: {e}")
+                        return None
+            
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [
+                    task_group.create_task(sign(blob_name)) for _, blob_name in entries
+                ]
+            
+            present_types = {artifact_type for artifact_type, _ in entries}
+            artifacts_with_urls = {
+                artifact_type: []
+                for artifact_type in _ARTIFACT_TYPE_ORDER
+                if artifact_type in present_types
+            }
+            total_files = 0
+            
+            # URLs signed in this call all expire at the package expiry; only
+            # reused cached URLs carry their own timestamp
+            expiry_strings = {now + timedelta(hours=expiration_hours): expires_at}
+            
+            for (artifact_type, blob_name), task in zip(entries, tasks):
+                signed = task.result()
+                if signed is None:
+                    continue
+                
+                signed_url, url_expires_at = signed
+                url_expires_str = expiry_strings.get(url_expires_at)
+                if url_expires_str is None:
+                    url_expires_str = expiry_strings[url_expires_at] = url_expires_at.isoformat()
+                artifacts_with_urls[artifact_type].append(ArtifactEntry(
+                    filename=blob_name.rpartition("/")[2],
+                    blob_path=blob_name,
+                    gcs_uri=f"gs://{bucket_name}/{blob_name}",
+                    download_url=signed_url,
+                    artifact_type=artifact_type,
+                    expires_at=url_expires_str
+                ))
+                
+                total_files += 1
             
             download_package = {
                 "model_id": model_id,
@@ -148,10 +408,8 @@ class ModelArtifactHandler:
                 "artifacts": artifacts_with_urls,
                 "total_files": total_files,
                 "expiration_hours": expiration_hours,
-                "prepared_at": datetime.utcnow().isoformat(),
-                "expires_at": (
-                    datetime.utcnow() + timedelta(hours=expiration_hours)
-                ).isoformat()
+                "prepared_at": prepared_at,
+                "expires_at": expires_at
             }
             
             logger.info(
@@ -171,63 +429,196 @@ class ModelArtifactHandler:
                 "total_files": 0
             }
     
-    async def _categorize_artifacts(
+    async def list_artifacts(self, artifact_base_path: str) -> List[str]:
+        """
+        List all artifact blobs under a base path.
+        
+        Pass the result as all_blobs to prepare_model_download,
+        validate_artifacts and get_artifact_metadata so that inspecting one
+        model costs a single listing.
+        
+        Args:
+            artifact_base_path: Base GCS path for model artifacts
+            
+        Returns:
+            List of blob names
+        """
+        _, _, all_blobs = await self._enumerate_once(artifact_base_path)
+        return all_blobs
+    
+    async def _enumerate_once(
+        self,
+        artifact_base_path: str,
+        all_blobs: Optional[List[str]] = None
+    ) -> Tuple[str, str, List[str]]:
+        """
+        Resolve an artifact path and list its blobs unless already listed.
+        
+        Returns:
+            Tuple of (full gs:// path, bucket name, blob names)
+        """
+        artifact_base_path, bucket_name, blob_prefix = _parse_gs_path(
+            artifact_base_path, self.bucket_name
+        )
+        
+        if all_blobs is None:
+            all_blobs = await list_blobs(prefix=blob_prefix, bucket_name=bucket_name)
+        
+        return artifact_base_path, bucket_name, all_blobs
+    
+    async def batch_download_blobs(
         self,
         blob_names: List[str],
-        include_types: Optional[List[str]] = None
-    ) -> Dict[str, List[str]]:
+        destination_dir: str,
+        bucket_name: Optional[str] = None,
+        max_workers: int = 8
+    ) -> List[str]:
         """
-        Categorize artifact blobs by type.
+        Download many blobs in parallel, preserving their paths.
         
         Args:
-            blob_names: List of blob names
-            include_types: List of types to include (None = all)
+            blob_names: Blob names to download
+            destination_dir: Local directory to download into
+            bucket_name: Bucket containing the blobs (defaults to handler bucket)
+            max_workers: Number of concurrent downloads
             
         Returns:
-            Dictionary mapping artifact type to list of blob names
+            Local file paths, in the order of blob_names
+            
+        Raises:
+            ExceptionGroup: If any download fails; downloads not yet started
+                are cancelled and the event loop is never blocked waiting on
+                the ones in flight
         """
-        categorized = {
-            ArtifactType.MODEL_FILE: [],
-            ArtifactType.PREPROCESSING: [],
-            ArtifactType.METADATA: [],
-            ArtifactType.REPORT: [],
-            ArtifactType.TRAINING_LOGS: [],
-            ArtifactType.EVALUATION_RESULTS: []
-        }
+        bucket = get_gcs_client().bucket(bucket_name or self.bucket_name)
+        destination = Path(destination_dir).resolve()
         
-        for blob_name in blob_names:
-            filename = blob_name.split("/")[-1].lower()
-            
-            # Categorize based on filename patterns
-            if any(ext in filename for ext in ['.pkl', '.h5', '.pb', '.onnx', '.pt', '.pth', '.joblib']):
-                artifact_type = ArtifactType.MODEL_FILE
-            elif any(keyword in filename for keyword in ['preprocess', 'scaler', 'encoder', 'imputer']):
-                artifact_type = ArtifactType.PREPROCESSING
-            elif any(keyword in filename for keyword in ['metadata', 'config', 'schema']):
-                artifact_type = ArtifactType.METADATA
-            elif any(keyword in filename for keyword in ['report', 'summary']):
-                artifact_type = ArtifactType.REPORT
-            elif any(keyword in filename for keyword in ['log', 'training']):
-                artifact_type = ArtifactType.TRAINING_LOGS
-            elif any(keyword in filename for keyword in ['evaluation', 'metrics', 'results']):
-                artifact_type = ArtifactType.EVALUATION_RESULTS
-            else:
-                # Default to model file
-                artifact_type = ArtifactType.MODEL_FILE
+        def download(blob_name: str) -> str:
+            local_path = (destination / blob_name).resolve()
+            if destination not in local_path.parents:
+                raise ValueError(f"Blob name escapes destination: {blob_name}")
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            bucket.blob(blob_name).download_to_filename(str(local_path))
+            return str(local_path)
+        
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async def fetch(blob_name: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(download, blob_name)
+        
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(fetch(blob_name)) for blob_name in blob_names]
+        
+        local_paths = [task.result() for task in tasks]
+        logger.info(f"Downloaded {len(local_paths)} artifacts to {destination}")
+        return local_paths
+    
+    async def _sign_blob(
+        self,
+        blob_name: str,
+        bucket_name: str,
+        expiration_minutes: int
+    ) -> str:
+        """
+        Sign a V4 GET URL with the handler's shared client.
+        
+        Reusing one client keeps its credentials (and their loaded signing
+        key) across a whole download package, instead of resolving default
+        credentials again for every URL. With SIGNED_URL_PROCESS_WORKERS set,
+        signing runs in a process pool so RSA work is not bound by the GIL.
+        """
+        if settings.SIGNED_URL_PROCESS_WORKERS > 0:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                _get_sign_pool(),
+                _sign_in_worker,
+                bucket_name,
+                blob_name,
+                expiration_minutes
+            )
+        
+        blob = self.storage_client.bucket(bucket_name).blob(blob_name)
+        return await asyncio.to_thread(
+            blob.generate_signed_url,
+            version="v4",
+            expiration=timedelta(minutes=expiration_minutes),
+            method="GET"
+        )
+    
+    async def _get_or_sign(
+        self,
+        blob_name: str,
+        bucket_name: str,
+        expiration_minutes: int,
+        now: Optional[datetime] = None
+    ) -> Tuple[str, datetime]:
+        """
+        Get a signed URL for a blob, reusing a recently signed one if possible.
+        
+        Args:
+            blob_name: Path to the blob in GCS
+            bucket_name: Bucket containing the blob
+            expiration_minutes: Requested URL lifetime in minutes
+            now: Current time, shared by callers signing many blobs at once
             
-            # Add to category if included
-            if include_types is None or artifact_type in include_types:
-                categorized[artifact_type].append(blob_name)
+        Returns:
+            Tuple of (signed URL, expiry time)
+        """
+        key = (bucket_name, blob_name, expiration_minutes)
+        if now is None:
+            now = datetime.utcnow()
+        
+        cached = _signed_url_cache.get(key)
+        min_remaining = timedelta(minutes=expiration_minutes) - _SIGNED_URL_REUSE_WINDOW
+        if cached is not None and cached[1] - now >= min_remaining:
+            _signed_url_cache.move_to_end(key)
+            return cached
+        
+        signed_url = await self._sign_blob(blob_name, bucket_name, expiration_minutes)
+        entry = (signed_url, now + timedelta(minutes=expiration_minutes))
+        
+        _signed_url_cache[key] = entry
+        _signed_url_cache.move_to_end(key)
+        if len(_signed_url_cache) > _SIGNED_URL_CACHE_SIZE:
+            _signed_url_cache.popitem(last=False)
+        
+        return entry
+    
+    def _iter_categorized(
+        self,
+        blob_names: Iterable[str],
+        include_types: Optional[List[str]] = None
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Categorize artifact blobs by type.
+        
+        Args:
+            blob_names: Blob names
+            include_types: List of types to include (None = all)
+            
+        Yields:
+            (artifact type, blob name) pairs in blob order
+        """
+        # Categorize based on filename patterns; default to model file
+        classify = _classify_filename
         
-        # Remove empty categories
-        categorized = {k: v for k, v in categorized.items() if v}
+        if include_types is None:
+            for blob_name in blob_names:
+                yield classify(blob_name.rpartition("/")[2]), blob_name
+            return
         
-        return categorized
+        included = frozenset(include_types)
+        for blob_name in blob_names:
+            artifact_type = classify(blob_name.rpartition("/")[2])
+            if artifact_type in included:
+                yield artifact_type, blob_name
     
     async def validate_artifacts(
         self,
         artifact_base_path: str,
-        required_files: Optional[List[str]] = None
+        required_files: Optional[List[str]] = None,
+        all_blobs: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Validate that required model artifacts exist.
@@ -235,6 +626,7 @@ class ModelArtifactHandler:
         Args:
             artifact_base_path: Base GCS path for model artifacts
             required_files: List of required filenames (None = check any exist)
+            all_blobs: Listing from list_artifacts, to skip listing again
             
         Returns:
             Dictionary with validation results
@@ -242,28 +634,21 @@ class ModelArtifactHandler:
         logger.info(f"Validating artifacts at {artifact_base_path}")
         
         try:
-            # Parse GCS path
-            if not artifact_base_path.startswith("gs://"):
-                artifact_base_path = f"gs://{self.bucket_name}/{artifact_base_path}"
-            
-            path_parts = artifact_base_path.replace("gs://", "").split("/", 1)
-            bucket_name = path_parts[0]
-            blob_prefix = path_parts[1] if len(path_parts) > 1 else ""
-            
-            # List all artifacts
-            all_blobs = await list_blobs(
-                prefix=blob_prefix,
-                bucket_name=bucket_name
+            validated_at = _utcnow_iso()
+            artifact_base_path, _, all_blobs = await self._enumerate_once(
+                artifact_base_path, all_blobs
             )
             
+            found_files = [blob.rpartition("/")[2] for blob in all_blobs]
+            
             validation_result = {
                 "valid": False,
                 "artifact_base_path": artifact_base_path,
                 "total_files": len(all_blobs),
                 "required_files": required_files or [],
                 "missing_files": [],
-                "found_files": [blob.split("/")[-1] for blob in all_blobs],
-                "validated_at": datetime.utcnow().isoformat()
+                "found_files": found_files,
+                "validated_at": validated_at
             }
             
             # Check if any artifacts exist
@@ -278,12 +663,11 @@ class ModelArtifactHandler:
                 logger.info(f"Artifacts validated: {len(all_blobs)} files found")
                 return validation_result
             
-            # Check for required files
-            found_filenames = {blob.split("/")[-1] for blob in all_blobs}
+            # Check for required files, reporting misses in the order requested
+            missing = set(required_files).difference(found_files)
             missing_files = [
-                req_file for req_file in required_files 
-                if req_file not in found_filenames
-            ]
+                req_file for req_file in required_files if req_file in missing
+            ] if missing else []
             
             validation_result["missing_files"] = missing_files
             validation_result["valid"] = len(missing_files) == 0
@@ -305,13 +689,15 @@ class ModelArtifactHandler:
     
     async def get_artifact_metadata(
         self,
-        artifact_base_path: str
+        artifact_base_path: str,
+        all_blobs: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Extract metadata from model artifacts.
         
         Args:
             artifact_base_path: Base GCS path for model artifacts
+            all_blobs: Listing from list_artifacts, to skip listing again
             
         Returns:
             Dictionary with artifact metadata
@@ -319,43 +705,44 @@ class ModelArtifactHandler:
         logger.info(f"Extracting artifact metadata from {artifact_base_path}")
         
         try:
-            # Parse GCS path
-            if not artifact_base_path.startswith("gs://"):
-                artifact_base_path = f"gs://{self.bucket_name}/{artifact_base_path}"
-            
-            path_parts = artifact_base_path.replace("gs://", "").split("/", 1)
-            bucket_name = path_parts[0]
-            blob_prefix = path_parts[1] if len(path_parts) > 1 else ""
+            extracted_at = _utcnow_iso()
+            artifact_base_path, bucket_name, all_blobs = await self._enumerate_once(
+                artifact_base_path, all_blobs
+            )
             
             # Look for metadata files
             metadata_blobs = []
-            all_blobs = await list_blobs(
-                prefix=blob_prefix,
-                bucket_name=bucket_name
-            )
             
             for blob_name in all_blobs:
-                filename = blob_name.split("/")[-1].lower()
-                if any(keyword in filename for keyword in ['metadata', 'config', 'info']):
-                    if filename.endswith('.json'):
-                        metadata_blobs.append(blob_name)
+                filename = blob_name.rpartition("/")[2].lower()
+                if filename.endswith('.json') and any(
+                    keyword in filename for keyword in _METADATA_FILE_KEYWORDS
+                ):
+                    metadata_blobs.append(blob_name)
             
             metadata = {
                 "artifact_base_path": artifact_base_path,
                 "has_metadata": len(metadata_blobs) > 0,
                 "metadata_files": metadata_blobs,
-                "extracted_at": datetime.utcnow().isoformat()
+                "extracted_at": extracted_at
             }
             
-            # Try to read first metadata file if exists
+            # Read the metadata files concurrently, one ranged GET each
             if metadata_blobs:
-                try:
-                    # For now, just return the list of metadata files
-                    # In production, you might want to download and parse them
-                    metadata["metadata_available"] = True
-                except Exception as e:
-                    logger.warning(f"Could not read metadata file: {e}")
-                    metadata["metadata_available"] = False
+                contents = await asyncio.gather(
+                    *(self._peek_json(bucket_name, blob_name) for blob_name in metadata_blobs),
+                    return_exceptions=True
+                )
+                
+                parsed = {}
+                for blob_name, content in zip(metadata_blobs, contents):
+                    if isinstance(content, Exception):
+                        logger.warning(f"Could not read metadata file {blob_name}: {content}")
+                    else:
+                        parsed[blob_name] = content
+                
+                metadata["metadata"] = parsed
+                metadata["metadata_available"] = bool(parsed)
             
             return metadata
             
@@ -367,6 +754,35 @@ class ModelArtifactHandler:
                 "error": str(e)
             }
     
+    async def _peek_json(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        max_bytes: int = _METADATA_PEEK_BYTES
+    ) -> Any:
+        """
+        Read and parse a small JSON blob with a single ranged download.
+        
+        Args:
+            bucket_name: Bucket containing the blob
+            blob_name: Path to the blob in GCS
+            max_bytes: Maximum number of bytes to read
+            
+        Returns:
+            Parsed JSON content
+            
+        Raises:
+            ValueError: If the blob is larger than max_bytes
+        """
+        blob = self.storage_client.bucket(bucket_name).blob(blob_name)
+        data = await asyncio.to_thread(blob.download_as_bytes, start=0, end=max_bytes)
+        
+        # end is inclusive, so one byte past the limit means the file is larger
+        if len(data) > max_bytes:
+            raise ValueError(f"Metadata file exceeds {max_bytes} bytes")
+        
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    
     async def generate_download_instructions(
         self,
         model_id: str,
@@ -386,11 +802,12 @@ class ModelArtifactHandler:
         """
         logger.info(f"Generating download instructions for model: {model_id}")
         
+        artifacts = download_package.get("artifacts", {})
         instructions = {
             "model_id": model_id,
             "summary": f"Model artifacts ready for download ({download_package.get('total_files', 0)} files)",
             "expiration": download_package.get("expires_at"),
-            "artifact_categories": list(download_package.get("artifacts", {}).keys()),
+            "artifact_categories": list(artifacts),
             "instructions": []
         }
         
@@ -409,49 +826,19 @@ class ModelArtifactHandler:
         
         # Add code examples if requested
         if include_code_examples:
+            # Serialize the artifact tree once for all examples that embed it
+            artifacts_json = _dumps_indented(artifacts)
             instructions["code_examples"] = {
-                "python": self._generate_python_download_example(download_package),
+                "python": self._generate_python_download_example(artifacts_json),
                 "curl": self._generate_curl_download_example(download_package),
-                "javascript": self._generate_javascript_download_example(download_package)
+                "javascript": self._generate_javascript_download_example(artifacts_json)
             }
         
         return instructions
     
-    def _generate_python_download_example(
-        self,
-        download_package: Dict[str, Any]
-    ) -> str:
+    def _generate_python_download_example(self, artifacts_json: str) -> str:
         """Generate Python code example for downloading artifacts."""
-        return """
-import requests
-import os
-from pathlib import Path
-
-# Create download directory
-download_dir = Path("model_artifacts")
-download_dir.mkdir(exist_ok=True)
-
-# Download all artifacts
-artifacts = {artifacts_json}
-
-for artifact_type, files in artifacts.items():
-    type_dir = download_dir / artifact_type
-    type_dir.mkdir(exist_ok=True)
-    
-    for file_info in files:
-        filename = file_info['filename']
-        url = file_info['download_url']
-        
-        print(f"Downloading {{filename}}...")
-        response = requests.get(url)
-        response.raise_for_status()
-        
-        filepath = type_dir / filename
-        filepath.write_bytes(response.content)
-        print(f"Saved to {{filepath}}")
-
-print("All artifacts downloaded successfully!")
-""".replace("{artifacts_json}", json.dumps(download_package.get("artifacts", {}), indent=2))
+        return _PYTHON_EXAMPLE_HEAD + artifacts_json + _PYTHON_EXAMPLE_TAIL
     
     def _generate_curl_download_example(
         self,
@@ -464,12 +851,17 @@ print("All artifacts downloaded successfully!")
             return "# No artifacts available"
         
         # Get first artifact as example
-        first_type = list(artifacts.keys())[0]
-        first_file = artifacts[first_type][0] if artifacts[first_type] else None
+        files = next(iter(artifacts.values()))
+        first_file = files[0] if files else None
         
         if not first_file:
             return "# No artifacts available"
         
+        # Packages from prepare_model_download hold ArtifactEntry records;
+        # packages rebuilt from JSON hold plain dictionaries
+        if isinstance(first_file, ArtifactEntry):
+            first_file = first_file.to_dict()
+        
         return f"""
 # Download single artifact
 curl -o "{first_file['filename']}" "{first_file['download_url']}"
@@ -478,39 +870,6 @@ curl -o "{first_file['filename']}" "{first_file['download_url']}"
 # Save URLs to a file and use wget or curl in a loop
 """
     
-    def _generate_javascript_download_example(
-        self,
-        download_package: Dict[str, Any]
-    ) -> str:
+    def _generate_javascript_download_example(self, artifacts_json: str) -> str:
         """Generate JavaScript code example for downloading artifacts."""
-        return """
-// Download artifacts using fetch API
-const artifacts = {artifacts_json};
-
-async function downloadArtifacts() {
-  for (const [artifactType, files] of Object.entries(artifacts)) {
-    for (const fileInfo of files) {
-      console.log(`Downloading ${fileInfo.filename}...`);
-      
-      const response = await fetch(fileInfo.download_url);
-      const blob = await response.blob();
-      
-      // Create download link
-      const url = window.URL.createObjectURL(blob);
-      const a = document.createElement('a');
-      a.href = url;
-      a.download = fileInfo.filename;
-      document.body.appendChild(a);
-      a.click();
-      document.body.removeChild(a);
-      window.URL.revokeObjectURL(url);
-      
-      console.log(`Downloaded ${fileInfo.filename}`);
-    }
-  }
-  
-  console.log('All artifacts downloaded!');
-}
-
-downloadArtifacts();
-""".replace("{artifacts_json}", json.dumps(download_package.get("artifacts", {}), indent=2))
+        return _JAVASCRIPT_EXAMPLE_HEAD + artifacts_json + _JAVASCRIPT_EXAMPLE_TAIL
@@ -6,8 +6,12 @@ Vertex AI deployment with GCS storage for model artifacts, signed URLs,
 health checking, and error handling with fallback strategies.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -25,6 +29,70 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent signed URL requests per artifact
+_SIGNING_CONCURRENCY = 32
+
+# GCS V4 signed URLs cannot outlive seven days
+_MAX_SIGNED_URL_HOURS = 168
+
+# Cached URLs are handed out only while they keep all but this much of the
+# requested lifetime, so callers never receive one about to expire
+_SIGNED_URL_SAFETY_MARGIN = timedelta(minutes=5)
+_SIGNED_URL_CACHE_SIZE = 10_000
+
+# (model_id, bucket, blob, expiration_hours) -> (signed URL, expiry, expiry ISO)
+_signed_url_cache: "OrderedDict[Tuple[str, str, str, int], Tuple[str, datetime, str]]" = OrderedDict()
+
+# Artifact listings are reused for this long, so dashboard polls and the
+# info/health paths of one request share a single list call. Empty listings
+# are not cached, so artifacts that land later show up on the next poll.
+_LISTING_TTL_SECONDS = 30.0
+_LISTING_CACHE_SIZE = 1024
+
+# (bucket, prefix) -> (monotonic time listed, blob names)
+_listing_cache: "OrderedDict[Tuple[str, str], Tuple[float, Tuple[str, ...]]]" = OrderedDict()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_gs_uri(uri: str) -> Tuple[str, str]:
+    """
+    Split a gs:// URI into (bucket name, blob prefix).
+    
+    Raises:
+        ValueError: If the URI does not use the gs:// scheme
+    """
+    if not uri.startswith("gs://"):
+        raise ValueError(f"Invalid GCS path: {uri}")
+    
+    bucket_name, _, blob_prefix = uri.removeprefix("gs://").partition("/")
+    return bucket_name, blob_prefix
+
+
+async def _list_artifact_blobs(bucket_name: str, blob_prefix: str) -> List[str]:
+    """
+    List blobs under a prefix, reusing a non-empty listing from the last 30 seconds.
+    
+    Returns a new list on every call; the cache keeps its own immutable copy.
+    """
+    key = (bucket_name, blob_prefix)
+    now = time.monotonic()
+    
+    cached = _listing_cache.get(key)
+    if cached is not None and now - cached[0] < _LISTING_TTL_SECONDS:
+        return list(cached[1])
+    
+    blobs = await list_blobs(prefix=blob_prefix, bucket_name=bucket_name)
+    if not blobs:
+        _listing_cache.pop(key, None)
+        return blobs
+    
+    _listing_cache[key] = (now, tuple(blobs))
+    _listing_cache.move_to_end(key)
+    if len(_listing_cache) > _LISTING_CACHE_SIZE:
+        _listing_cache.popitem(last=False)
+    
+    return blobs
+
 
 class DeploymentStrategy(Enum):
     """Deployment strategy enumeration."""
@@ -198,7 +266,8 @@ class ModelDeploymentService:
         self,
         model_id: str,
         artifact_path: str,
-        expiration_hours: int = 24
+        expiration_hours: int = 24,
+        artifact_blobs: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Prepare model artifact for download with signed URLs.
@@ -206,7 +275,8 @@ class ModelDeploymentService:
         Args:
             model_id: Unique model identifier
             artifact_path: GCS path to model artifacts
-            expiration_hours: URL expiration time in hours
+            expiration_hours: URL expiration time in hours (capped at 7 days)
+            artifact_blobs: Blob names already listed under artifact_path
             
         Returns:
             Dictionary with artifact information and download URLs
@@ -217,19 +287,14 @@ class ModelDeploymentService:
         )
         
         try:
-            # Parse GCS path
-            if not artifact_path.startswith("gs://"):
-                raise ValueError(f"Invalid GCS path: {artifact_path}")
+            now = datetime.utcnow()
             
-            path_parts = artifact_path.replace("gs://", "").split("/", 1)
-            bucket_name = path_parts[0]
-            blob_prefix = path_parts[1] if len(path_parts) > 1 else ""
+            # Parse GCS path
+            bucket_name, blob_prefix = _parse_gs_uri(artifact_path)
             
             # List all artifact files
-            artifact_blobs = await list_blobs(
-                prefix=blob_prefix,
-                bucket_name=bucket_name
-            )
+            if artifact_blobs is None:
+                artifact_blobs = await _list_artifact_blobs(bucket_name, blob_prefix)
             
             if not artifact_blobs:
                 logger.warning(f"No artifacts found at {artifact_path}")
@@ -240,26 +305,49 @@ class ModelDeploymentService:
                     "files": []
                 }
             
-            # Generate signed URLs for each artifact file
-            artifact_files = []
-            for blob_name in artifact_blobs:
-                try:
-                    signed_url = await generate_signed_url(
-                        blob_name=blob_name,
-                        bucket_name=bucket_name,
-                        expiration_minutes=expiration_hours * 60
-                    )
+            # Generate signed URLs for all artifact files concurrently,
+            # reusing cached URLs that are still fresh enough
+            expiration_hours = min(expiration_hours, _MAX_SIGNED_URL_HOURS)
+            lifetime = timedelta(hours=expiration_hours)
+            expires_dt = now + lifetime
+            expires_at = expires_dt.isoformat()
+            semaphore = asyncio.Semaphore(_SIGNING_CONCURRENCY)
+            
+            async def sign_one(blob_name: str) -> Optional[Dict[str, Any]]:
+                key = (model_id, bucket_name, blob_name, expiration_hours)
+                cached = _signed_url_cache.get(key)
+                if cached is not None and cached[1] - now >= lifetime - _SIGNED_URL_SAFETY_MARGIN:
+                    _signed_url_cache.move_to_end(key)
+                    signed_url, _, url_expires_at = cached
+                else:
+                    async with semaphore:
+                        try:
+                            signed_url = await generate_signed_url(
+                                blob_name=blob_name,
+                                bucket_name=bucket_name,
+                                expiration_minutes=expiration_hours * 60
+                            )
+                        except Exception as e:
+                            logger.error(f"Failed to generate signed URL for {blob_name}: {e}")
+                            return None
                     
-                    artifact_files.append({
-                        "filename": blob_name.split("/")[-1],
-                        "blob_path": blob_name,
-                        "download_url": signed_url,
-                        "expires_at": (
-                            datetime.utcnow() + timedelta(hours=expiration_hours)
-                        ).isoformat()
-                    })
-                except Exception as e:
-                    logger.error(f"Failed to generate signed URL for {blob_name}: {e}")
+                    url_expires_at = expires_at
+                    _signed_url_cache[key] = (signed_url, expires_dt, expires_at)
+                    _signed_url_cache.move_to_end(key)
+                    if len(_signed_url_cache) > _SIGNED_URL_CACHE_SIZE:
+                        _signed_url_cache.popitem(last=False)
+                
+                return {
+                    "filename": blob_name.split("/")[-1],
+                    "blob_path": blob_name,
+                    "download_url": signed_url,
+                    "expires_at": url_expires_at
+                }
+            
+            results = await asyncio.gather(
+                *(sign_one(blob_name) for blob_name in artifact_blobs)
+            )
+            artifact_files = [entry for entry in results if entry is not None]
             
             artifact_info = {
                 "model_id": model_id,
@@ -267,7 +355,7 @@ class ModelDeploymentService:
                 "available": len(artifact_files) > 0,
                 "files": artifact_files,
                 "file_count": len(artifact_files),
-                "prepared_at": datetime.utcnow().isoformat()
+                "prepared_at": now.isoformat()
             }
             
             logger.info(
@@ -286,10 +374,31 @@ class ModelDeploymentService:
                 "files": []
             }
     
+    def invalidate_model(self, model_id: str, artifact_path: Optional[str] = None) -> int:
+        """
+        Drop cached signed URLs for a model, e.g. after it is redeployed.
+        
+        Args:
+            model_id: Unique model identifier
+            artifact_path: GCS path to the model's artifacts, whose cached
+                listing is dropped too
+            
+        Returns:
+            Number of cached URLs removed
+        """
+        if artifact_path is not None:
+            _listing_cache.pop(_parse_gs_uri(artifact_path), None)
+        
+        stale = [key for key in _signed_url_cache if key[0] == model_id]
+        for key in stale:
+            del _signed_url_cache[key]
+        return len(stale)
+    
     async def check_deployment_health(
         self,
         endpoint_resource_name: Optional[str] = None,
-        artifact_path: Optional[str] = None
+        artifact_path: Optional[str] = None,
+        artifact_blobs: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Check health of deployed model (endpoint and/or artifacts).
@@ -297,56 +406,64 @@ class ModelDeploymentService:
         Args:
             endpoint_resource_name: Vertex AI endpoint resource name
             artifact_path: GCS path to model artifacts
+            artifact_blobs: Blob names already listed under artifact_path
             
         Returns:
             Dictionary with health status information
         """
         logger.info("Checking deployment health")
+        checked_at = datetime.utcnow().isoformat()
         
-        health_status = {
-            "checked_at": datetime.utcnow().isoformat(),
-            "endpoint_health": None,
-            "artifact_health": None,
-            "overall_healthy": False
-        }
-        
-        # Check endpoint health
+        # Check endpoint health and artifact availability concurrently
+        probes = {}
         if endpoint_resource_name:
-            try:
-                endpoint_health = await self.vertex_deployment.check_endpoint_health(
-                    endpoint_resource_name
-                )
-                health_status["endpoint_health"] = endpoint_health
-            except Exception as e:
-                logger.error(f"Endpoint health check failed: {e}")
-                health_status["endpoint_health"] = {
-                    "is_healthy": False,
-                    "error": str(e)
-                }
-        
-        # Check artifact availability
+            probes["endpoint_health"] = self._probe_endpoint(endpoint_resource_name)
         if artifact_path:
-            try:
-                artifact_health = await self._check_artifact_health(artifact_path)
-                health_status["artifact_health"] = artifact_health
-            except Exception as e:
-                logger.error(f"Artifact health check failed: {e}")
-                health_status["artifact_health"] = {
-                    "available": False,
-                    "error": str(e)
-                }
+            probes["artifact_health"] = self._probe_artifacts(
+                artifact_path, artifact_blobs, checked_at
+            )
         
+        results = dict(zip(probes, await asyncio.gather(*probes.values())))
+        
+        return self._summarize_health(
+            results.get("endpoint_health"),
+            results.get("artifact_health"),
+            checked_at
+        )
+    
+    @staticmethod
+    def _summarize_health(
+        endpoint_health: Optional[Dict[str, Any]],
+        artifact_health: Optional[Dict[str, Any]],
+        checked_at: str
+    ) -> Dict[str, Any]:
+        """
+        Build the health status from endpoint and artifact probe results.
+        
+        Args:
+            endpoint_health: Endpoint probe result (None if not checked)
+            artifact_health: Artifact probe result (None if not checked)
+            checked_at: ISO timestamp of the check
+            
+        Returns:
+            Dictionary with health status information
+        """
         # Determine overall health
         endpoint_healthy = (
-            health_status["endpoint_health"] 
-            and health_status["endpoint_health"].get("is_healthy", False)
+            endpoint_health
+            and endpoint_health.get("is_healthy", False)
         )
         artifact_available = (
-            health_status["artifact_health"] 
-            and health_status["artifact_health"].get("available", False)
+            artifact_health
+            and artifact_health.get("available", False)
         )
         
-        health_status["overall_healthy"] = endpoint_healthy or artifact_available
+        health_status = {
+            "checked_at": checked_at,
+            "endpoint_health": endpoint_health,
+            "artifact_health": artifact_health,
+            "overall_healthy": endpoint_healthy or artifact_available
+        }
         
         logger.info(
             f"Health check complete: overall_healthy={health_status['overall_healthy']}"
@@ -354,39 +471,70 @@ class ModelDeploymentService:
         
         return health_status
     
+    async def _probe_endpoint(self, endpoint_resource_name: str) -> Dict[str, Any]:
+        """Check endpoint health, reporting failures as an unhealthy result."""
+        try:
+            return await self.vertex_deployment.check_endpoint_health(
+                endpoint_resource_name
+            )
+        except Exception as e:
+            logger.error(f"Endpoint health check failed: {e}")
+            return {
+                "is_healthy": False,
+                "error": str(e)
+            }
+    
+    async def _probe_artifacts(
+        self,
+        artifact_path: str,
+        artifact_blobs: Optional[List[str]] = None,
+        checked_at: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Check artifact availability, reporting failures as unavailable."""
+        try:
+            return await self._check_artifact_health(
+                artifact_path, artifact_blobs, checked_at
+            )
+        except Exception as e:
+            logger.error(f"Artifact health check failed: {e}")
+            return {
+                "available": False,
+                "error": str(e)
+            }
+    
     async def _check_artifact_health(
         self,
-        artifact_path: str
+        artifact_path: str,
+        artifact_blobs: Optional[List[str]] = None,
+        checked_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Check if model artifacts are available in GCS.
         
         Args:
             artifact_path: GCS path to model artifacts
+            artifact_blobs: Blob names already listed under artifact_path
+            checked_at: ISO timestamp shared by the enclosing check (defaults to now)
             
         Returns:
             Dictionary with artifact availability information
         """
         try:
             # Parse GCS path
-            if not artifact_path.startswith("gs://"):
+            try:
+                bucket_name, blob_prefix = _parse_gs_uri(artifact_path)
+            except ValueError:
                 return {"available": False, "error": "Invalid GCS path"}
             
-            path_parts = artifact_path.replace("gs://", "").split("/", 1)
-            bucket_name = path_parts[0]
-            blob_prefix = path_parts[1] if len(path_parts) > 1 else ""
-            
             # Check if artifacts exist
-            artifact_blobs = await list_blobs(
-                prefix=blob_prefix,
-                bucket_name=bucket_name
-            )
+            if artifact_blobs is None:
+                artifact_blobs = await _list_artifact_blobs(bucket_name, blob_prefix)
             
             return {
                 "available": len(artifact_blobs) > 0,
                 "artifact_path": artifact_path,
                 "file_count": len(artifact_blobs),
-                "checked_at": datetime.utcnow().isoformat()
+                "checked_at": checked_at or datetime.utcnow().isoformat()
             }
             
         except Exception as e:
@@ -414,44 +562,68 @@ class ModelDeploymentService:
             Dictionary with complete deployment information
         """
         logger.info(f"Getting deployment info for model: {model_id}")
+        retrieved_at = datetime.utcnow().isoformat()
         
         deployment_info = {
             "model_id": model_id,
             "endpoint_info": None,
             "artifact_info": None,
             "health_status": None,
-            "retrieved_at": datetime.utcnow().isoformat()
+            "retrieved_at": retrieved_at
         }
         
-        # Get endpoint information
+        # Fetch each source exactly once, concurrently: one endpoint probe
+        # and one artifact listing back every section of the response
+        fetches = {}
         if endpoint_resource_name:
-            try:
-                endpoint_health = await self.vertex_deployment.check_endpoint_health(
-                    endpoint_resource_name
-                )
-                deployment_info["endpoint_info"] = endpoint_health
-            except Exception as e:
-                logger.error(f"Failed to get endpoint info: {e}")
-                deployment_info["endpoint_info"] = {"error": str(e)}
+            fetches["endpoint"] = self.vertex_deployment.check_endpoint_health(
+                endpoint_resource_name
+            )
+        if artifact_path and artifact_path.startswith("gs://"):
+            fetches["blobs"] = _list_artifact_blobs(*_parse_gs_uri(artifact_path))
+        
+        fetched = dict(zip(
+            fetches,
+            await asyncio.gather(*fetches.values(), return_exceptions=True)
+        ))
         
-        # Get artifact information
+        endpoint_health = None
+        if endpoint_resource_name:
+            endpoint = fetched["endpoint"]
+            if isinstance(endpoint, Exception):
+                logger.error(f"Failed to get endpoint info: {endpoint}")
+                deployment_info["endpoint_info"] = {"error": str(endpoint)}
+                endpoint_health = {"is_healthy": False, "error": str(endpoint)}
+            else:
+                deployment_info["endpoint_info"] = endpoint_health = endpoint
+        
+        artifact_health = None
         if artifact_path:
-            try:
-                artifact_info = await self.prepare_model_artifact(
+            artifact_blobs = fetched.get("blobs")
+            if isinstance(artifact_blobs, Exception):
+                logger.error(f"Failed to list artifacts at {artifact_path}: {artifact_blobs}")
+                deployment_info["artifact_info"] = {
+                    "model_id": model_id,
+                    "artifact_path": artifact_path,
+                    "available": False,
+                    "error": str(artifact_blobs),
+                    "files": []
+                }
+                artifact_health = {"available": False, "error": str(artifact_blobs)}
+            else:
+                # With the listing in hand only signing does any I/O
+                deployment_info["artifact_info"] = await self.prepare_model_artifact(
                     model_id=model_id,
                     artifact_path=artifact_path,
-                    expiration_hours=1  # Short expiration for info retrieval
+                    expiration_hours=1,  # Short expiration for info retrieval
+                    artifact_blobs=artifact_blobs
+                )
+                artifact_health = await self._check_artifact_health(
+                    artifact_path, artifact_blobs, retrieved_at
                 )
-                deployment_info["artifact_info"] = artifact_info
-            except Exception as e:
-                logger.error(f"Failed to get artifact info: {e}")
-                deployment_info["artifact_info"] = {"error": str(e)}
         
-        # Get health status
-        health_status = await self.check_deployment_health(
-            endpoint_resource_name=endpoint_resource_name,
-            artifact_path=artifact_path
+        deployment_info["health_status"] = self._summarize_health(
+            endpoint_health, artifact_health, retrieved_at
         )
-        deployment_info["health_status"] = health_status
         
         return deployment_info
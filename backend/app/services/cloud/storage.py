@@ -1,5 +1,6 @@
 """GCS storage utilities and helper functions."""
 
+import asyncio
 import logging
 import os
 from pathlib import Path
@@ -338,11 +339,13 @@ async def generate_signed_url(
     from datetime import timedelta
     
     bucket_name = bucket_name or settings.GCS_BUCKET_NAME
-    client = storage.Client(project=settings.GOOGLE_CLOUD_PROJECT)
+    client = get_gcs_client()
     bucket = client.bucket(bucket_name)
     blob = bucket.blob(blob_name)
     
-    url = blob.generate_signed_url(
+    # Signing is RSA work or an IAM SignBlob call; keep it off the event loop
+    url = await asyncio.to_thread(
+        blob.generate_signed_url,
         version="v4",
         expiration=timedelta(minutes=expiration_minutes),
         method="GET"
@@ -110,7 +110,8 @@ class VertexAutoMLManager:
                 "target_column": target_column,
                 "optimization_objective": optimization_objective,
                 "budget_milli_node_hours": budget_milli_node_hours,
-                "training_type": "automl_tabular"
+                "training_type": "automl_tabular",
+                "model_resource_name": model.resource_name if model else None
             }
             
             logger.info(f"AutoML Tabular job created: {job_info['job_id']}")
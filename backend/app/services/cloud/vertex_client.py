@@ -5,6 +5,7 @@ This module provides a unified interface for interacting with Google Cloud
 Vertex AI services, including AutoML and Custom Training jobs.
 """
 
+import functools
 import logging
 from typing import Dict, Any, Optional, List
 
@@ -54,7 +55,7 @@ class VertexAIClient:
         # Initialize specialized managers
         self.automl = VertexAutoMLManager(self.project, self.location)
         self.custom = VertexCustomTrainingManager(self.project, self.location)
-        self.jobs = VertexJobManager()
+        self.jobs = VertexJobManager(self.project, self.location)
         self.deployment = VertexDeploymentManager(self.project, self.location)
         
         logger.info(
@@ -134,6 +135,33 @@ class VertexAIClient:
         """Delegate to job manager."""
         return await self.jobs.get_job_status(job_resource_name)
     
+    async def wait_for_job_completion(
+        self,
+        job_resource_name: str,
+        timeout_seconds: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a job submitted by this client to finish.
+        
+        Returns:
+            Final job status, or None if the job is not tracked by this client
+            or did not finish within the timeout (callers fall back to polling)
+        """
+        job = self.custom.submitted_jobs.pop(job_resource_name, None)
+        if job is None:
+            return None
+        if not await self.jobs.wait_for_job(job, timeout_seconds):
+            return None
+        return await self.jobs.get_job_status(job_resource_name)
+    
+    async def wait_for_terminal_status(
+        self,
+        job_resource_name: str,
+        poll_interval_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Wait for a job's terminal status via the shared batched poller."""
+        return await self.jobs.poller.wait(job_resource_name, poll_interval_seconds)
+    
     async def cancel_job(self, job_resource_name: str) -> bool:
         """Delegate to job manager."""
         return await self.jobs.cancel_job(job_resource_name)
@@ -173,3 +201,19 @@ class VertexAIClient:
             endpoint_resource_name=endpoint_resource_name,
             instances=instances
         )
+
+
+@functools.lru_cache(maxsize=1)
+def get_cached_vertex_client(
+    project: Optional[str] = None,
+    location: Optional[str] = None
+) -> VertexAIClient:
+    """
+    Get a shared Vertex AI client for the given project and location.
+    
+    Creating a client initializes the SDK, so managers running concurrently
+    reuse one instance instead of each building their own. Its async service
+    stubs are created per event loop, so the cached client is safe to use
+    across asyncio.run calls.
+    """
+    return VertexAIClient(project=project, location=location)
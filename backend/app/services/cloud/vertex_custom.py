@@ -24,6 +24,8 @@ class VertexCustomTrainingManager:
         """
         self.project = project
         self.location = location
+        # Jobs started asynchronously, by resource name, until awaited
+        self.submitted_jobs: Dict[str, aiplatform.CustomTrainingJob] = {}
     
     async def create_custom_training_job(
         self,
@@ -123,6 +125,8 @@ class VertexCustomTrainingManager:
                 "training_type": "custom"
             }
             
+            self.submitted_jobs[job.resource_name] = job
+            
             logger.info(f"Custom training job created: {job_info['job_id']}")
             return job_info
             
@@ -2,13 +2,20 @@
 Vertex AI job monitoring and management.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Any, Iterable, Optional
 from enum import Enum
 
 from google.cloud import aiplatform
+from google.cloud import aiplatform_v1
 from google.api_core import exceptions as google_exceptions
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,9 +32,112 @@ class JobState(str, Enum):
     EXPIRED = "JOB_STATE_EXPIRED"
 
 
+# Custom jobs report JobState; AutoML and script-based jobs run as training
+# pipelines, which report PipelineState
+SUCCEEDED_STATES = frozenset((
+    JobState.SUCCEEDED.value,
+    "PIPELINE_STATE_SUCCEEDED",
+))
+FAILED_STATES = frozenset((
+    JobState.FAILED.value,
+    "PIPELINE_STATE_FAILED",
+))
+TERMINAL_STATES = SUCCEEDED_STATES | FAILED_STATES | frozenset((
+    JobState.CANCELLED.value,
+    JobState.EXPIRED.value,
+    "PIPELINE_STATE_CANCELLED",
+))
+
+# Batched polling schedule (seconds): poll quickly after a job is registered so
+# short jobs and fast failures return promptly, then back off and hold
+_POLL_INTERVALS = (2, 3, 5, 10, 15, 20, 30, 45, 60)
+
+# Scale the schedule with activity: few jobs means someone is likely waiting
+# on each, many jobs means larger list responses per poll
+_QUIET_JOB_COUNT = 3
+_BUSY_JOB_COUNT = 10
+
+# SDK job.wait() blocks a thread for the whole training run and cannot be
+# cancelled, so these waits get their own small pool instead of the default
+# executor that GCS uploads and URL signing share. Jobs beyond the pool size
+# are monitored by the batched poller instead.
+_JOB_WAIT_THREADS = 8
+_job_wait_executor = ThreadPoolExecutor(
+    max_workers=_JOB_WAIT_THREADS, thread_name_prefix="vertex-job-wait"
+)
+_job_wait_slots = threading.BoundedSemaphore(_JOB_WAIT_THREADS)
+
+# Margin on the update_time filter to absorb clock skew between us and Vertex
+_UPDATE_TIME_SLACK = timedelta(minutes=1)
+
+
+def _is_pipeline(job_resource_name: str) -> bool:
+    return "trainingPipelines" in job_resource_name or "autoMlTabularTrainingJobs" in job_resource_name
+
+
 class VertexJobManager:
     """Manager for Vertex AI job monitoring and control."""
     
+    def __init__(self, project: Optional[str] = None, location: Optional[str] = None):
+        """
+        Initialize job manager.
+        
+        Args:
+            project: GCP project ID, used as the parent for batched listing
+            location: GCP region, used to pick the regional API endpoint
+        """
+        self.project = project
+        self.location = location
+        # grpc-aio stubs and the poller's task are bound to the event loop they
+        # were created on, so each running loop gets its own (scripts and tests
+        # may call asyncio.run more than once)
+        self._by_loop: Dict[asyncio.AbstractEventLoop, Dict[Any, Any]] = {}
+    
+    def _client_options(self) -> Optional[Dict[str, str]]:
+        if not self.location:
+            return None
+        return {"api_endpoint": f"{self.location}-aiplatform.googleapis.com"}
+    
+    def _loop_local(self, key: Any, factory: Callable[[], Any]) -> Any:
+        """Object for the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        objects = self._by_loop.get(loop)
+        if objects is None:
+            # Objects bound to closed loops can never be used again
+            for closed_loop in [other for other in self._by_loop if other.is_closed()]:
+                del self._by_loop[closed_loop]
+            objects = self._by_loop[loop] = {}
+        
+        obj = objects.get(key)
+        if obj is None:
+            obj = objects[key] = factory()
+        return obj
+    
+    def _stub(self, stub_class: Callable[..., Any]) -> Any:
+        return self._loop_local(
+            stub_class, lambda: stub_class(client_options=self._client_options())
+        )
+    
+    @property
+    def job_service(self) -> aiplatform_v1.JobServiceAsyncClient:
+        """Async JobService stub for the running event loop."""
+        return self._stub(aiplatform_v1.JobServiceAsyncClient)
+    
+    @property
+    def pipeline_service(self) -> aiplatform_v1.PipelineServiceAsyncClient:
+        """Async PipelineService stub for the running event loop."""
+        return self._stub(aiplatform_v1.PipelineServiceAsyncClient)
+    
+    @property
+    def model_service(self) -> aiplatform_v1.ModelServiceAsyncClient:
+        """Async ModelService stub for the running event loop."""
+        return self._stub(aiplatform_v1.ModelServiceAsyncClient)
+    
+    @property
+    def poller(self) -> "JobStatusPoller":
+        """Batched status poller for the running event loop."""
+        return self._loop_local(JobStatusPoller, lambda: JobStatusPoller(self))
+    
     async def get_job_status(self, job_resource_name: str) -> Dict[str, Any]:
         """
         Get the status of a training job.
@@ -41,35 +151,15 @@ class VertexJobManager:
         try:
             # Determine job type from resource name
             # trainingPipelines are used by AutoML
-            if "trainingPipelines" in job_resource_name or "autoMlTabularTrainingJobs" in job_resource_name:
-                # Use get() method to retrieve existing job
-                job = aiplatform.AutoMLTabularTrainingJob.get(job_resource_name)
+            # Query the async stubs directly so polling never blocks the event loop
+            if _is_pipeline(job_resource_name):
+                job = await self.pipeline_service.get_training_pipeline(name=job_resource_name)
             elif "customJobs" in job_resource_name:
-                job = aiplatform.CustomTrainingJob.get(job_resource_name)
+                job = await self.job_service.get_custom_job(name=job_resource_name)
             else:
                 raise ValueError(f"Unknown job type: {job_resource_name}")
             
-            # Get job state
-            state = job.state.name if hasattr(job.state, 'name') else str(job.state)
-            
-            status = {
-                "job_id": job.name.split("/")[-1],
-                "resource_name": job_resource_name,
-                "state": state,
-                "display_name": job.display_name,
-                "create_time": job.create_time.isoformat() if job.create_time else None,
-                "start_time": job.start_time.isoformat() if job.start_time else None,
-                "end_time": job.end_time.isoformat() if job.end_time else None,
-                "update_time": job.update_time.isoformat() if job.update_time else None
-            }
-            
-            # Add error information if failed
-            if state == JobState.FAILED.value:
-                status["error"] = {
-                    "message": str(job.error) if hasattr(job, 'error') and job.error else "Unknown error"
-                }
-            
-            return status
+            return self._job_status(job_resource_name, job)
             
         except google_exceptions.NotFound:
             logger.error(f"Job not found: {job_resource_name}")
@@ -78,6 +168,105 @@ class VertexJobManager:
             logger.error(f"Failed to get job status: {e}")
             raise
     
+    @staticmethod
+    def _job_status(job_resource_name: str, job: Any) -> Dict[str, Any]:
+        """Build a status dictionary from a job or training pipeline resource."""
+        # Get job state
+        state = job.state.name if hasattr(job.state, 'name') else str(job.state)
+        
+        status = {
+            "job_id": job.name.split("/")[-1],
+            "resource_name": job_resource_name,
+            "state": state,
+            "display_name": job.display_name,
+            "create_time": job.create_time.isoformat() if job.create_time else None,
+            "start_time": job.start_time.isoformat() if job.start_time else None,
+            "end_time": job.end_time.isoformat() if job.end_time else None,
+            "update_time": job.update_time.isoformat() if job.update_time else None
+        }
+        
+        # Add error information if failed
+        if state in FAILED_STATES:
+            status["error"] = {
+                "message": str(job.error) if hasattr(job, 'error') and job.error else "Unknown error"
+            }
+        
+        return status
+    
+    async def list_job_statuses(
+        self,
+        job_resource_names: Iterable[str],
+        updated_since: datetime
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get statuses for several jobs with one list call per job type.
+        
+        Args:
+            job_resource_names: Full resource names of the jobs of interest
+            updated_since: Only jobs updated after this time are returned
+            
+        Returns:
+            Statuses keyed by resource name, for requested jobs updated since then
+        """
+        wanted = set(job_resource_names)
+        parent = f"projects/{self.project}/locations/{self.location}"
+        list_filter = f'update_time>"{updated_since.strftime("%Y-%m-%dT%H:%M:%SZ")}"'
+        
+        pagers = []
+        if any(_is_pipeline(name) for name in wanted):
+            pagers.append(await self.pipeline_service.list_training_pipelines(
+                parent=parent, filter=list_filter
+            ))
+        if any("customJobs" in name for name in wanted):
+            pagers.append(await self.job_service.list_custom_jobs(
+                parent=parent, filter=list_filter
+            ))
+        
+        statuses = {}
+        for pager in pagers:
+            async for job in pager:
+                if job.name in wanted:
+                    statuses[job.name] = self._job_status(job.name, job)
+        return statuses
+    
+    async def wait_for_job(self, job: Any, timeout_seconds: float) -> bool:
+        """
+        Wait for a job started with sync=False to reach a terminal state.
+        
+        Blocks on the SDK's completion future in a dedicated wait thread, so the
+        caller resumes as soon as the job finishes rather than on its next poll.
+        A thread stays occupied until its job ends, even after a timeout.
+        
+        Args:
+            job: Training job object returned from submission
+            timeout_seconds: Maximum time to wait
+            
+        Returns:
+            True if the job finished (successfully or not), False on timeout or
+            when every wait thread is busy (callers fall back to polling)
+        """
+        if not _job_wait_slots.acquire(blocking=False):
+            return False
+        
+        def wait() -> None:
+            try:
+                job.wait()
+            finally:
+                _job_wait_slots.release()
+        
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(
+                loop.run_in_executor(_job_wait_executor, wait),
+                timeout=timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            return False
+        except Exception as e:
+            # Failed jobs surface their error from wait(); the status carries it
+            logger.info(f"Job finished with error: {e}")
+        return True
+    
     async def cancel_job(self, job_resource_name: str) -> bool:
         """
         Cancel a running training job.
@@ -118,21 +307,23 @@ class VertexJobManager:
             Dictionary with evaluation metrics
         """
         try:
-            model = aiplatform.Model(model_resource_name)
+            # Single list RPC; the SDK's Model wrapper would fetch the model first
+            pager = await self.model_service.list_model_evaluations(
+                parent=model_resource_name, page_size=1
+            )
             
-            # Get model evaluations
-            evaluations = model.list_model_evaluations()
+            # Get the first (usually only) evaluation
+            evaluation = None
+            async for evaluation in pager:
+                break
             
-            if not evaluations:
+            if evaluation is None:
                 logger.warning(f"No evaluations found for model: {model_resource_name}")
                 return {}
             
-            # Get the first (usually only) evaluation
-            evaluation = evaluations[0]
-            
             metrics = {
                 "evaluation_id": evaluation.name.split("/")[-1],
-                "metrics": evaluation.metrics if hasattr(evaluation, 'metrics') else {},
+                "metrics": dict(evaluation.metrics) if evaluation.metrics else {},
                 "create_time": evaluation.create_time.isoformat() if evaluation.create_time else None
             }
             
@@ -142,3 +333,103 @@ class VertexJobManager:
         except Exception as e:
             logger.error(f"Failed to get model evaluation: {e}")
             raise
+
+
+class JobStatusPoller:
+    """
+    Shared poller that resolves many job waits from one list call per tick.
+    
+    Each monitored job registers a future; a single background task lists jobs
+    updated since the earliest registration and resolves the futures of those
+    that reached a terminal state. N concurrent jobs cost one request per tick
+    instead of N.
+    """
+    
+    def __init__(self, job_manager: VertexJobManager):
+        self._job_manager = job_manager
+        self._waiters: Dict[str, asyncio.Future] = {}
+        self._registered_at: Dict[str, datetime] = {}
+        self._max_intervals: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._tick = 0
+    
+    async def wait(
+        self,
+        job_resource_name: str,
+        poll_interval_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Wait until the job reaches a terminal state.
+        
+        Callers should check the job's current status before waiting, since
+        only updates after registration are observed. One waiter per job.
+        
+        Args:
+            job_resource_name: Full resource name of the job
+            poll_interval_seconds: Longest acceptable gap between polls for
+                this job; the shared poller polls at the smallest requested
+        
+        Returns:
+            Final job status
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[job_resource_name] = future
+        self._registered_at[job_resource_name] = datetime.now(timezone.utc)
+        if poll_interval_seconds is not None:
+            self._max_intervals[job_resource_name] = poll_interval_seconds
+        # Restart the backoff so a new job gets the fast early polls, but only
+        # while few jobs are watched; otherwise steady registrations would keep
+        # a busy poller at its fastest rate
+        if len(self._waiters) < _QUIET_JOB_COUNT:
+            self._tick = 0
+        
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        
+        try:
+            return await future
+        finally:
+            if self._waiters.get(job_resource_name) is future:
+                del self._waiters[job_resource_name]
+                del self._registered_at[job_resource_name]
+                self._max_intervals.pop(job_resource_name, None)
+    
+    def _next_interval(self) -> float:
+        interval = _POLL_INTERVALS[min(self._tick, len(_POLL_INTERVALS) - 1)]
+        
+        active_jobs = len(self._waiters)
+        if active_jobs < _QUIET_JOB_COUNT:
+            interval /= 2
+        elif active_jobs > _BUSY_JOB_COUNT:
+            interval *= 2
+        
+        return min(
+            interval,
+            settings.MAX_POLL_INTERVAL_SECONDS,
+            *self._max_intervals.values()
+        )
+    
+    async def _run(self) -> None:
+        try:
+            while self._waiters:
+                await asyncio.sleep(self._next_interval())
+                self._tick += 1
+                
+                if not self._waiters:
+                    break
+                since = min(self._registered_at.values()) - _UPDATE_TIME_SLACK
+                
+                try:
+                    statuses = await self._job_manager.list_job_statuses(list(self._waiters), since)
+                except Exception as e:
+                    logger.warning(f"Batched job status poll failed: {e}")
+                    continue
+                
+                for name, status in statuses.items():
+                    if status["state"] not in TERMINAL_STATES:
+                        continue
+                    future = self._waiters.get(name)
+                    if future is not None and not future.done():
+                        future.set_result(status)
+        finally:
+            self._task = None
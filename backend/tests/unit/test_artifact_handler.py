@@ -0,0 +1,110 @@
+"""
+Tests for model artifact download packaging.
+"""
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+from app.services.cloud import artifact_handler as artifact_handler_module
+from app.services.cloud.artifact_handler import ArtifactEntry, ModelArtifactHandler
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    """Artifact handler that signs URLs without GCS."""
+    handler = ModelArtifactHandler(bucket_name="bucket")
+
+    async def fake_sign(blob_name, bucket_name, expiration_minutes):
+        return f"https://signed.example/{blob_name}"
+
+    monkeypatch.setattr(handler, "_sign_blob", fake_sign)
+    return handler
+
+
+@pytest.fixture
+async def package(handler):
+    """Download package for a model file and a metrics file."""
+    return await handler.prepare_model_download(
+        "model-1",
+        "gs://bucket/models/model-1",
+        all_blobs=["models/model-1/model.pkl", "models/model-1/metrics.json"],
+    )
+
+
+_CURL_LINE = 'curl -o "model.pkl" "https://signed.example/models/model-1/model.pkl"'
+
+
+async def test_download_package_keeps_entries_until_serialized(handler, package, monkeypatch):
+    """Test entries stay ArtifactEntry records and serialize with or without orjson."""
+    entry = package["artifacts"]["model_file"][0]
+    assert isinstance(entry, ArtifactEntry)
+
+    with_orjson = artifact_handler_module._dumps_indented(package["artifacts"])
+    monkeypatch.setattr(artifact_handler_module, "orjson", None)
+    without_orjson = artifact_handler_module._dumps_indented(package["artifacts"])
+
+    assert json.loads(with_orjson) == json.loads(without_orjson)
+    assert json.loads(with_orjson)["model_file"][0] == entry.to_dict()
+
+
+@pytest.mark.parametrize("as_json", [False, True])
+async def test_curl_example_accepts_entries_and_dicts(handler, package, as_json):
+    """Test the curl example works for fresh packages and ones rebuilt from JSON."""
+    if as_json:
+        package = json.loads(json.dumps(package, default=artifact_handler_module._to_json))
+
+    instructions = await handler.generate_download_instructions("model-1", package)
+
+    assert _CURL_LINE in instructions["code_examples"]["curl"]
+
+
+class FakeBucket:
+    """Bucket whose downloads write the blob name, fail, or wait on an event."""
+
+    def __init__(self, release):
+        self.release = release
+
+    def blob(self, blob_name):
+        bucket = self
+
+        class FakeBlob:
+            def download_to_filename(self, filename):
+                if "broken" in blob_name:
+                    raise OSError("download failed")
+                if "slow" in blob_name:
+                    bucket.release.wait(5)
+                with open(filename, "w") as f:
+                    f.write(blob_name)
+
+        return FakeBlob()
+
+
+@pytest.fixture
+def release(monkeypatch):
+    """Event that lets slow fake downloads finish."""
+    release = threading.Event()
+    fake_client = SimpleNamespace(bucket=lambda name: FakeBucket(release))
+    monkeypatch.setattr(artifact_handler_module, "get_gcs_client", lambda: fake_client)
+    yield release
+    release.set()
+
+
+async def test_batch_download_preserves_paths(handler, release, tmp_path):
+    """Test blobs land under their own paths, in request order."""
+    paths = await handler.batch_download_blobs(["a/model.pkl", "b/metrics.json"], str(tmp_path))
+
+    assert paths == [str(tmp_path / "a/model.pkl"), str(tmp_path / "b/metrics.json")]
+    assert (tmp_path / "b/metrics.json").read_text() == "b/metrics.json"
+
+
+async def test_batch_download_failure_does_not_wait_for_others(handler, release, tmp_path):
+    """Test a failed download raises while another download is still running."""
+    with pytest.raises(ExceptionGroup):
+        await asyncio.wait_for(
+            handler.batch_download_blobs(["slow/model.pkl", "broken/metrics.json"], str(tmp_path)),
+            timeout=2,
+        )
+
+    assert not release.is_set()
@@ -0,0 +1,60 @@
+"""
+Tests for deployment artifact listing reuse.
+"""
+import pytest
+from app.services.cloud import deployment as deployment_module
+from app.services.cloud.deployment import ModelDeploymentService, _list_artifact_blobs
+
+
+@pytest.fixture
+def listings(monkeypatch):
+    """Fake GCS listings by prefix, recording each list call."""
+    listings = {"calls": 0}
+
+    async def fake_list_blobs(prefix, bucket_name):
+        listings["calls"] += 1
+        return list(listings.get(prefix, []))
+
+    monkeypatch.setattr(deployment_module, "list_blobs", fake_list_blobs)
+    monkeypatch.setattr(deployment_module, "_listing_cache", type(deployment_module._listing_cache)())
+    return listings
+
+
+async def test_listing_reused_within_ttl(listings):
+    """Test a second listing of the same prefix skips the list call."""
+    listings["models/m-1"] = ["models/m-1/model.pkl"]
+
+    first = await _list_artifact_blobs("bucket", "models/m-1")
+    second = await _list_artifact_blobs("bucket", "models/m-1")
+
+    assert first == second == ["models/m-1/model.pkl"]
+    assert listings["calls"] == 1
+
+
+async def test_empty_listing_not_cached(listings):
+    """Test artifacts that land after an empty listing are seen on the next poll."""
+    assert await _list_artifact_blobs("bucket", "models/m-1") == []
+
+    listings["models/m-1"] = ["models/m-1/model.pkl"]
+
+    assert await _list_artifact_blobs("bucket", "models/m-1") == ["models/m-1/model.pkl"]
+
+
+async def test_mutating_a_listing_leaves_cache_intact(listings):
+    """Test callers get their own list rather than the cached one."""
+    listings["models/m-1"] = ["models/m-1/model.pkl"]
+
+    (await _list_artifact_blobs("bucket", "models/m-1")).clear()
+
+    assert await _list_artifact_blobs("bucket", "models/m-1") == ["models/m-1/model.pkl"]
+
+
+async def test_invalidate_model_drops_listing(listings):
+    """Test invalidating a model forces its artifacts to be listed again."""
+    listings["models/m-1"] = ["models/m-1/model.pkl"]
+    await _list_artifact_blobs("bucket", "models/m-1")
+
+    ModelDeploymentService().invalidate_model("m-1", "gs://bucket/models/m-1")
+    await _list_artifact_blobs("bucket", "models/m-1")
+
+    assert listings["calls"] == 2
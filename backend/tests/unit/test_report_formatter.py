@@ -0,0 +1,93 @@
+"""
+Tests for evaluation report formatting.
+"""
+import json
+
+import numpy as np
+import pytest
+from app.services.agent import report_formatter as report_formatter_module
+from app.services.agent.baseline_calculator import BaselineMetrics
+from app.services.agent.evaluation_report import EvaluationReportGenerator
+from app.services.agent.evaluator import EvaluationDecision, EvaluationResult
+from app.services.agent.report_formatter import JSONReportFormatter, MarkdownReportFormatter
+
+
+@pytest.fixture
+def summary():
+    """JSON summary holding numpy values, as built from evaluation metrics."""
+    return {
+        "decision": "accept",
+        "all_metrics": {"roc_auc": np.float64(0.91), "log_loss": np.float32(0.25)},
+        "confusion": np.array([[5, 1], [2, 7]]),
+    }
+
+
+def test_serialize_matches_stdlib_fallback(summary, monkeypatch):
+    """Test orjson and json fallbacks produce the same indented document."""
+    with_orjson = JSONReportFormatter.serialize(summary)
+    monkeypatch.setattr(report_formatter_module, "orjson", None)
+    without_orjson = JSONReportFormatter.serialize(summary)
+
+    assert json.loads(with_orjson) == json.loads(without_orjson)
+    assert with_orjson.startswith(b'{\n  "decision"')
+
+
+class FakeStorageClient:
+    """Storage client recording uploaded content by path."""
+
+    bucket_name = "bucket"
+
+    def __init__(self):
+        self.uploads = {}
+
+    async def upload_text(self, path, content):
+        self.uploads[path] = content
+
+    async def upload_bytes(self, path, content):
+        self.uploads[path] = content
+
+
+async def test_stored_summary_is_serialized_json(summary):
+    """Test the stored summary is the serialized JSON document."""
+    storage = FakeStorageClient()
+
+    await EvaluationReportGenerator(storage)._store_report("ds-1", "# md", "<html>", summary, {})
+
+    (stored,) = [content for path, content in storage.uploads.items() if path.endswith("summary.json")]
+    assert stored == JSONReportFormatter.serialize(summary)
+
+
+def _baseline_result(metrics, baselines):
+    return EvaluationResult(
+        decision=EvaluationDecision.ACCEPT,
+        primary_metric_value=0.0,
+        primary_metric_name="rmse",
+        all_metrics=metrics,
+        baseline_metrics={
+            name: BaselineMetrics(metric_name=name, baseline_value=value, description="")
+            for name, value in baselines.items()
+        },
+        threshold_checks={},
+        sanity_checks={},
+        reasoning="",
+    )
+
+
+def test_baseline_comparison_rows():
+    """Test improvements are signed by whether lower or higher is better."""
+    result = _baseline_result({"rmse": 2.0, "r2": 0.6}, {"rmse": 4.0, "r2": 0.5})
+
+    rows = list(MarkdownReportFormatter._format_baseline_comparison(result))
+
+    assert "| rmse | 2.0000 | 4.0000 | +50.0% |" in rows
+    assert "| r2 | 0.6000 | 0.5000 | +20.0% |" in rows
+
+
+def test_baseline_comparison_zero_error_baseline():
+    """Test a zero baseline for an error metric renders instead of raising."""
+    result = _baseline_result({"rmse": 1.5, "mae": 0.0}, {"rmse": 0.0, "mae": 0.0})
+
+    rows = list(MarkdownReportFormatter._format_baseline_comparison(result))
+
+    assert "| rmse | 1.5000 | 0.0000 | -inf% |" in rows
+    assert "| mae | 0.0000 | 0.0000 | +nan% |" in rows
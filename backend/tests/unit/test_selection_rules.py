@@ -0,0 +1,72 @@
+"""
+Tests for rule-based model selection.
+"""
+import json
+
+import pytest
+from app.services.agent.model_types import DatasetProfile
+from app.services.agent.selection_rules import ModelSelectionRules
+from app.services.agent.types import DataType, ProblemType
+
+
+def _profile():
+    return DatasetProfile(num_samples=2000, num_features=12)
+
+
+def test_fallback_recommendations_share_read_only_hyperparameters():
+    """Test the shared empty hyperparameters of AutoML fallbacks cannot be changed."""
+    first = ModelSelectionRules._create_automl_recommendation(
+        ProblemType.CLUSTERING, DataType.MULTIMODAL, _profile()
+    )
+    second = ModelSelectionRules._create_automl_recommendation(
+        ProblemType.CLUSTERING, DataType.MULTIMODAL, _profile()
+    )
+
+    with pytest.raises(TypeError):
+        first.hyperparameters.model_specific["max_depth"] = 3
+    with pytest.raises(TypeError):
+        first.hyperparameters.search_space["max_depth"] = [3, 6]
+
+    assert second.hyperparameters.model_specific == {}
+    assert second.to_dict()["hyperparameters"]["search_space"] == {}
+
+
+def test_cached_selection_is_read_only():
+    """Test cached results cannot be changed through a returned recommendation."""
+    args = (ProblemType.CLASSIFICATION, DataType.TABULAR, _profile())
+
+    first = ModelSelectionRules.select_model(*args, domain="retail", complexity_score=0.5)
+    alternatives = list(first.alternatives)
+    with pytest.raises(TypeError):
+        first.hyperparameters.model_specific["max_depth"] = 99
+    first.alternatives.append(first)
+
+    second = ModelSelectionRules.select_model(*args, domain="retail", complexity_score=0.5)
+
+    assert second.hyperparameters is first.hyperparameters
+    assert second.alternatives == alternatives
+
+
+def test_cached_selection_serializes_to_json():
+    """Test read-only hyperparameters still serialize as plain dictionaries."""
+    profile = DatasetProfile(num_samples=500, num_features=5, dimensionality_ratio=0.01)
+    recommendation = ModelSelectionRules.select_model(
+        ProblemType.CLASSIFICATION, DataType.TABULAR, profile,
+        domain="retail", complexity_score=0.1, user_preferences={"interpretability": True},
+    )
+
+    as_dict = recommendation.to_dict()
+
+    assert as_dict["alternatives"]
+    json.dumps(as_dict)
+
+
+def test_selection_cache_ignores_domain():
+    """Test the domain, which the rules never read, does not split the cache."""
+    args = (ProblemType.REGRESSION, DataType.TABULAR, _profile())
+    ModelSelectionRules.select_model(*args, domain="retail", complexity_score=0.4)
+    hits = ModelSelectionRules._select_model_cached.cache_info().hits
+
+    ModelSelectionRules.select_model(*args, domain="finance", complexity_score=0.4)
+
+    assert ModelSelectionRules._select_model_cached.cache_info().hits == hits + 1
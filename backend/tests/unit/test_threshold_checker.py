@@ -0,0 +1,183 @@
+"""
+Tests for threshold and sanity checks.
+"""
+import numpy as np
+import pytest
+from app.services.agent.baseline_calculator import BaselineMetrics
+from app.services.agent.threshold_checker import (
+    METRIC_IDX,
+    METRIC_NAMES,
+    REGRESSION_BATCH_CHECKS,
+    REGRESSION_BATCH_COLUMNS,
+    SanityChecker,
+    ThresholdChecker,
+)
+
+
+@pytest.fixture
+def baseline():
+    """Baseline metrics fixture."""
+    return {
+        "accuracy": BaselineMetrics(
+            metric_name="accuracy",
+            baseline_value=0.6,
+            description="Majority class baseline",
+        ),
+        "rmse": BaselineMetrics(
+            metric_name="rmse",
+            baseline_value=10.0,
+            description="Mean predictor baseline",
+        ),
+    }
+
+
+def test_static_thresholds():
+    """Test numeric thresholds for higher- and lower-is-better metrics."""
+    checks = ThresholdChecker.check_thresholds(
+        metrics={"accuracy": 0.8, "rmse": 4.0},
+        thresholds={"accuracy": 0.75, "rmse": 5.0},
+        baseline={},
+    )
+
+    assert checks == {"accuracy": True, "rmse": True}
+
+
+def test_baseline_relative_thresholds(baseline):
+    """Test thresholds expressed relative to the baseline."""
+    checks = ThresholdChecker.check_thresholds(
+        metrics={"accuracy": 0.65, "rmse": 9.0},
+        thresholds={"accuracy": "baseline * 1.1", "rmse": "baseline * 0.95"},
+        baseline=baseline,
+    )
+
+    # accuracy threshold resolves to 0.66, rmse threshold to 9.5
+    assert checks == {"accuracy": False, "rmse": True}
+
+
+def test_check_thresholds_batch_matches_scalar():
+    """Test batched threshold checks agree with the dict-based path."""
+    rng = np.random.default_rng(0)
+    metrics_matrix = rng.uniform(0.0, 2.0, size=(50, len(METRIC_NAMES)))
+    thresholds = np.full(len(METRIC_NAMES), 1.0)
+
+    batch = ThresholdChecker.check_thresholds_batch(metrics_matrix, thresholds)
+
+    assert batch.shape == metrics_matrix.shape
+    for row, expected in zip(metrics_matrix, batch):
+        checks = ThresholdChecker.check_thresholds(
+            metrics=dict(zip(METRIC_NAMES, row)),
+            thresholds=dict.fromkeys(METRIC_NAMES, 1.0),
+            baseline={},
+        )
+        assert [checks[name] for name in METRIC_NAMES] == expected.tolist()
+
+
+def test_check_thresholds_batch_lower_is_better():
+    """Test error metrics pass when at or below the threshold."""
+    metrics_matrix = np.ones((2, len(METRIC_NAMES)))
+    metrics_matrix[1, METRIC_IDX["rmse"]] = 2.0
+
+    batch = ThresholdChecker.check_thresholds_batch(metrics_matrix, np.ones(len(METRIC_NAMES)))
+
+    assert batch[0].all()
+    assert not batch[1, METRIC_IDX["rmse"]]
+
+
+def test_preparse_thresholds(baseline):
+    """Test thresholds are split into static values and baseline resolvers."""
+    static, relative = ThresholdChecker.preparse_thresholds(
+        {"accuracy": "baseline * 1.1", "f1": 0.6, "rmse": "baseline * 0.95"}
+    )
+
+    assert static == {"f1": 0.6}
+    assert set(relative) == {"accuracy", "rmse"}
+    assert relative["rmse"](10.0) == pytest.approx(9.5)
+
+    checks = ThresholdChecker.check_preparsed_thresholds(
+        {"accuracy": 0.7, "f1": 0.5, "rmse": 9.0}, static, relative, baseline
+    )
+    assert checks == {"f1": False, "accuracy": True, "rmse": True}
+
+
+def test_mixed_thresholds_keep_configured_order(baseline):
+    """Test check_thresholds reports results in threshold order."""
+    checks = ThresholdChecker.check_thresholds(
+        metrics={"accuracy": 0.7, "f1": 0.5},
+        thresholds={"accuracy": "baseline * 1.1", "f1": 0.6},
+        baseline=baseline,
+    )
+
+    assert list(checks) == ["accuracy", "f1"]
+
+
+@pytest.mark.parametrize(
+    "expr, expected",
+    [
+        ("baseline * 1.5", 15.0),
+        ("baseline + 2", 12.0),
+        ("baseline - .5", 9.5),
+        ("baseline / 4", 2.5),
+        ("baseline * 0.9 + 1", 10.0),
+    ],
+)
+def test_resolve_baseline_threshold(baseline, expr, expected):
+    """Test resolving baseline expressions, including compound ones."""
+    value = ThresholdChecker._resolve_baseline_threshold(expr, "rmse", baseline)
+
+    assert value == pytest.approx(expected)
+
+
+def test_resolve_baseline_threshold_without_baseline():
+    """Test that a missing baseline resolves to zero."""
+    assert ThresholdChecker._resolve_baseline_threshold("baseline * 2", "f1", {}) == 0.0
+
+
+def test_baseline_expression_has_no_builtins(baseline):
+    """Test that threshold expressions cannot reach Python builtins."""
+    with pytest.raises(NameError):
+        ThresholdChecker._resolve_baseline_threshold(
+            "__import__('os').getcwd() or baseline", "rmse", baseline
+        )
+
+
+def test_classification_sanity_checks_imbalanced():
+    """Test stricter sanity checks on imbalanced labels."""
+    y_true = np.array([0] * 90 + [1] * 10)
+    checks = SanityChecker._classification_sanity_checks(
+        {"accuracy": 0.9, "f1": 0.5, "precision": 0.4, "recall": 0.2}, y_true
+    )
+
+    assert checks == {
+        "f1_reasonable": True,
+        "precision_reasonable": True,
+        "recall_reasonable": False,
+        "better_than_random": True,
+    }
+
+
+def test_classification_sanity_checks_balanced_multiclass():
+    """Test sanity checks on balanced multiclass labels."""
+    y_true = np.array(["a", "b", "c"] * 20)
+    checks = SanityChecker._classification_sanity_checks({"accuracy": 0.35, "f1": 0.3}, y_true)
+
+    assert checks == {"f1_reasonable": True, "better_than_random": False}
+
+
+def test_regression_sanity_checks_batch_matches_scalar():
+    """Test the batched regression checks agree with the per-model checks."""
+    rows = np.array([
+        [0.8, 0.01, 1.0, 2.0, 3.0],
+        [-0.2, 0.5, 1.0, 1.0, 3.0],
+        [0.5, 0.0, 1.0, 0.0, 0.0],
+    ])
+    batch = SanityChecker.regression_sanity_checks_batch(rows)
+
+    assert batch.shape == (3, len(REGRESSION_BATCH_CHECKS))
+    for row, result in zip(rows, batch):
+        scalar = SanityChecker._regression_sanity_checks(dict(zip(REGRESSION_BATCH_COLUMNS, row)))
+        checks = dict(zip(REGRESSION_BATCH_CHECKS, result))
+        assert checks["r2_positive"] == scalar["r2_positive"]
+        assert checks["residuals_centered"] == scalar["residuals_centered"]
+        assert checks["rmse_positive"] == ("mae_rmse_ratio_reasonable" in scalar)
+        if checks["rmse_positive"]:
+            assert checks["mae_rmse_ratio_reasonable"] == scalar["mae_rmse_ratio_reasonable"]
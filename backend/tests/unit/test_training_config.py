@@ -0,0 +1,15 @@
+"""
+Tests for training configuration serialization.
+"""
+from app.services.agent.training_config import ModelConfig
+
+
+def test_model_config_to_dict_returns_new_dict():
+    """Test editing one serialized config does not affect the next."""
+    config = ModelConfig(architecture="xgboost", vertex_ai_type="custom")
+
+    first = config.to_dict()
+    first["architecture"] = "automl"
+
+    assert config.to_dict()["architecture"] == "xgboost"
+    assert config == ModelConfig(architecture="xgboost", vertex_ai_type="custom")
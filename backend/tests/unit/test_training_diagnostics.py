@@ -0,0 +1,30 @@
+"""
+Tests for training defaults derived from the problem analysis.
+"""
+from types import SimpleNamespace
+
+import pytest
+from app.services.agent.training_diagnostics import TrainingDiagnostics
+from app.services.agent.types import ProblemType
+
+
+@pytest.mark.parametrize("problem_type", [ProblemType.REGRESSION, "regression"])
+def test_default_objective_accepts_raw_problem_types(problem_type):
+    """Test string problem types pick the same objective as enum members."""
+    analysis = SimpleNamespace(problem_type=problem_type, num_classes=None)
+
+    assert TrainingDiagnostics.get_default_objective(analysis) == "minimize-rmse"
+
+
+def test_default_objective_multiclass():
+    """Test multiclass classification optimizes area under the PR curve."""
+    analysis = SimpleNamespace(problem_type="classification", num_classes=3)
+
+    assert TrainingDiagnostics.get_default_objective(analysis) == "maximize-au-prc"
+
+
+def test_default_objective_unknown_problem_type():
+    """Test unrecognized problem types fall back to the default objective."""
+    analysis = SimpleNamespace(problem_type="ranking", num_classes=None)
+
+    assert TrainingDiagnostics.get_default_objective(analysis) == "maximize-au-roc"
@@ -0,0 +1,144 @@
+"""
+Tests for training error tracking.
+"""
+import json
+import logging
+import threading
+
+import pytest
+from app.services.agent import training_logger as training_logger_module
+from app.services.agent.training_logger import TrainingLogger
+
+
+@pytest.fixture
+def training_logger():
+    """Training logger with a small error history."""
+    return TrainingLogger(max_errors=3)
+
+
+def test_error_summary_counts_by_type(training_logger):
+    """Test error summary counts errors by type."""
+    training_logger.log_schema_error("ds-1", "bad header")
+    training_logger.log_oom_error("job-1", "ds-1", "xgboost")
+    training_logger.log_schema_error("ds-2", "bad delimiter")
+
+    summary = training_logger.get_error_summary()
+
+    assert summary["total_errors"] == 3
+    assert summary["error_types"] == {"SCHEMA_ERROR": 2, "OUT_OF_MEMORY": 1}
+
+
+def test_error_summary_tracks_evictions(training_logger):
+    """Test evicted errors are no longer counted."""
+    training_logger.log_oom_error("job-1", "ds-1", "xgboost")
+    for i in range(3):
+        training_logger.log_schema_error(f"ds-{i}", "bad header")
+
+    summary = training_logger.get_error_summary()
+
+    assert summary["total_errors"] == 3
+    assert summary["error_types"] == {"SCHEMA_ERROR": 3}
+
+
+def test_error_filters_follow_evictions(training_logger):
+    """Test dataset and type filters only return errors still in history."""
+    training_logger.log_oom_error("job-1", "ds-1", "xgboost")
+    training_logger.log_schema_error("ds-1", "bad header")
+    training_logger.log_schema_error("ds-2", "bad header")
+    training_logger.log_schema_error("ds-1", "bad delimiter")
+
+    ds1_errors = training_logger.get_errors_for_dataset("ds-1")
+    assert [e.error_type for e in ds1_errors] == ["SCHEMA_ERROR", "SCHEMA_ERROR"]
+    assert training_logger.get_errors_by_type("OUT_OF_MEMORY") == []
+    assert len(training_logger.get_errors_by_type("SCHEMA_ERROR")) == 3
+    assert training_logger.get_errors_for_dataset("ds-3") == []
+
+
+def test_error_filters_limit_returns_most_recent(training_logger):
+    """Test limited filters return the newest matching errors in order."""
+    for detail in ("first", "second", "third"):
+        training_logger.log_schema_error("ds-1", detail)
+
+    latest = training_logger.get_errors_for_dataset("ds-1", limit=2)
+
+    assert [e.context["error_details"] for e in latest] == ["second", "third"]
+    assert len(training_logger.get_errors_by_type("SCHEMA_ERROR", limit=1)) == 1
+
+
+def test_clear_error_history(training_logger):
+    """Test clearing history resets the summary."""
+    training_logger.log_schema_error("ds-1", "bad header")
+    training_logger.clear_error_history()
+
+    assert training_logger.get_error_summary()["error_types"] == {}
+
+
+def test_events_dropped_when_queue_full(training_logger, monkeypatch):
+    """Test a full event queue drops events but still records the error."""
+    monkeypatch.setattr(training_logger_module, "_MAX_PENDING_EVENTS", 0)
+
+    training_logger.log_schema_error("ds-1", "bad header")
+
+    assert training_logger.dropped_events == 1
+    assert len(training_logger.get_errors_for_dataset("ds-1")) == 1
+
+
+def test_events_render_through_stdlib_logger(training_logger, caplog):
+    """Test training events are rendered as JSON by the logger's own pipeline."""
+    with caplog.at_level("INFO", logger=training_logger_module.__name__):
+        training_logger.log_schema_error("ds-1", "bad header")
+        assert training_logger.flush(timeout=5)
+
+    event = json.loads(caplog.records[-1].getMessage())
+    assert event["event"] == "schema_error"
+    assert event["severity"] == "ERROR"
+
+
+def test_event_values_snapshot_at_enqueue(training_logger, caplog):
+    """Test mutating a logged config afterwards does not change the event."""
+    config = {"learning_rate": 0.1}
+    with caplog.at_level("INFO", logger=training_logger_module.__name__):
+        training_logger.log_training_start("ds-1", "xgboost", config)
+        config["learning_rate"] = 0.5
+        assert training_logger.flush(timeout=5)
+
+    event = json.loads(caplog.records[-1].getMessage())
+    assert event["config"] == {"learning_rate": 0.1}
+
+
+def test_sink_failures_are_counted(training_logger, monkeypatch, caplog):
+    """Test a failing sink is counted and reported instead of silently dropped."""
+    def failing_sink(event, **kwargs):
+        raise RuntimeError("sink down")
+
+    monkeypatch.setattr(training_logger.logger, "error", failing_sink)
+
+    with caplog.at_level("WARNING", logger=training_logger_module.__name__):
+        training_logger.log_schema_error("ds-1", "bad header")
+        assert training_logger.flush(timeout=5)
+
+    assert training_logger.failed_events == 1
+    assert "schema_error" in caplog.records[-1].getMessage()
+
+
+def test_uncopyable_event_values_do_not_raise(training_logger):
+    """Test logging never fails in training code over values a deep copy rejects."""
+    context = {"lock": threading.Lock()}
+
+    training_logger.log_training_failure("job-1", "ds-1", "xgboost", "boom", "UNKNOWN", context)
+
+    assert training_logger.flush(timeout=5)
+
+
+def test_info_events_skipped_below_configured_level(training_logger):
+    """Test INFO events are not queued when the stdlib logger is above INFO."""
+    stdlib_logger = training_logger._stdlib_logger
+    previous_level = stdlib_logger.level
+    stdlib_logger.setLevel(logging.WARNING)
+    try:
+        training_logger.log_training_progress("job-1", "RUNNING", 50.0)
+        training_logger.log_training_success("job-1", "ds-1", "xgboost", {"roc_auc": 0.9}, 12.0)
+    finally:
+        stdlib_logger.setLevel(previous_level)
+
+    assert training_logger._emitter is None
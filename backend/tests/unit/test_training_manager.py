@@ -0,0 +1,136 @@
+"""
+Tests for training job outcome handling.
+"""
+from types import SimpleNamespace
+
+import pytest
+from app.services.agent import training_manager as training_manager_module
+from app.services.agent.training_config import ModelConfig, TrainingState
+from app.services.agent.training_manager import TrainingManager
+from app.services.agent.types import DataType, ProblemAnalysis, ProblemType
+from app.services.cloud.vertex_jobs import VertexJobManager
+
+
+class FakeVertexClient:
+    """Vertex client whose jobs finish immediately in a fixed state."""
+
+    def __init__(self, final_state, error=None):
+        self.final_state = final_state
+        self.error = error
+
+    def _job_info(self, training_type):
+        return {
+            "job_id": "job-1",
+            "resource_name": "projects/p/locations/l/trainingPipelines/job-1",
+            "training_type": training_type,
+            "model_resource_name": "projects/p/locations/l/models/m-1",
+        }
+
+    async def create_automl_tabular_training_job(self, **kwargs):
+        return self._job_info("automl_tabular")
+
+    async def create_custom_training_job(self, **kwargs):
+        return self._job_info("custom")
+
+    async def wait_for_job_completion(self, job_resource_name, timeout_seconds):
+        status = {"job_id": "job-1", "resource_name": job_resource_name, "state": self.final_state}
+        if self.error:
+            status["error"] = {"message": self.error}
+        return status
+
+    async def get_model_evaluation(self, model_resource_name):
+        return {"metrics": {"auRoc": 0.91, "logLoss": 0.3}}
+
+
+class FakeArtifactManager:
+    """Artifact manager that records nothing and returns fixed URIs."""
+
+    def __init__(self, bucket_name):
+        self.bucket_name = bucket_name
+
+    async def store_artifacts(self, dataset_id, job_info, config, preprocessing_metadata):
+        return {"model_uri": "gs://b/model", "prep_uri": "gs://b/prep"}
+
+    async def generate_training_report(self, dataset_id, config, metrics, duration, job_info):
+        return "gs://b/report.md"
+
+
+def _train(manager, vertex_ai_type):
+    analysis = ProblemAnalysis(
+        problem_type=ProblemType.CLASSIFICATION,
+        data_type=DataType.TABULAR,
+        domain="general",
+        suggested_metrics=["roc_auc"],
+        complexity_score=0.5,
+        reasoning="",
+        confidence=0.9,
+        is_labeled=True,
+    )
+    return manager.train_model(
+        config=ModelConfig(architecture="xgboost", vertex_ai_type=vertex_ai_type),
+        dataset_id="ds-1",
+        training_data_uri="gs://b/train.pkl",
+        validation_data_uri="gs://b/val.pkl",
+        test_data_uri="gs://b/test.pkl",
+        target_column="label",
+        problem_analysis=analysis,
+        preprocessing_metadata={},
+    )
+
+
+@pytest.fixture(autouse=True)
+def fake_artifact_manager(monkeypatch):
+    """Keep artifact handling away from GCS."""
+    monkeypatch.setattr(training_manager_module, "TrainingArtifactManager", FakeArtifactManager)
+
+
+def _manager(final_state, error=None):
+    return TrainingManager(FakeVertexClient(final_state, error), storage_bucket="b")
+
+
+@pytest.mark.parametrize("vertex_ai_type,final_state", [
+    ("automl", "PIPELINE_STATE_SUCCEEDED"),
+    ("custom", "PIPELINE_STATE_SUCCEEDED"),
+    ("custom", "JOB_STATE_SUCCEEDED"),
+])
+async def test_succeeded_states_are_successful(vertex_ai_type, final_state):
+    """Test both job and pipeline success states produce a successful output."""
+    output = await _train(_manager(final_state), vertex_ai_type)
+
+    assert output.state == TrainingState.SUCCEEDED.value
+    assert output.metrics
+
+
+async def test_automl_success_uses_model_evaluation():
+    """Test a succeeded AutoML pipeline reads its model evaluation."""
+    output = await _train(_manager("PIPELINE_STATE_SUCCEEDED"), "automl")
+
+    assert output.metrics == {"roc_auc": 0.91, "log_loss": 0.3}
+
+
+@pytest.mark.parametrize("final_state", ["PIPELINE_STATE_FAILED", "JOB_STATE_FAILED"])
+async def test_failed_states_keep_error_message(final_state):
+    """Test both job and pipeline failures report the job's error."""
+    output = await _train(_manager(final_state, error="quota exceeded"), "automl")
+
+    assert output.state == TrainingState.FAILED.value
+    assert output.error_message == "quota exceeded"
+
+
+@pytest.mark.parametrize("state", ["PIPELINE_STATE_FAILED", "JOB_STATE_FAILED"])
+def test_job_status_attaches_error_for_failed_states(state):
+    """Test status dictionaries carry the error for job and pipeline failures."""
+    job = SimpleNamespace(
+        name="projects/p/locations/l/trainingPipelines/job-1",
+        state=SimpleNamespace(name=state),
+        display_name="job",
+        create_time=None,
+        start_time=None,
+        end_time=None,
+        update_time=None,
+        error="out of memory",
+    )
+
+    status = VertexJobManager._job_status(job.name, job)
+
+    assert status["error"] == {"message": "out of memory"}
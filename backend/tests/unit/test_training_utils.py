@@ -0,0 +1,55 @@
+"""
+Tests for preprocessing provenance hashing.
+"""
+import numpy as np
+import pytest
+from app.services.agent import training_utils as training_utils_module
+from app.services.agent.training_utils import generate_preprocessing_hash
+
+
+@pytest.fixture
+def metadata():
+    """Preprocessing metadata with values orjson cannot encode natively."""
+    return {
+        "categories": np.array(["a", None, 3], dtype=object),
+        "scale": np.float32(0.1),
+        "means": np.arange(6, dtype=np.float32).reshape(2, 3)[:, ::2],
+        "row_count": 2 ** 70,
+    }
+
+
+def test_hash_handles_numpy_values(metadata):
+    """Test object, non-contiguous and float32 values hash without error."""
+    digest = generate_preprocessing_hash(metadata)
+
+    assert len(digest) == 64
+    assert digest == generate_preprocessing_hash(dict(metadata))
+
+
+def test_hash_independent_of_orjson(metadata, monkeypatch):
+    """Test the json fallback produces the same digest as orjson."""
+    with_orjson = generate_preprocessing_hash(metadata)
+
+    monkeypatch.setattr(training_utils_module, "orjson", None)
+
+    assert generate_preprocessing_hash(metadata) == with_orjson
+
+
+def test_package_versions_skip_broken_native_installs(monkeypatch):
+    """Test a package whose native library fails to load is skipped, not fatal."""
+    real_import = training_utils_module.importlib.import_module
+
+    def import_module(name):
+        if name == "xgboost":
+            raise OSError("libomp.dylib not found")
+        return real_import(name)
+
+    monkeypatch.setattr(training_utils_module.importlib, "import_module", import_module)
+    training_utils_module._package_versions.cache_clear()
+    try:
+        versions = training_utils_module.get_package_versions()
+    finally:
+        training_utils_module._package_versions.cache_clear()
+
+    assert "xgboost" not in versions
+    assert versions["numpy"] == np.__version__
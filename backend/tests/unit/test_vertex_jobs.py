@@ -0,0 +1,92 @@
+"""
+Tests for batched Vertex AI job status polling.
+"""
+import asyncio
+
+import pytest
+from app.services.cloud import vertex_jobs as vertex_jobs_module
+from app.services.cloud.vertex_jobs import JobStatusPoller
+
+
+class FakeJobManager:
+    """Job manager whose jobs never report an update."""
+
+    async def list_job_statuses(self, job_resource_names, updated_since):
+        return {}
+
+
+def _job_name(i):
+    return f"projects/p/locations/l/customJobs/job-{i}"
+
+
+@pytest.fixture
+def poller():
+    return JobStatusPoller(FakeJobManager())
+
+
+async def _register(poller, count, start=0):
+    waits = [
+        asyncio.create_task(poller.wait(_job_name(i))) for i in range(start, start + count)
+    ]
+    await asyncio.sleep(0)
+    return waits
+
+
+async def _cancel(poller, waits):
+    for wait in waits:
+        wait.cancel()
+    await asyncio.gather(*waits, return_exceptions=True)
+    if poller._task is not None:
+        poller._task.cancel()
+        await asyncio.gather(poller._task, return_exceptions=True)
+
+
+async def test_registration_restarts_backoff_when_quiet(poller):
+    """Test a new job resets the poll schedule while few jobs are watched."""
+    waits = await _register(poller, 1)
+    poller._tick = 5
+
+    waits += await _register(poller, 1, start=1)
+
+    assert poller._tick == 0
+    await _cancel(poller, waits)
+
+
+async def test_registration_keeps_backoff_when_busy(poller):
+    """Test steady registrations do not pin a busy poller to its fastest rate."""
+    waits = await _register(poller, vertex_jobs_module._QUIET_JOB_COUNT)
+    poller._tick = 5
+
+    waits += await _register(poller, 1, start=vertex_jobs_module._QUIET_JOB_COUNT)
+
+    assert poller._tick == 5
+    await _cancel(poller, waits)
+
+
+class FakeJobServiceClient:
+    """Stand-in for the grpc-aio JobService stub."""
+
+    def __init__(self, client_options=None):
+        self.loop = asyncio.get_running_loop()
+
+
+def test_stubs_and_poller_are_per_event_loop(monkeypatch):
+    """Test a second asyncio.run gets stubs and a poller bound to its own loop."""
+    monkeypatch.setattr(
+        vertex_jobs_module.aiplatform_v1, "JobServiceAsyncClient", FakeJobServiceClient
+    )
+    manager = vertex_jobs_module.VertexJobManager("p", "l")
+
+    async def loop_objects():
+        stub, poller = manager.job_service, manager.poller
+        assert manager.job_service is stub
+        assert manager.poller is poller
+        assert stub.loop is asyncio.get_running_loop()
+        return stub, poller
+
+    first_stub, first_poller = asyncio.run(loop_objects())
+    second_stub, second_poller = asyncio.run(loop_objects())
+
+    assert second_stub is not first_stub
+    assert second_poller is not first_poller
+    assert len(manager._by_loop) == 1